@@ -0,0 +1,113 @@
+# Copyright (c) 2020-2024 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+#
+
+# Instruction and operand kind tables for the AMD_shader_trinary_minmax extended instruction set.
+# Operands are (kind, quantifier, name) tuples.
+
+Name = 'AMD_shader_trinary_minmax'
+Revision = 4
+
+Instructions = {
+    'FMin3AMD' : 1,
+    'UMin3AMD' : 2,
+    'SMin3AMD' : 3,
+    'FMax3AMD' : 4,
+    'UMax3AMD' : 5,
+    'SMax3AMD' : 6,
+    'FMid3AMD' : 7,
+    'UMid3AMD' : 8,
+    'SMid3AMD' : 9,
+}
+
+InstructionNames = {
+    1 : 'FMin3AMD',
+    2 : 'UMin3AMD',
+    3 : 'SMin3AMD',
+    4 : 'FMax3AMD',
+    5 : 'UMax3AMD',
+    6 : 'SMax3AMD',
+    7 : 'FMid3AMD',
+    8 : 'UMid3AMD',
+    9 : 'SMid3AMD',
+}
+
+InstructionOperands = {
+    1 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+        ('IdRef', None, "'z'"),
+    ),
+    2 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+        ('IdRef', None, "'z'"),
+    ),
+    3 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+        ('IdRef', None, "'z'"),
+    ),
+    4 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+        ('IdRef', None, "'z'"),
+    ),
+    5 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+        ('IdRef', None, "'z'"),
+    ),
+    6 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+        ('IdRef', None, "'z'"),
+    ),
+    7 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+        ('IdRef', None, "'z'"),
+    ),
+    8 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+        ('IdRef', None, "'z'"),
+    ),
+    9 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+        ('IdRef', None, "'z'"),
+    ),
+}
+
+OperandKindCategories = {
+}
+
+OperandKinds = {
+}
+
+OperandKindNames = {
+}
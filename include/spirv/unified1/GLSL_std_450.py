@@ -0,0 +1,492 @@
+# Copyright (c) 2014-2024 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and/or associated documentation files (the "Materials"),
+# to deal in the Materials without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Materials, and to permit persons to whom the
+# Materials are furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS KHRONOS
+# STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS SPECIFICATIONS AND
+# HEADER INFORMATION ARE LOCATED AT https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM,OUT OF OR IN CONNECTION WITH THE MATERIALS OR THE USE OR OTHER DEALINGS
+# IN THE MATERIALS.
+
+# Instruction and operand kind tables for the GLSL_std_450 extended instruction set.
+# Operands are (kind, quantifier, name) tuples.
+
+Name = 'GLSL_std_450'
+Version = 100
+Revision = 2
+
+Instructions = {
+    'Round' : 1,
+    'RoundEven' : 2,
+    'Trunc' : 3,
+    'FAbs' : 4,
+    'SAbs' : 5,
+    'FSign' : 6,
+    'SSign' : 7,
+    'Floor' : 8,
+    'Ceil' : 9,
+    'Fract' : 10,
+    'Radians' : 11,
+    'Degrees' : 12,
+    'Sin' : 13,
+    'Cos' : 14,
+    'Tan' : 15,
+    'Asin' : 16,
+    'Acos' : 17,
+    'Atan' : 18,
+    'Sinh' : 19,
+    'Cosh' : 20,
+    'Tanh' : 21,
+    'Asinh' : 22,
+    'Acosh' : 23,
+    'Atanh' : 24,
+    'Atan2' : 25,
+    'Pow' : 26,
+    'Exp' : 27,
+    'Log' : 28,
+    'Exp2' : 29,
+    'Log2' : 30,
+    'Sqrt' : 31,
+    'InverseSqrt' : 32,
+    'Determinant' : 33,
+    'MatrixInverse' : 34,
+    'Modf' : 35,
+    'ModfStruct' : 36,
+    'FMin' : 37,
+    'UMin' : 38,
+    'SMin' : 39,
+    'FMax' : 40,
+    'UMax' : 41,
+    'SMax' : 42,
+    'FClamp' : 43,
+    'UClamp' : 44,
+    'SClamp' : 45,
+    'FMix' : 46,
+    'IMix' : 47,
+    'Step' : 48,
+    'SmoothStep' : 49,
+    'Fma' : 50,
+    'Frexp' : 51,
+    'FrexpStruct' : 52,
+    'Ldexp' : 53,
+    'PackSnorm4x8' : 54,
+    'PackUnorm4x8' : 55,
+    'PackSnorm2x16' : 56,
+    'PackUnorm2x16' : 57,
+    'PackHalf2x16' : 58,
+    'PackDouble2x32' : 59,
+    'UnpackSnorm2x16' : 60,
+    'UnpackUnorm2x16' : 61,
+    'UnpackHalf2x16' : 62,
+    'UnpackSnorm4x8' : 63,
+    'UnpackUnorm4x8' : 64,
+    'UnpackDouble2x32' : 65,
+    'Length' : 66,
+    'Distance' : 67,
+    'Cross' : 68,
+    'Normalize' : 69,
+    'FaceForward' : 70,
+    'Reflect' : 71,
+    'Refract' : 72,
+    'FindILsb' : 73,
+    'FindSMsb' : 74,
+    'FindUMsb' : 75,
+    'InterpolateAtCentroid' : 76,
+    'InterpolateAtSample' : 77,
+    'InterpolateAtOffset' : 78,
+    'NMin' : 79,
+    'NMax' : 80,
+    'NClamp' : 81,
+}
+
+InstructionNames = {
+    1 : 'Round',
+    2 : 'RoundEven',
+    3 : 'Trunc',
+    4 : 'FAbs',
+    5 : 'SAbs',
+    6 : 'FSign',
+    7 : 'SSign',
+    8 : 'Floor',
+    9 : 'Ceil',
+    10 : 'Fract',
+    11 : 'Radians',
+    12 : 'Degrees',
+    13 : 'Sin',
+    14 : 'Cos',
+    15 : 'Tan',
+    16 : 'Asin',
+    17 : 'Acos',
+    18 : 'Atan',
+    19 : 'Sinh',
+    20 : 'Cosh',
+    21 : 'Tanh',
+    22 : 'Asinh',
+    23 : 'Acosh',
+    24 : 'Atanh',
+    25 : 'Atan2',
+    26 : 'Pow',
+    27 : 'Exp',
+    28 : 'Log',
+    29 : 'Exp2',
+    30 : 'Log2',
+    31 : 'Sqrt',
+    32 : 'InverseSqrt',
+    33 : 'Determinant',
+    34 : 'MatrixInverse',
+    35 : 'Modf',
+    36 : 'ModfStruct',
+    37 : 'FMin',
+    38 : 'UMin',
+    39 : 'SMin',
+    40 : 'FMax',
+    41 : 'UMax',
+    42 : 'SMax',
+    43 : 'FClamp',
+    44 : 'UClamp',
+    45 : 'SClamp',
+    46 : 'FMix',
+    47 : 'IMix',
+    48 : 'Step',
+    49 : 'SmoothStep',
+    50 : 'Fma',
+    51 : 'Frexp',
+    52 : 'FrexpStruct',
+    53 : 'Ldexp',
+    54 : 'PackSnorm4x8',
+    55 : 'PackUnorm4x8',
+    56 : 'PackSnorm2x16',
+    57 : 'PackUnorm2x16',
+    58 : 'PackHalf2x16',
+    59 : 'PackDouble2x32',
+    60 : 'UnpackSnorm2x16',
+    61 : 'UnpackUnorm2x16',
+    62 : 'UnpackHalf2x16',
+    63 : 'UnpackSnorm4x8',
+    64 : 'UnpackUnorm4x8',
+    65 : 'UnpackDouble2x32',
+    66 : 'Length',
+    67 : 'Distance',
+    68 : 'Cross',
+    69 : 'Normalize',
+    70 : 'FaceForward',
+    71 : 'Reflect',
+    72 : 'Refract',
+    73 : 'FindILsb',
+    74 : 'FindSMsb',
+    75 : 'FindUMsb',
+    76 : 'InterpolateAtCentroid',
+    77 : 'InterpolateAtSample',
+    78 : 'InterpolateAtOffset',
+    79 : 'NMin',
+    80 : 'NMax',
+    81 : 'NClamp',
+}
+
+InstructionOperands = {
+    1 : (
+        ('IdRef', None, "'x'"),
+    ),
+    2 : (
+        ('IdRef', None, "'x'"),
+    ),
+    3 : (
+        ('IdRef', None, "'x'"),
+    ),
+    4 : (
+        ('IdRef', None, "'x'"),
+    ),
+    5 : (
+        ('IdRef', None, "'x'"),
+    ),
+    6 : (
+        ('IdRef', None, "'x'"),
+    ),
+    7 : (
+        ('IdRef', None, "'x'"),
+    ),
+    8 : (
+        ('IdRef', None, "'x'"),
+    ),
+    9 : (
+        ('IdRef', None, "'x'"),
+    ),
+    10 : (
+        ('IdRef', None, "'x'"),
+    ),
+    11 : (
+        ('IdRef', None, "'degrees'"),
+    ),
+    12 : (
+        ('IdRef', None, "'radians'"),
+    ),
+    13 : (
+        ('IdRef', None, "'x'"),
+    ),
+    14 : (
+        ('IdRef', None, "'x'"),
+    ),
+    15 : (
+        ('IdRef', None, "'x'"),
+    ),
+    16 : (
+        ('IdRef', None, "'x'"),
+    ),
+    17 : (
+        ('IdRef', None, "'x'"),
+    ),
+    18 : (
+        ('IdRef', None, "'y_over_x'"),
+    ),
+    19 : (
+        ('IdRef', None, "'x'"),
+    ),
+    20 : (
+        ('IdRef', None, "'x'"),
+    ),
+    21 : (
+        ('IdRef', None, "'x'"),
+    ),
+    22 : (
+        ('IdRef', None, "'x'"),
+    ),
+    23 : (
+        ('IdRef', None, "'x'"),
+    ),
+    24 : (
+        ('IdRef', None, "'x'"),
+    ),
+    25 : (
+        ('IdRef', None, "'y'"),
+        ('IdRef', None, "'x'"),
+    ),
+    26 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    27 : (
+        ('IdRef', None, "'x'"),
+    ),
+    28 : (
+        ('IdRef', None, "'x'"),
+    ),
+    29 : (
+        ('IdRef', None, "'x'"),
+    ),
+    30 : (
+        ('IdRef', None, "'x'"),
+    ),
+    31 : (
+        ('IdRef', None, "'x'"),
+    ),
+    32 : (
+        ('IdRef', None, "'x'"),
+    ),
+    33 : (
+        ('IdRef', None, "'x'"),
+    ),
+    34 : (
+        ('IdRef', None, "'x'"),
+    ),
+    35 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'i'"),
+    ),
+    36 : (
+        ('IdRef', None, "'x'"),
+    ),
+    37 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    38 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    39 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    40 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    41 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    42 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    43 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'minVal'"),
+        ('IdRef', None, "'maxVal'"),
+    ),
+    44 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'minVal'"),
+        ('IdRef', None, "'maxVal'"),
+    ),
+    45 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'minVal'"),
+        ('IdRef', None, "'maxVal'"),
+    ),
+    46 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+        ('IdRef', None, "'a'"),
+    ),
+    47 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+        ('IdRef', None, "'a'"),
+    ),
+    48 : (
+        ('IdRef', None, "'edge'"),
+        ('IdRef', None, "'x'"),
+    ),
+    49 : (
+        ('IdRef', None, "'edge0'"),
+        ('IdRef', None, "'edge1'"),
+        ('IdRef', None, "'x'"),
+    ),
+    50 : (
+        ('IdRef', None, "'a'"),
+        ('IdRef', None, "'b'"),
+        ('IdRef', None, "'c'"),
+    ),
+    51 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'exp'"),
+    ),
+    52 : (
+        ('IdRef', None, "'x'"),
+    ),
+    53 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'exp'"),
+    ),
+    54 : (
+        ('IdRef', None, "'v'"),
+    ),
+    55 : (
+        ('IdRef', None, "'v'"),
+    ),
+    56 : (
+        ('IdRef', None, "'v'"),
+    ),
+    57 : (
+        ('IdRef', None, "'v'"),
+    ),
+    58 : (
+        ('IdRef', None, "'v'"),
+    ),
+    59 : (
+        ('IdRef', None, "'v'"),
+    ),
+    60 : (
+        ('IdRef', None, "'p'"),
+    ),
+    61 : (
+        ('IdRef', None, "'p'"),
+    ),
+    62 : (
+        ('IdRef', None, "'v'"),
+    ),
+    63 : (
+        ('IdRef', None, "'p'"),
+    ),
+    64 : (
+        ('IdRef', None, "'p'"),
+    ),
+    65 : (
+        ('IdRef', None, "'v'"),
+    ),
+    66 : (
+        ('IdRef', None, "'x'"),
+    ),
+    67 : (
+        ('IdRef', None, "'p0'"),
+        ('IdRef', None, "'p1'"),
+    ),
+    68 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    69 : (
+        ('IdRef', None, "'x'"),
+    ),
+    70 : (
+        ('IdRef', None, "'N'"),
+        ('IdRef', None, "'I'"),
+        ('IdRef', None, "'Nref'"),
+    ),
+    71 : (
+        ('IdRef', None, "'I'"),
+        ('IdRef', None, "'N'"),
+    ),
+    72 : (
+        ('IdRef', None, "'I'"),
+        ('IdRef', None, "'N'"),
+        ('IdRef', None, "'eta'"),
+    ),
+    73 : (
+        ('IdRef', None, "'Value'"),
+    ),
+    74 : (
+        ('IdRef', None, "'Value'"),
+    ),
+    75 : (
+        ('IdRef', None, "'Value'"),
+    ),
+    76 : (
+        ('IdRef', None, "'interpolant'"),
+    ),
+    77 : (
+        ('IdRef', None, "'interpolant'"),
+        ('IdRef', None, "'sample'"),
+    ),
+    78 : (
+        ('IdRef', None, "'interpolant'"),
+        ('IdRef', None, "'offset'"),
+    ),
+    79 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    80 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    81 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'minVal'"),
+        ('IdRef', None, "'maxVal'"),
+    ),
+}
+
+OperandKindCategories = {
+}
+
+OperandKinds = {
+}
+
+OperandKindNames = {
+}
@@ -0,0 +1,382 @@
+# Copyright (c) 2020-2024 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+#
+
+# Instruction and operand kind tables for the NonSemanticClspvReflection extended instruction set.
+# Operands are (kind, quantifier, name) tuples.
+
+Name = 'NonSemanticClspvReflection'
+Revision = 6
+
+Instructions = {
+    'Kernel' : 1,
+    'ArgumentInfo' : 2,
+    'ArgumentStorageBuffer' : 3,
+    'ArgumentUniform' : 4,
+    'ArgumentPodStorageBuffer' : 5,
+    'ArgumentPodUniform' : 6,
+    'ArgumentPodPushConstant' : 7,
+    'ArgumentSampledImage' : 8,
+    'ArgumentStorageImage' : 9,
+    'ArgumentSampler' : 10,
+    'ArgumentWorkgroup' : 11,
+    'SpecConstantWorkgroupSize' : 12,
+    'SpecConstantGlobalOffset' : 13,
+    'SpecConstantWorkDim' : 14,
+    'PushConstantGlobalOffset' : 15,
+    'PushConstantEnqueuedLocalSize' : 16,
+    'PushConstantGlobalSize' : 17,
+    'PushConstantRegionOffset' : 18,
+    'PushConstantNumWorkgroups' : 19,
+    'PushConstantRegionGroupOffset' : 20,
+    'ConstantDataStorageBuffer' : 21,
+    'ConstantDataUniform' : 22,
+    'LiteralSampler' : 23,
+    'PropertyRequiredWorkgroupSize' : 24,
+    'SpecConstantSubgroupMaxSize' : 25,
+    'ArgumentPointerPushConstant' : 26,
+    'ArgumentPointerUniform' : 27,
+    'ProgramScopeVariablesStorageBuffer' : 28,
+    'ProgramScopeVariablePointerRelocation' : 29,
+    'ImageArgumentInfoChannelOrderPushConstant' : 30,
+    'ImageArgumentInfoChannelDataTypePushConstant' : 31,
+    'ImageArgumentInfoChannelOrderUniform' : 32,
+    'ImageArgumentInfoChannelDataTypeUniform' : 33,
+    'ArgumentStorageTexelBuffer' : 34,
+    'ArgumentUniformTexelBuffer' : 35,
+    'ConstantDataPointerPushConstant' : 36,
+    'ProgramScopeVariablePointerPushConstant' : 37,
+    'PrintfInfo' : 38,
+    'PrintfBufferStorageBuffer' : 39,
+    'PrintfBufferPointerPushConstant' : 40,
+    'NormalizedSamplerMaskPushConstant' : 41,
+}
+
+InstructionNames = {
+    1 : 'Kernel',
+    2 : 'ArgumentInfo',
+    3 : 'ArgumentStorageBuffer',
+    4 : 'ArgumentUniform',
+    5 : 'ArgumentPodStorageBuffer',
+    6 : 'ArgumentPodUniform',
+    7 : 'ArgumentPodPushConstant',
+    8 : 'ArgumentSampledImage',
+    9 : 'ArgumentStorageImage',
+    10 : 'ArgumentSampler',
+    11 : 'ArgumentWorkgroup',
+    12 : 'SpecConstantWorkgroupSize',
+    13 : 'SpecConstantGlobalOffset',
+    14 : 'SpecConstantWorkDim',
+    15 : 'PushConstantGlobalOffset',
+    16 : 'PushConstantEnqueuedLocalSize',
+    17 : 'PushConstantGlobalSize',
+    18 : 'PushConstantRegionOffset',
+    19 : 'PushConstantNumWorkgroups',
+    20 : 'PushConstantRegionGroupOffset',
+    21 : 'ConstantDataStorageBuffer',
+    22 : 'ConstantDataUniform',
+    23 : 'LiteralSampler',
+    24 : 'PropertyRequiredWorkgroupSize',
+    25 : 'SpecConstantSubgroupMaxSize',
+    26 : 'ArgumentPointerPushConstant',
+    27 : 'ArgumentPointerUniform',
+    28 : 'ProgramScopeVariablesStorageBuffer',
+    29 : 'ProgramScopeVariablePointerRelocation',
+    30 : 'ImageArgumentInfoChannelOrderPushConstant',
+    31 : 'ImageArgumentInfoChannelDataTypePushConstant',
+    32 : 'ImageArgumentInfoChannelOrderUniform',
+    33 : 'ImageArgumentInfoChannelDataTypeUniform',
+    34 : 'ArgumentStorageTexelBuffer',
+    35 : 'ArgumentUniformTexelBuffer',
+    36 : 'ConstantDataPointerPushConstant',
+    37 : 'ProgramScopeVariablePointerPushConstant',
+    38 : 'PrintfInfo',
+    39 : 'PrintfBufferStorageBuffer',
+    40 : 'PrintfBufferPointerPushConstant',
+    41 : 'NormalizedSamplerMaskPushConstant',
+}
+
+InstructionOperands = {
+    1 : (
+        ('IdRef', None, 'Kernel'),
+        ('IdRef', None, 'Name'),
+        ('IdRef', '?', 'NumArguments'),
+        ('IdRef', '?', 'Flags'),
+        ('IdRef', '?', 'Attributes'),
+    ),
+    2 : (
+        ('IdRef', None, 'Name'),
+        ('IdRef', '?', 'Type Name'),
+        ('IdRef', '?', 'Address Qualifier'),
+        ('IdRef', '?', 'Access Qualifier'),
+        ('IdRef', '?', 'Type Qualifier'),
+    ),
+    3 : (
+        ('IdRef', None, 'Decl'),
+        ('IdRef', None, 'Ordinal'),
+        ('IdRef', None, 'DescriptorSet'),
+        ('IdRef', None, 'Binding'),
+        ('IdRef', '?', 'ArgInfo'),
+    ),
+    4 : (
+        ('IdRef', None, 'Decl'),
+        ('IdRef', None, 'Ordinal'),
+        ('IdRef', None, 'DescriptorSet'),
+        ('IdRef', None, 'Binding'),
+        ('IdRef', '?', 'ArgInfo'),
+    ),
+    5 : (
+        ('IdRef', None, 'Decl'),
+        ('IdRef', None, 'Ordinal'),
+        ('IdRef', None, 'DescriptorSet'),
+        ('IdRef', None, 'Binding'),
+        ('IdRef', None, 'Offset'),
+        ('IdRef', None, 'Size'),
+        ('IdRef', '?', 'ArgInfo'),
+    ),
+    6 : (
+        ('IdRef', None, 'Decl'),
+        ('IdRef', None, 'Ordinal'),
+        ('IdRef', None, 'DescriptorSet'),
+        ('IdRef', None, 'Binding'),
+        ('IdRef', None, 'Offset'),
+        ('IdRef', None, 'Size'),
+        ('IdRef', '?', 'ArgInfo'),
+    ),
+    7 : (
+        ('IdRef', None, 'Decl'),
+        ('IdRef', None, 'Ordinal'),
+        ('IdRef', None, 'Offset'),
+        ('IdRef', None, 'Size'),
+        ('IdRef', '?', 'ArgInfo'),
+    ),
+    8 : (
+        ('IdRef', None, 'Decl'),
+        ('IdRef', None, 'Ordinal'),
+        ('IdRef', None, 'DescriptorSet'),
+        ('IdRef', None, 'Binding'),
+        ('IdRef', '?', 'ArgInfo'),
+    ),
+    9 : (
+        ('IdRef', None, 'Decl'),
+        ('IdRef', None, 'Ordinal'),
+        ('IdRef', None, 'DescriptorSet'),
+        ('IdRef', None, 'Binding'),
+        ('IdRef', '?', 'ArgInfo'),
+    ),
+    10 : (
+        ('IdRef', None, 'Decl'),
+        ('IdRef', None, 'Ordinal'),
+        ('IdRef', None, 'DescriptorSet'),
+        ('IdRef', None, 'Binding'),
+        ('IdRef', '?', 'ArgInfo'),
+    ),
+    11 : (
+        ('IdRef', None, 'Decl'),
+        ('IdRef', None, 'Ordinal'),
+        ('IdRef', None, 'SpecId'),
+        ('IdRef', None, 'ElemSize'),
+        ('IdRef', '?', 'ArgInfo'),
+    ),
+    12 : (
+        ('IdRef', None, 'X'),
+        ('IdRef', None, 'Y'),
+        ('IdRef', None, 'Z'),
+    ),
+    13 : (
+        ('IdRef', None, 'X'),
+        ('IdRef', None, 'Y'),
+        ('IdRef', None, 'Z'),
+    ),
+    14 : (
+        ('IdRef', None, 'Dim'),
+    ),
+    15 : (
+        ('IdRef', None, 'Offset'),
+        ('IdRef', None, 'Size'),
+    ),
+    16 : (
+        ('IdRef', None, 'Offset'),
+        ('IdRef', None, 'Size'),
+    ),
+    17 : (
+        ('IdRef', None, 'Offset'),
+        ('IdRef', None, 'Size'),
+    ),
+    18 : (
+        ('IdRef', None, 'Offset'),
+        ('IdRef', None, 'Size'),
+    ),
+    19 : (
+        ('IdRef', None, 'Offset'),
+        ('IdRef', None, 'Size'),
+    ),
+    20 : (
+        ('IdRef', None, 'Offset'),
+        ('IdRef', None, 'Size'),
+    ),
+    21 : (
+        ('IdRef', None, 'DescriptorSet'),
+        ('IdRef', None, 'Binding'),
+        ('IdRef', None, 'Data'),
+    ),
+    22 : (
+        ('IdRef', None, 'DescriptorSet'),
+        ('IdRef', None, 'Binding'),
+        ('IdRef', None, 'Data'),
+    ),
+    23 : (
+        ('IdRef', None, 'DescriptorSet'),
+        ('IdRef', None, 'Binding'),
+        ('IdRef', None, 'Mask'),
+    ),
+    24 : (
+        ('IdRef', None, 'Kernel'),
+        ('IdRef', None, 'X'),
+        ('IdRef', None, 'Y'),
+        ('IdRef', None, 'Z'),
+    ),
+    25 : (
+        ('IdRef', None, 'Size'),
+    ),
+    26 : (
+        ('IdRef', None, 'Kernel'),
+        ('IdRef', None, 'Ordinal'),
+        ('IdRef', None, 'Offset'),
+        ('IdRef', None, 'Size'),
+        ('IdRef', '?', 'ArgInfo'),
+    ),
+    27 : (
+        ('IdRef', None, 'Kernel'),
+        ('IdRef', None, 'Ordinal'),
+        ('IdRef', None, 'DescriptorSet'),
+        ('IdRef', None, 'Binding'),
+        ('IdRef', None, 'Offset'),
+        ('IdRef', None, 'Size'),
+        ('IdRef', '?', 'ArgInfo'),
+    ),
+    28 : (
+        ('IdRef', None, 'DescriptorSet'),
+        ('IdRef', None, 'Binding'),
+        ('IdRef', None, 'Data'),
+    ),
+    29 : (
+        ('IdRef', None, 'ObjectOffset'),
+        ('IdRef', None, 'PointerOffset'),
+        ('IdRef', None, 'PointerSize'),
+    ),
+    30 : (
+        ('IdRef', None, 'Kernel'),
+        ('IdRef', None, 'Ordinal'),
+        ('IdRef', None, 'Offset'),
+        ('IdRef', None, 'Size'),
+    ),
+    31 : (
+        ('IdRef', None, 'Kernel'),
+        ('IdRef', None, 'Ordinal'),
+        ('IdRef', None, 'Offset'),
+        ('IdRef', None, 'Size'),
+    ),
+    32 : (
+        ('IdRef', None, 'Kernel'),
+        ('IdRef', None, 'Ordinal'),
+        ('IdRef', None, 'DescriptorSet'),
+        ('IdRef', None, 'Binding'),
+        ('IdRef', None, 'Offset'),
+        ('IdRef', None, 'Size'),
+    ),
+    33 : (
+        ('IdRef', None, 'Kernel'),
+        ('IdRef', None, 'Ordinal'),
+        ('IdRef', None, 'DescriptorSet'),
+        ('IdRef', None, 'Binding'),
+        ('IdRef', None, 'Offset'),
+        ('IdRef', None, 'Size'),
+    ),
+    34 : (
+        ('IdRef', None, 'Decl'),
+        ('IdRef', None, 'Ordinal'),
+        ('IdRef', None, 'DescriptorSet'),
+        ('IdRef', None, 'Binding'),
+        ('IdRef', '?', 'ArgInfo'),
+    ),
+    35 : (
+        ('IdRef', None, 'Decl'),
+        ('IdRef', None, 'Ordinal'),
+        ('IdRef', None, 'DescriptorSet'),
+        ('IdRef', None, 'Binding'),
+        ('IdRef', '?', 'ArgInfo'),
+    ),
+    36 : (
+        ('IdRef', None, 'Offset'),
+        ('IdRef', None, 'Size'),
+        ('IdRef', None, 'Data'),
+    ),
+    37 : (
+        ('IdRef', None, 'Offset'),
+        ('IdRef', None, 'Size'),
+        ('IdRef', None, 'Data'),
+    ),
+    38 : (
+        ('IdRef', None, 'PrintfID'),
+        ('IdRef', None, 'FormatString'),
+        ('IdRef', '*', 'ArgumentSizes'),
+    ),
+    39 : (
+        ('IdRef', None, 'DescriptorSet'),
+        ('IdRef', None, 'Binding'),
+        ('IdRef', None, 'BufferSize'),
+    ),
+    40 : (
+        ('IdRef', None, 'Offset'),
+        ('IdRef', None, 'Size'),
+        ('IdRef', None, 'BufferSize'),
+    ),
+    41 : (
+        ('IdRef', None, 'Kernel'),
+        ('IdRef', None, 'Ordinal'),
+        ('IdRef', None, 'Offset'),
+        ('IdRef', None, 'Size'),
+    ),
+}
+
+OperandKindCategories = {
+    'KernelPropertyFlags' : 'BitEnum',
+}
+
+OperandKinds = {
+    'KernelPropertyFlags' : {
+        'None' : 0x0,
+        'MayUsePrintf' : 0x1,
+    },
+}
+
+OperandKindNames = {
+    'KernelPropertyFlags' : {
+        0x0 : 'None',
+        0x1 : 'MayUsePrintf',
+    },
+}
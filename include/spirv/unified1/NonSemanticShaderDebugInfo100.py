@@ -0,0 +1,526 @@
+# Copyright (c) 2018-2024 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and/or associated documentation files (the "Materials"),
+# to deal in the Materials without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Materials, and to permit persons to whom the
+# Materials are furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS KHRONOS
+# STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS SPECIFICATIONS AND
+# HEADER INFORMATION ARE LOCATED AT https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM,OUT OF OR IN CONNECTION WITH THE MATERIALS OR THE USE OR OTHER DEALINGS
+# IN THE MATERIALS.
+
+# Instruction and operand kind tables for the NonSemanticShaderDebugInfo100 extended instruction set.
+# Operands are (kind, quantifier, name) tuples.
+
+Name = 'NonSemanticShaderDebugInfo100'
+Version = 100
+Revision = 6
+
+Instructions = {
+    'DebugInfoNone' : 0,
+    'DebugCompilationUnit' : 1,
+    'DebugTypeBasic' : 2,
+    'DebugTypePointer' : 3,
+    'DebugTypeQualifier' : 4,
+    'DebugTypeArray' : 5,
+    'DebugTypeVector' : 6,
+    'DebugTypedef' : 7,
+    'DebugTypeFunction' : 8,
+    'DebugTypeEnum' : 9,
+    'DebugTypeComposite' : 10,
+    'DebugTypeMember' : 11,
+    'DebugTypeInheritance' : 12,
+    'DebugTypePtrToMember' : 13,
+    'DebugTypeTemplate' : 14,
+    'DebugTypeTemplateParameter' : 15,
+    'DebugTypeTemplateTemplateParameter' : 16,
+    'DebugTypeTemplateParameterPack' : 17,
+    'DebugGlobalVariable' : 18,
+    'DebugFunctionDeclaration' : 19,
+    'DebugFunction' : 20,
+    'DebugLexicalBlock' : 21,
+    'DebugLexicalBlockDiscriminator' : 22,
+    'DebugScope' : 23,
+    'DebugNoScope' : 24,
+    'DebugInlinedAt' : 25,
+    'DebugLocalVariable' : 26,
+    'DebugInlinedVariable' : 27,
+    'DebugDeclare' : 28,
+    'DebugValue' : 29,
+    'DebugOperation' : 30,
+    'DebugExpression' : 31,
+    'DebugMacroDef' : 32,
+    'DebugMacroUndef' : 33,
+    'DebugImportedEntity' : 34,
+    'DebugSource' : 35,
+    'DebugFunctionDefinition' : 101,
+    'DebugSourceContinued' : 102,
+    'DebugLine' : 103,
+    'DebugNoLine' : 104,
+    'DebugBuildIdentifier' : 105,
+    'DebugStoragePath' : 106,
+    'DebugEntryPoint' : 107,
+    'DebugTypeMatrix' : 108,
+}
+
+InstructionNames = {
+    0 : 'DebugInfoNone',
+    1 : 'DebugCompilationUnit',
+    2 : 'DebugTypeBasic',
+    3 : 'DebugTypePointer',
+    4 : 'DebugTypeQualifier',
+    5 : 'DebugTypeArray',
+    6 : 'DebugTypeVector',
+    7 : 'DebugTypedef',
+    8 : 'DebugTypeFunction',
+    9 : 'DebugTypeEnum',
+    10 : 'DebugTypeComposite',
+    11 : 'DebugTypeMember',
+    12 : 'DebugTypeInheritance',
+    13 : 'DebugTypePtrToMember',
+    14 : 'DebugTypeTemplate',
+    15 : 'DebugTypeTemplateParameter',
+    16 : 'DebugTypeTemplateTemplateParameter',
+    17 : 'DebugTypeTemplateParameterPack',
+    18 : 'DebugGlobalVariable',
+    19 : 'DebugFunctionDeclaration',
+    20 : 'DebugFunction',
+    21 : 'DebugLexicalBlock',
+    22 : 'DebugLexicalBlockDiscriminator',
+    23 : 'DebugScope',
+    24 : 'DebugNoScope',
+    25 : 'DebugInlinedAt',
+    26 : 'DebugLocalVariable',
+    27 : 'DebugInlinedVariable',
+    28 : 'DebugDeclare',
+    29 : 'DebugValue',
+    30 : 'DebugOperation',
+    31 : 'DebugExpression',
+    32 : 'DebugMacroDef',
+    33 : 'DebugMacroUndef',
+    34 : 'DebugImportedEntity',
+    35 : 'DebugSource',
+    101 : 'DebugFunctionDefinition',
+    102 : 'DebugSourceContinued',
+    103 : 'DebugLine',
+    104 : 'DebugNoLine',
+    105 : 'DebugBuildIdentifier',
+    106 : 'DebugStoragePath',
+    107 : 'DebugEntryPoint',
+    108 : 'DebugTypeMatrix',
+}
+
+InstructionOperands = {
+    0 : (),
+    1 : (
+        ('IdRef', None, "'Version'"),
+        ('IdRef', None, "'DWARF Version'"),
+        ('IdRef', None, "'Source'"),
+        ('IdRef', None, "'Language'"),
+    ),
+    2 : (
+        ('IdRef', None, "'Name'"),
+        ('IdRef', None, "'Size'"),
+        ('IdRef', None, "'Encoding'"),
+        ('IdRef', None, "'Flags'"),
+    ),
+    3 : (
+        ('IdRef', None, "'Base Type'"),
+        ('IdRef', None, "'Storage Class'"),
+        ('IdRef', None, "'Flags'"),
+    ),
+    4 : (
+        ('IdRef', None, "'Base Type'"),
+        ('IdRef', None, "'Type Qualifier'"),
+    ),
+    5 : (
+        ('IdRef', None, "'Base Type'"),
+        ('IdRef', '*', "'Component Counts'"),
+    ),
+    6 : (
+        ('IdRef', None, "'Base Type'"),
+        ('IdRef', None, "'Component Count'"),
+    ),
+    7 : (
+        ('IdRef', None, "'Name'"),
+        ('IdRef', None, "'Base Type'"),
+        ('IdRef', None, "'Source'"),
+        ('IdRef', None, "'Line'"),
+        ('IdRef', None, "'Column'"),
+        ('IdRef', None, "'Parent'"),
+    ),
+    8 : (
+        ('IdRef', None, "'Flags'"),
+        ('IdRef', None, "'Return Type'"),
+        ('IdRef', '*', "'Parameter Types'"),
+    ),
+    9 : (
+        ('IdRef', None, "'Name'"),
+        ('IdRef', None, "'Underlying Type'"),
+        ('IdRef', None, "'Source'"),
+        ('IdRef', None, "'Line'"),
+        ('IdRef', None, "'Column'"),
+        ('IdRef', None, "'Parent'"),
+        ('IdRef', None, "'Size'"),
+        ('IdRef', None, "'Flags'"),
+        ('PairIdRefIdRef', '*', "'Value, Name, Value, Name, ...'"),
+    ),
+    10 : (
+        ('IdRef', None, "'Name'"),
+        ('IdRef', None, "'Tag'"),
+        ('IdRef', None, "'Source'"),
+        ('IdRef', None, "'Line'"),
+        ('IdRef', None, "'Column'"),
+        ('IdRef', None, "'Parent'"),
+        ('IdRef', None, "'Linkage Name'"),
+        ('IdRef', None, "'Size'"),
+        ('IdRef', None, "'Flags'"),
+        ('IdRef', '*', "'Members'"),
+    ),
+    11 : (
+        ('IdRef', None, "'Name'"),
+        ('IdRef', None, "'Type'"),
+        ('IdRef', None, "'Source'"),
+        ('IdRef', None, "'Line'"),
+        ('IdRef', None, "'Column'"),
+        ('IdRef', None, "'Offset'"),
+        ('IdRef', None, "'Size'"),
+        ('IdRef', None, "'Flags'"),
+        ('IdRef', '?', "'Value'"),
+    ),
+    12 : (
+        ('IdRef', None, "'Parent'"),
+        ('IdRef', None, "'Offset'"),
+        ('IdRef', None, "'Size'"),
+        ('IdRef', None, "'Flags'"),
+    ),
+    13 : (
+        ('IdRef', None, "'Member Type'"),
+        ('IdRef', None, "'Parent'"),
+    ),
+    14 : (
+        ('IdRef', None, "'Target'"),
+        ('IdRef', '*', "'Parameters'"),
+    ),
+    15 : (
+        ('IdRef', None, "'Name'"),
+        ('IdRef', None, "'Actual Type'"),
+        ('IdRef', None, "'Value'"),
+        ('IdRef', None, "'Source'"),
+        ('IdRef', None, "'Line'"),
+        ('IdRef', None, "'Column'"),
+    ),
+    16 : (
+        ('IdRef', None, "'Name'"),
+        ('IdRef', None, "'Template Name'"),
+        ('IdRef', None, "'Source'"),
+        ('IdRef', None, "'Line'"),
+        ('IdRef', None, "'Column'"),
+    ),
+    17 : (
+        ('IdRef', None, "'Name'"),
+        ('IdRef', None, "'Source'"),
+        ('IdRef', None, "'Line'"),
+        ('IdRef', None, "'Column'"),
+        ('IdRef', '*', "'Template Parameters'"),
+    ),
+    18 : (
+        ('IdRef', None, "'Name'"),
+        ('IdRef', None, "'Type'"),
+        ('IdRef', None, "'Source'"),
+        ('IdRef', None, "'Line'"),
+        ('IdRef', None, "'Column'"),
+        ('IdRef', None, "'Parent'"),
+        ('IdRef', None, "'Linkage Name'"),
+        ('IdRef', None, "'Variable'"),
+        ('IdRef', None, "'Flags'"),
+        ('IdRef', '?', "'Static Member Declaration'"),
+    ),
+    19 : (
+        ('IdRef', None, "'Name'"),
+        ('IdRef', None, "'Type'"),
+        ('IdRef', None, "'Source'"),
+        ('IdRef', None, "'Line'"),
+        ('IdRef', None, "'Column'"),
+        ('IdRef', None, "'Parent'"),
+        ('IdRef', None, "'Linkage Name'"),
+        ('IdRef', None, "'Flags'"),
+    ),
+    20 : (
+        ('IdRef', None, "'Name'"),
+        ('IdRef', None, "'Type'"),
+        ('IdRef', None, "'Source'"),
+        ('IdRef', None, "'Line'"),
+        ('IdRef', None, "'Column'"),
+        ('IdRef', None, "'Parent'"),
+        ('IdRef', None, "'Linkage Name'"),
+        ('IdRef', None, "'Flags'"),
+        ('IdRef', None, "'Scope Line'"),
+        ('IdRef', '?', "'Declaration'"),
+    ),
+    21 : (
+        ('IdRef', None, "'Source'"),
+        ('IdRef', None, "'Line'"),
+        ('IdRef', None, "'Column'"),
+        ('IdRef', None, "'Parent'"),
+        ('IdRef', '?', "'Name'"),
+    ),
+    22 : (
+        ('IdRef', None, "'Source'"),
+        ('IdRef', None, "'Discriminator'"),
+        ('IdRef', None, "'Parent'"),
+    ),
+    23 : (
+        ('IdRef', None, "'Scope'"),
+        ('IdRef', '?', "'Inlined At'"),
+    ),
+    24 : (),
+    25 : (
+        ('IdRef', None, "'Line'"),
+        ('IdRef', None, "'Scope'"),
+        ('IdRef', '?', "'Inlined'"),
+    ),
+    26 : (
+        ('IdRef', None, "'Name'"),
+        ('IdRef', None, "'Type'"),
+        ('IdRef', None, "'Source'"),
+        ('IdRef', None, "'Line'"),
+        ('IdRef', None, "'Column'"),
+        ('IdRef', None, "'Parent'"),
+        ('IdRef', None, "'Flags'"),
+        ('IdRef', '?', "'Arg Number'"),
+    ),
+    27 : (
+        ('IdRef', None, "'Variable'"),
+        ('IdRef', None, "'Inlined'"),
+    ),
+    28 : (
+        ('IdRef', None, "'Local Variable'"),
+        ('IdRef', None, "'Variable'"),
+        ('IdRef', None, "'Expression'"),
+        ('IdRef', '*', "'Indexes'"),
+    ),
+    29 : (
+        ('IdRef', None, "'Local Variable'"),
+        ('IdRef', None, "'Value'"),
+        ('IdRef', None, "'Expression'"),
+        ('IdRef', '*', "'Indexes'"),
+    ),
+    30 : (
+        ('IdRef', None, "'OpCode'"),
+        ('IdRef', '*', "'Operands ...'"),
+    ),
+    31 : (
+        ('IdRef', '*', "'Operands ...'"),
+    ),
+    32 : (
+        ('IdRef', None, "'Source'"),
+        ('IdRef', None, "'Line'"),
+        ('IdRef', None, "'Name'"),
+        ('IdRef', '?', "'Value'"),
+    ),
+    33 : (
+        ('IdRef', None, "'Source'"),
+        ('IdRef', None, "'Line'"),
+        ('IdRef', None, "'Macro'"),
+    ),
+    34 : (
+        ('IdRef', None, "'Name'"),
+        ('IdRef', None, "'Tag'"),
+        ('IdRef', None, "'Source'"),
+        ('IdRef', None, "'Entity'"),
+        ('IdRef', None, "'Line'"),
+        ('IdRef', None, "'Column'"),
+        ('IdRef', None, "'Parent'"),
+    ),
+    35 : (
+        ('IdRef', None, "'File'"),
+        ('IdRef', '?', "'Text'"),
+    ),
+    101 : (
+        ('IdRef', None, "'Function'"),
+        ('IdRef', None, "'Definition'"),
+    ),
+    102 : (
+        ('IdRef', None, "'Text'"),
+    ),
+    103 : (
+        ('IdRef', None, "'Source'"),
+        ('IdRef', None, "'Line Start'"),
+        ('IdRef', None, "'Line End'"),
+        ('IdRef', None, "'Column Start'"),
+        ('IdRef', None, "'Column End'"),
+    ),
+    104 : (),
+    105 : (
+        ('IdRef', None, "'Identifier'"),
+        ('IdRef', None, "'Flags'"),
+    ),
+    106 : (
+        ('IdRef', None, "'Path'"),
+    ),
+    107 : (
+        ('IdRef', None, "'Entry Point'"),
+        ('IdRef', None, "'Compilation Unit'"),
+        ('IdRef', None, "'Compiler Signature'"),
+        ('IdRef', None, "'Command-line Arguments'"),
+    ),
+    108 : (
+        ('IdRef', None, "'Vector Type'"),
+        ('IdRef', None, "'Vector Count'"),
+        ('IdRef', None, "'Column Major'"),
+    ),
+}
+
+OperandKindCategories = {
+    'DebugInfoFlags' : 'BitEnum',
+    'BuildIdentifierFlags' : 'BitEnum',
+    'DebugBaseTypeAttributeEncoding' : 'ValueEnum',
+    'DebugCompositeType' : 'ValueEnum',
+    'DebugTypeQualifier' : 'ValueEnum',
+    'DebugOperation' : 'ValueEnum',
+    'DebugImportedEntity' : 'ValueEnum',
+}
+
+OperandKinds = {
+    'DebugInfoFlags' : {
+        'None' : 0x0000,
+        'FlagIsProtected' : 0x01,
+        'FlagIsPrivate' : 0x02,
+        'FlagIsPublic' : 0x03,
+        'FlagIsLocal' : 0x04,
+        'FlagIsDefinition' : 0x08,
+        'FlagFwdDecl' : 0x10,
+        'FlagArtificial' : 0x20,
+        'FlagExplicit' : 0x40,
+        'FlagPrototyped' : 0x80,
+        'FlagObjectPointer' : 0x100,
+        'FlagStaticMember' : 0x200,
+        'FlagIndirectVariable' : 0x400,
+        'FlagLValueReference' : 0x800,
+        'FlagRValueReference' : 0x1000,
+        'FlagIsOptimized' : 0x2000,
+        'FlagIsEnumClass' : 0x4000,
+        'FlagTypePassByValue' : 0x8000,
+        'FlagTypePassByReference' : 0x10000,
+        'FlagUnknownPhysicalLayout' : 0x20000,
+    },
+    'BuildIdentifierFlags' : {
+        'IdentifierPossibleDuplicates' : 0x01,
+    },
+    'DebugBaseTypeAttributeEncoding' : {
+        'Unspecified' : 0,
+        'Address' : 1,
+        'Boolean' : 2,
+        'Float' : 3,
+        'Signed' : 4,
+        'SignedChar' : 5,
+        'Unsigned' : 6,
+        'UnsignedChar' : 7,
+    },
+    'DebugCompositeType' : {
+        'Class' : 0,
+        'Structure' : 1,
+        'Union' : 2,
+    },
+    'DebugTypeQualifier' : {
+        'ConstType' : 0,
+        'VolatileType' : 1,
+        'RestrictType' : 2,
+        'AtomicType' : 3,
+    },
+    'DebugOperation' : {
+        'Deref' : 0,
+        'Plus' : 1,
+        'Minus' : 2,
+        'PlusUconst' : 3,
+        'BitPiece' : 4,
+        'Swap' : 5,
+        'Xderef' : 6,
+        'StackValue' : 7,
+        'Constu' : 8,
+        'Fragment' : 9,
+    },
+    'DebugImportedEntity' : {
+        'ImportedModule' : 0,
+        'ImportedDeclaration' : 1,
+    },
+}
+
+OperandKindNames = {
+    'DebugInfoFlags' : {
+        0x0000 : 'None',
+        0x01 : 'FlagIsProtected',
+        0x02 : 'FlagIsPrivate',
+        0x03 : 'FlagIsPublic',
+        0x04 : 'FlagIsLocal',
+        0x08 : 'FlagIsDefinition',
+        0x10 : 'FlagFwdDecl',
+        0x20 : 'FlagArtificial',
+        0x40 : 'FlagExplicit',
+        0x80 : 'FlagPrototyped',
+        0x100 : 'FlagObjectPointer',
+        0x200 : 'FlagStaticMember',
+        0x400 : 'FlagIndirectVariable',
+        0x800 : 'FlagLValueReference',
+        0x1000 : 'FlagRValueReference',
+        0x2000 : 'FlagIsOptimized',
+        0x4000 : 'FlagIsEnumClass',
+        0x8000 : 'FlagTypePassByValue',
+        0x10000 : 'FlagTypePassByReference',
+        0x20000 : 'FlagUnknownPhysicalLayout',
+    },
+    'BuildIdentifierFlags' : {
+        0x01 : 'IdentifierPossibleDuplicates',
+    },
+    'DebugBaseTypeAttributeEncoding' : {
+        0 : 'Unspecified',
+        1 : 'Address',
+        2 : 'Boolean',
+        3 : 'Float',
+        4 : 'Signed',
+        5 : 'SignedChar',
+        6 : 'Unsigned',
+        7 : 'UnsignedChar',
+    },
+    'DebugCompositeType' : {
+        0 : 'Class',
+        1 : 'Structure',
+        2 : 'Union',
+    },
+    'DebugTypeQualifier' : {
+        0 : 'ConstType',
+        1 : 'VolatileType',
+        2 : 'RestrictType',
+        3 : 'AtomicType',
+    },
+    'DebugOperation' : {
+        0 : 'Deref',
+        1 : 'Plus',
+        2 : 'Minus',
+        3 : 'PlusUconst',
+        4 : 'BitPiece',
+        5 : 'Swap',
+        6 : 'Xderef',
+        7 : 'StackValue',
+        8 : 'Constu',
+        9 : 'Fragment',
+    },
+    'DebugImportedEntity' : {
+        0 : 'ImportedModule',
+        1 : 'ImportedDeclaration',
+    },
+}
@@ -0,0 +1,167 @@
+# Copyright (c) 2020-2024 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+#
+
+# Instruction and operand kind tables for the NonSemanticVkspReflection extended instruction set.
+# Operands are (kind, quantifier, name) tuples.
+
+Name = 'NonSemanticVkspReflection'
+Revision = 4
+
+Instructions = {
+    'Configuration' : 1,
+    'StartCounter' : 2,
+    'StopCounter' : 3,
+    'PushConstants' : 4,
+    'SpecializationMapEntry' : 5,
+    'DescriptorSetBuffer' : 6,
+    'DescriptorSetImage' : 7,
+    'DescriptorSetSampler' : 8,
+}
+
+InstructionNames = {
+    1 : 'Configuration',
+    2 : 'StartCounter',
+    3 : 'StopCounter',
+    4 : 'PushConstants',
+    5 : 'SpecializationMapEntry',
+    6 : 'DescriptorSetBuffer',
+    7 : 'DescriptorSetImage',
+    8 : 'DescriptorSetSampler',
+}
+
+InstructionOperands = {
+    1 : (
+        ('IdRef', None, 'enabledExtensionNames'),
+        ('IdRef', None, 'specializationInfoDataSize'),
+        ('IdRef', None, 'specializationInfoData'),
+        ('IdRef', None, 'shaderName'),
+        ('IdRef', None, 'EntryPoint'),
+        ('IdRef', None, 'groupCountX'),
+        ('IdRef', None, 'groupCountY'),
+        ('IdRef', None, 'groupCountZ'),
+        ('IdRef', None, 'dispatchId'),
+    ),
+    2 : (
+        ('IdRef', None, 'name'),
+    ),
+    3 : (
+        ('IdRef', None, 'counter'),
+    ),
+    4 : (
+        ('IdRef', None, 'offset'),
+        ('IdRef', None, 'size'),
+        ('IdRef', None, 'pValues'),
+        ('IdRef', None, 'stageFlags'),
+    ),
+    5 : (
+        ('IdRef', None, 'constantID'),
+        ('IdRef', None, 'offset'),
+        ('IdRef', None, 'size'),
+    ),
+    6 : (
+        ('IdRef', None, 'ds'),
+        ('IdRef', None, 'binding'),
+        ('IdRef', None, 'type'),
+        ('IdRef', None, 'flags'),
+        ('IdRef', None, 'queueFamilyIndexCount'),
+        ('IdRef', None, 'sharingMode'),
+        ('IdRef', None, 'size'),
+        ('IdRef', None, 'usage'),
+        ('IdRef', None, 'range'),
+        ('IdRef', None, 'offset'),
+        ('IdRef', None, 'memorySize'),
+        ('IdRef', None, 'memoryType'),
+        ('IdRef', None, 'bindOffset'),
+        ('IdRef', None, 'viewFlags'),
+        ('IdRef', None, 'viewFormat'),
+    ),
+    7 : (
+        ('IdRef', None, 'ds'),
+        ('IdRef', None, 'binding'),
+        ('IdRef', None, 'type'),
+        ('IdRef', None, 'imageLayout'),
+        ('IdRef', None, 'imageFlags'),
+        ('IdRef', None, 'imageType'),
+        ('IdRef', None, 'imageformat'),
+        ('IdRef', None, 'width'),
+        ('IdRef', None, 'height'),
+        ('IdRef', None, 'depth'),
+        ('IdRef', None, 'mipLevels'),
+        ('IdRef', None, 'arrayLayers'),
+        ('IdRef', None, 'samples'),
+        ('IdRef', None, 'tiling'),
+        ('IdRef', None, 'usage'),
+        ('IdRef', None, 'sharingMode'),
+        ('IdRef', None, 'queueFamilyIndexCount'),
+        ('IdRef', None, 'initialLayout'),
+        ('IdRef', None, 'aspectMask'),
+        ('IdRef', None, 'baseMipLevel'),
+        ('IdRef', None, 'levelCount'),
+        ('IdRef', None, 'baseArrayLayer'),
+        ('IdRef', None, 'layerCount'),
+        ('IdRef', None, 'viewFlags'),
+        ('IdRef', None, 'viewType'),
+        ('IdRef', None, 'viewFormat'),
+        ('IdRef', None, 'component_a'),
+        ('IdRef', None, 'component_b'),
+        ('IdRef', None, 'component_g'),
+        ('IdRef', None, 'component_r'),
+        ('IdRef', None, 'memorySize'),
+        ('IdRef', None, 'memoryType'),
+        ('IdRef', None, 'bindOffset'),
+    ),
+    8 : (
+        ('IdRef', None, 'ds'),
+        ('IdRef', None, 'binding'),
+        ('IdRef', None, 'type'),
+        ('IdRef', None, 'flags'),
+        ('IdRef', None, 'magFilter'),
+        ('IdRef', None, 'minFilter'),
+        ('IdRef', None, 'mipmapMode'),
+        ('IdRef', None, 'addressModeU'),
+        ('IdRef', None, 'addressModeV'),
+        ('IdRef', None, 'addressModeW'),
+        ('IdRef', None, 'mipLodBias'),
+        ('IdRef', None, 'anisotropyEnable'),
+        ('IdRef', None, 'maxAnisotropy'),
+        ('IdRef', None, 'compareEnable'),
+        ('IdRef', None, 'compareOp'),
+        ('IdRef', None, 'minLod'),
+        ('IdRef', None, 'maxLod'),
+        ('IdRef', None, 'borderColor'),
+        ('IdRef', None, 'unnormalizedCoordinates'),
+    ),
+}
+
+OperandKindCategories = {
+}
+
+OperandKinds = {
+}
+
+OperandKindNames = {
+}
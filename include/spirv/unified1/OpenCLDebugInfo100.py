@@ -0,0 +1,481 @@
+# Copyright (c) 2018-2024 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and/or associated documentation files (the "Materials"),
+# to deal in the Materials without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Materials, and to permit persons to whom the
+# Materials are furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS KHRONOS
+# STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS SPECIFICATIONS AND
+# HEADER INFORMATION ARE LOCATED AT https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM,OUT OF OR IN CONNECTION WITH THE MATERIALS OR THE USE OR OTHER DEALINGS
+# IN THE MATERIALS.
+
+# Instruction and operand kind tables for the OpenCLDebugInfo100 extended instruction set.
+# Operands are (kind, quantifier, name) tuples.
+
+Name = 'OpenCLDebugInfo100'
+Version = 200
+Revision = 2
+
+Instructions = {
+    'DebugInfoNone' : 0,
+    'DebugCompilationUnit' : 1,
+    'DebugTypeBasic' : 2,
+    'DebugTypePointer' : 3,
+    'DebugTypeQualifier' : 4,
+    'DebugTypeArray' : 5,
+    'DebugTypeVector' : 6,
+    'DebugTypedef' : 7,
+    'DebugTypeFunction' : 8,
+    'DebugTypeEnum' : 9,
+    'DebugTypeComposite' : 10,
+    'DebugTypeMember' : 11,
+    'DebugTypeInheritance' : 12,
+    'DebugTypePtrToMember' : 13,
+    'DebugTypeTemplate' : 14,
+    'DebugTypeTemplateParameter' : 15,
+    'DebugTypeTemplateTemplateParameter' : 16,
+    'DebugTypeTemplateParameterPack' : 17,
+    'DebugGlobalVariable' : 18,
+    'DebugFunctionDeclaration' : 19,
+    'DebugFunction' : 20,
+    'DebugLexicalBlock' : 21,
+    'DebugLexicalBlockDiscriminator' : 22,
+    'DebugScope' : 23,
+    'DebugNoScope' : 24,
+    'DebugInlinedAt' : 25,
+    'DebugLocalVariable' : 26,
+    'DebugInlinedVariable' : 27,
+    'DebugDeclare' : 28,
+    'DebugValue' : 29,
+    'DebugOperation' : 30,
+    'DebugExpression' : 31,
+    'DebugMacroDef' : 32,
+    'DebugMacroUndef' : 33,
+    'DebugImportedEntity' : 34,
+    'DebugSource' : 35,
+    'DebugModuleINTEL' : 36,
+}
+
+InstructionNames = {
+    0 : 'DebugInfoNone',
+    1 : 'DebugCompilationUnit',
+    2 : 'DebugTypeBasic',
+    3 : 'DebugTypePointer',
+    4 : 'DebugTypeQualifier',
+    5 : 'DebugTypeArray',
+    6 : 'DebugTypeVector',
+    7 : 'DebugTypedef',
+    8 : 'DebugTypeFunction',
+    9 : 'DebugTypeEnum',
+    10 : 'DebugTypeComposite',
+    11 : 'DebugTypeMember',
+    12 : 'DebugTypeInheritance',
+    13 : 'DebugTypePtrToMember',
+    14 : 'DebugTypeTemplate',
+    15 : 'DebugTypeTemplateParameter',
+    16 : 'DebugTypeTemplateTemplateParameter',
+    17 : 'DebugTypeTemplateParameterPack',
+    18 : 'DebugGlobalVariable',
+    19 : 'DebugFunctionDeclaration',
+    20 : 'DebugFunction',
+    21 : 'DebugLexicalBlock',
+    22 : 'DebugLexicalBlockDiscriminator',
+    23 : 'DebugScope',
+    24 : 'DebugNoScope',
+    25 : 'DebugInlinedAt',
+    26 : 'DebugLocalVariable',
+    27 : 'DebugInlinedVariable',
+    28 : 'DebugDeclare',
+    29 : 'DebugValue',
+    30 : 'DebugOperation',
+    31 : 'DebugExpression',
+    32 : 'DebugMacroDef',
+    33 : 'DebugMacroUndef',
+    34 : 'DebugImportedEntity',
+    35 : 'DebugSource',
+    36 : 'DebugModuleINTEL',
+}
+
+InstructionOperands = {
+    0 : (),
+    1 : (
+        ('LiteralInteger', None, "'Version'"),
+        ('LiteralInteger', None, "'DWARF Version'"),
+        ('IdRef', None, "'Source'"),
+        ('SourceLanguage', None, "'Language'"),
+    ),
+    2 : (
+        ('IdRef', None, "'Name'"),
+        ('IdRef', None, "'Size'"),
+        ('DebugBaseTypeAttributeEncoding', None, "'Encoding'"),
+    ),
+    3 : (
+        ('IdRef', None, "'Base Type'"),
+        ('StorageClass', None, "'Storage Class'"),
+        ('DebugInfoFlags', None, "'Flags'"),
+    ),
+    4 : (
+        ('IdRef', None, "'Base Type'"),
+        ('DebugTypeQualifier', None, "'Type Qualifier'"),
+    ),
+    5 : (
+        ('IdRef', None, "'Base Type'"),
+        ('IdRef', '*', "'Component Counts'"),
+    ),
+    6 : (
+        ('IdRef', None, "'Base Type'"),
+        ('LiteralInteger', None, "'Component Count'"),
+    ),
+    7 : (
+        ('IdRef', None, "'Name'"),
+        ('IdRef', None, "'Base Type'"),
+        ('IdRef', None, "'Source'"),
+        ('LiteralInteger', None, "'Line'"),
+        ('LiteralInteger', None, "'Column'"),
+        ('IdRef', None, "'Parent'"),
+    ),
+    8 : (
+        ('DebugInfoFlags', None, "'Flags'"),
+        ('IdRef', None, "'Return Type'"),
+        ('IdRef', '*', "'Parameter Types'"),
+    ),
+    9 : (
+        ('IdRef', None, "'Name'"),
+        ('IdRef', None, "'Underlying Type'"),
+        ('IdRef', None, "'Source'"),
+        ('LiteralInteger', None, "'Line'"),
+        ('LiteralInteger', None, "'Column'"),
+        ('IdRef', None, "'Parent'"),
+        ('IdRef', None, "'Size'"),
+        ('DebugInfoFlags', None, "'Flags'"),
+        ('PairIdRefIdRef', '*', "'Value, Name, Value, Name, ...'"),
+    ),
+    10 : (
+        ('IdRef', None, "'Name'"),
+        ('DebugCompositeType', None, "'Tag'"),
+        ('IdRef', None, "'Source'"),
+        ('LiteralInteger', None, "'Line'"),
+        ('LiteralInteger', None, "'Column'"),
+        ('IdRef', None, "'Parent'"),
+        ('IdRef', None, "'Linkage Name'"),
+        ('IdRef', None, "'Size'"),
+        ('DebugInfoFlags', None, "'Flags'"),
+        ('IdRef', '*', "'Members'"),
+    ),
+    11 : (
+        ('IdRef', None, "'Name'"),
+        ('IdRef', None, "'Type'"),
+        ('IdRef', None, "'Source'"),
+        ('LiteralInteger', None, "'Line'"),
+        ('LiteralInteger', None, "'Column'"),
+        ('IdRef', None, "'Parent'"),
+        ('IdRef', None, "'Offset'"),
+        ('IdRef', None, "'Size'"),
+        ('DebugInfoFlags', None, "'Flags'"),
+        ('IdRef', '?', "'Value'"),
+    ),
+    12 : (
+        ('IdRef', None, "'Child'"),
+        ('IdRef', None, "'Parent'"),
+        ('IdRef', None, "'Offset'"),
+        ('IdRef', None, "'Size'"),
+        ('DebugInfoFlags', None, "'Flags'"),
+    ),
+    13 : (
+        ('IdRef', None, "'Member Type'"),
+        ('IdRef', None, "'Parent'"),
+    ),
+    14 : (
+        ('IdRef', None, "'Target'"),
+        ('IdRef', '*', "'Parameters'"),
+    ),
+    15 : (
+        ('IdRef', None, "'Name'"),
+        ('IdRef', None, "'Actual Type'"),
+        ('IdRef', None, "'Value'"),
+        ('IdRef', None, "'Source'"),
+        ('LiteralInteger', None, "'Line'"),
+        ('LiteralInteger', None, "'Column'"),
+    ),
+    16 : (
+        ('IdRef', None, "'Name'"),
+        ('IdRef', None, "'Template Name'"),
+        ('IdRef', None, "'Source'"),
+        ('LiteralInteger', None, "'Line'"),
+        ('LiteralInteger', None, "'Column'"),
+    ),
+    17 : (
+        ('IdRef', None, "'Name'"),
+        ('IdRef', None, "'Source'"),
+        ('LiteralInteger', None, "'Line'"),
+        ('LiteralInteger', None, "'Column'"),
+        ('IdRef', '*', "'Template Parameters'"),
+    ),
+    18 : (
+        ('IdRef', None, "'Name'"),
+        ('IdRef', None, "'Type'"),
+        ('IdRef', None, "'Source'"),
+        ('LiteralInteger', None, "'Line'"),
+        ('LiteralInteger', None, "'Column'"),
+        ('IdRef', None, "'Parent'"),
+        ('IdRef', None, "'Linkage Name'"),
+        ('IdRef', None, "'Variable'"),
+        ('DebugInfoFlags', None, "'Flags'"),
+        ('IdRef', '?', "'Static Member Declaration'"),
+    ),
+    19 : (
+        ('IdRef', None, "'Name'"),
+        ('IdRef', None, "'Type'"),
+        ('IdRef', None, "'Source'"),
+        ('LiteralInteger', None, "'Line'"),
+        ('LiteralInteger', None, "'Column'"),
+        ('IdRef', None, "'Parent'"),
+        ('IdRef', None, "'Linkage Name'"),
+        ('DebugInfoFlags', None, "'Flags'"),
+    ),
+    20 : (
+        ('IdRef', None, "'Name'"),
+        ('IdRef', None, "'Type'"),
+        ('IdRef', None, "'Source'"),
+        ('LiteralInteger', None, "'Line'"),
+        ('LiteralInteger', None, "'Column'"),
+        ('IdRef', None, "'Parent'"),
+        ('IdRef', None, "'Linkage Name'"),
+        ('DebugInfoFlags', None, "'Flags'"),
+        ('LiteralInteger', None, "'Scope Line'"),
+        ('IdRef', None, "'Function'"),
+        ('IdRef', '?', "'Declaration'"),
+    ),
+    21 : (
+        ('IdRef', None, "'Source'"),
+        ('LiteralInteger', None, "'Line'"),
+        ('LiteralInteger', None, "'Column'"),
+        ('IdRef', None, "'Parent'"),
+        ('IdRef', '?', "'Name'"),
+    ),
+    22 : (
+        ('IdRef', None, "'Source'"),
+        ('LiteralInteger', None, "'Discriminator'"),
+        ('IdRef', None, "'Parent'"),
+    ),
+    23 : (
+        ('IdRef', None, "'Scope'"),
+        ('IdRef', '?', "'Inlined At'"),
+    ),
+    24 : (),
+    25 : (
+        ('LiteralInteger', None, "'Line'"),
+        ('IdRef', None, "'Scope'"),
+        ('IdRef', '?', "'Inlined'"),
+    ),
+    26 : (
+        ('IdRef', None, "'Name'"),
+        ('IdRef', None, "'Type'"),
+        ('IdRef', None, "'Source'"),
+        ('LiteralInteger', None, "'Line'"),
+        ('LiteralInteger', None, "'Column'"),
+        ('IdRef', None, "'Parent'"),
+        ('DebugInfoFlags', None, "'Flags'"),
+        ('LiteralInteger', '?', "'Arg Number'"),
+    ),
+    27 : (
+        ('IdRef', None, "'Variable'"),
+        ('IdRef', None, "'Inlined'"),
+    ),
+    28 : (
+        ('IdRef', None, "'Local Variable'"),
+        ('IdRef', None, "'Variable'"),
+        ('IdRef', None, "'Expression'"),
+    ),
+    29 : (
+        ('IdRef', None, "'Local Variable'"),
+        ('IdRef', None, "'Value'"),
+        ('IdRef', None, "'Expression'"),
+        ('IdRef', '*', "'Indexes'"),
+    ),
+    30 : (
+        ('DebugOperation', None, "'OpCode'"),
+        ('LiteralInteger', '*', "'Operands ...'"),
+    ),
+    31 : (
+        ('IdRef', '*', "'Operands ...'"),
+    ),
+    32 : (
+        ('IdRef', None, "'Source'"),
+        ('LiteralInteger', None, "'Line'"),
+        ('IdRef', None, "'Name'"),
+        ('IdRef', '?', "'Value'"),
+    ),
+    33 : (
+        ('IdRef', None, "'Source'"),
+        ('LiteralInteger', None, "'Line'"),
+        ('IdRef', None, "'Macro'"),
+    ),
+    34 : (
+        ('IdRef', None, "'Name'"),
+        ('DebugImportedEntity', None, "'Tag'"),
+        ('IdRef', None, "'Source'"),
+        ('IdRef', None, "'Entity'"),
+        ('LiteralInteger', None, "'Line'"),
+        ('LiteralInteger', None, "'Column'"),
+        ('IdRef', None, "'Parent'"),
+    ),
+    35 : (
+        ('IdRef', None, "'File'"),
+        ('IdRef', '?', "'Text'"),
+    ),
+    36 : (
+        ('IdRef', None, "'Name'"),
+        ('IdRef', None, "'Source'"),
+        ('IdRef', None, "'Parent'"),
+        ('LiteralInteger', None, "'Line'"),
+        ('IdRef', None, "'ConfigurationMacros'"),
+        ('IdRef', None, "'IncludePath'"),
+        ('IdRef', None, "'APINotesFile'"),
+        ('LiteralInteger', None, "'IsDeclaration'"),
+    ),
+}
+
+OperandKindCategories = {
+    'DebugInfoFlags' : 'BitEnum',
+    'DebugBaseTypeAttributeEncoding' : 'ValueEnum',
+    'DebugCompositeType' : 'ValueEnum',
+    'DebugTypeQualifier' : 'ValueEnum',
+    'DebugOperation' : 'ValueEnum',
+    'DebugImportedEntity' : 'ValueEnum',
+}
+
+OperandKinds = {
+    'DebugInfoFlags' : {
+        'None' : 0x0000,
+        'FlagIsProtected' : 0x01,
+        'FlagIsPrivate' : 0x02,
+        'FlagIsPublic' : 0x03,
+        'FlagIsLocal' : 0x04,
+        'FlagIsDefinition' : 0x08,
+        'FlagFwdDecl' : 0x10,
+        'FlagArtificial' : 0x20,
+        'FlagExplicit' : 0x40,
+        'FlagPrototyped' : 0x80,
+        'FlagObjectPointer' : 0x100,
+        'FlagStaticMember' : 0x200,
+        'FlagIndirectVariable' : 0x400,
+        'FlagLValueReference' : 0x800,
+        'FlagRValueReference' : 0x1000,
+        'FlagIsOptimized' : 0x2000,
+        'FlagIsEnumClass' : 0x4000,
+        'FlagTypePassByValue' : 0x8000,
+        'FlagTypePassByReference' : 0x10000,
+    },
+    'DebugBaseTypeAttributeEncoding' : {
+        'Unspecified' : 0,
+        'Address' : 1,
+        'Boolean' : 2,
+        'Float' : 3,
+        'Signed' : 4,
+        'SignedChar' : 5,
+        'Unsigned' : 6,
+        'UnsignedChar' : 7,
+    },
+    'DebugCompositeType' : {
+        'Class' : 0,
+        'Structure' : 1,
+        'Union' : 2,
+    },
+    'DebugTypeQualifier' : {
+        'ConstType' : 0,
+        'VolatileType' : 1,
+        'RestrictType' : 2,
+        'AtomicType' : 3,
+    },
+    'DebugOperation' : {
+        'Deref' : 0,
+        'Plus' : 1,
+        'Minus' : 2,
+        'PlusUconst' : 3,
+        'BitPiece' : 4,
+        'Swap' : 5,
+        'Xderef' : 6,
+        'StackValue' : 7,
+        'Constu' : 8,
+        'Fragment' : 9,
+    },
+    'DebugImportedEntity' : {
+        'ImportedModule' : 0,
+        'ImportedDeclaration' : 1,
+    },
+}
+
+OperandKindNames = {
+    'DebugInfoFlags' : {
+        0x0000 : 'None',
+        0x01 : 'FlagIsProtected',
+        0x02 : 'FlagIsPrivate',
+        0x03 : 'FlagIsPublic',
+        0x04 : 'FlagIsLocal',
+        0x08 : 'FlagIsDefinition',
+        0x10 : 'FlagFwdDecl',
+        0x20 : 'FlagArtificial',
+        0x40 : 'FlagExplicit',
+        0x80 : 'FlagPrototyped',
+        0x100 : 'FlagObjectPointer',
+        0x200 : 'FlagStaticMember',
+        0x400 : 'FlagIndirectVariable',
+        0x800 : 'FlagLValueReference',
+        0x1000 : 'FlagRValueReference',
+        0x2000 : 'FlagIsOptimized',
+        0x4000 : 'FlagIsEnumClass',
+        0x8000 : 'FlagTypePassByValue',
+        0x10000 : 'FlagTypePassByReference',
+    },
+    'DebugBaseTypeAttributeEncoding' : {
+        0 : 'Unspecified',
+        1 : 'Address',
+        2 : 'Boolean',
+        3 : 'Float',
+        4 : 'Signed',
+        5 : 'SignedChar',
+        6 : 'Unsigned',
+        7 : 'UnsignedChar',
+    },
+    'DebugCompositeType' : {
+        0 : 'Class',
+        1 : 'Structure',
+        2 : 'Union',
+    },
+    'DebugTypeQualifier' : {
+        0 : 'ConstType',
+        1 : 'VolatileType',
+        2 : 'RestrictType',
+        3 : 'AtomicType',
+    },
+    'DebugOperation' : {
+        0 : 'Deref',
+        1 : 'Plus',
+        2 : 'Minus',
+        3 : 'PlusUconst',
+        4 : 'BitPiece',
+        5 : 'Swap',
+        6 : 'Xderef',
+        7 : 'StackValue',
+        8 : 'Constu',
+        9 : 'Fragment',
+    },
+    'DebugImportedEntity' : {
+        0 : 'ImportedModule',
+        1 : 'ImportedDeclaration',
+    },
+}
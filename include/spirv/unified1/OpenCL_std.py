@@ -0,0 +1,972 @@
+# Copyright (c) 2014-2024 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and/or associated documentation files (the "Materials"),
+# to deal in the Materials without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Materials, and to permit persons to whom the
+# Materials are furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS KHRONOS
+# STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS SPECIFICATIONS AND
+# HEADER INFORMATION ARE LOCATED AT https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM,OUT OF OR IN CONNECTION WITH THE MATERIALS OR THE USE OR OTHER DEALINGS
+# IN THE MATERIALS.
+
+# Instruction and operand kind tables for the OpenCL_std extended instruction set.
+# Operands are (kind, quantifier, name) tuples.
+
+Name = 'OpenCL_std'
+Version = 100
+Revision = 2
+
+Instructions = {
+    'acos' : 0,
+    'acosh' : 1,
+    'acospi' : 2,
+    'asin' : 3,
+    'asinh' : 4,
+    'asinpi' : 5,
+    'atan' : 6,
+    'atan2' : 7,
+    'atanh' : 8,
+    'atanpi' : 9,
+    'atan2pi' : 10,
+    'cbrt' : 11,
+    'ceil' : 12,
+    'copysign' : 13,
+    'cos' : 14,
+    'cosh' : 15,
+    'cospi' : 16,
+    'erfc' : 17,
+    'erf' : 18,
+    'exp' : 19,
+    'exp2' : 20,
+    'exp10' : 21,
+    'expm1' : 22,
+    'fabs' : 23,
+    'fdim' : 24,
+    'floor' : 25,
+    'fma' : 26,
+    'fmax' : 27,
+    'fmin' : 28,
+    'fmod' : 29,
+    'fract' : 30,
+    'frexp' : 31,
+    'hypot' : 32,
+    'ilogb' : 33,
+    'ldexp' : 34,
+    'lgamma' : 35,
+    'lgamma_r' : 36,
+    'log' : 37,
+    'log2' : 38,
+    'log10' : 39,
+    'log1p' : 40,
+    'logb' : 41,
+    'mad' : 42,
+    'maxmag' : 43,
+    'minmag' : 44,
+    'modf' : 45,
+    'nan' : 46,
+    'nextafter' : 47,
+    'pow' : 48,
+    'pown' : 49,
+    'powr' : 50,
+    'remainder' : 51,
+    'remquo' : 52,
+    'rint' : 53,
+    'rootn' : 54,
+    'round' : 55,
+    'rsqrt' : 56,
+    'sin' : 57,
+    'sincos' : 58,
+    'sinh' : 59,
+    'sinpi' : 60,
+    'sqrt' : 61,
+    'tan' : 62,
+    'tanh' : 63,
+    'tanpi' : 64,
+    'tgamma' : 65,
+    'trunc' : 66,
+    'half_cos' : 67,
+    'half_divide' : 68,
+    'half_exp' : 69,
+    'half_exp2' : 70,
+    'half_exp10' : 71,
+    'half_log' : 72,
+    'half_log2' : 73,
+    'half_log10' : 74,
+    'half_powr' : 75,
+    'half_recip' : 76,
+    'half_rsqrt' : 77,
+    'half_sin' : 78,
+    'half_sqrt' : 79,
+    'half_tan' : 80,
+    'native_cos' : 81,
+    'native_divide' : 82,
+    'native_exp' : 83,
+    'native_exp2' : 84,
+    'native_exp10' : 85,
+    'native_log' : 86,
+    'native_log2' : 87,
+    'native_log10' : 88,
+    'native_powr' : 89,
+    'native_recip' : 90,
+    'native_rsqrt' : 91,
+    'native_sin' : 92,
+    'native_sqrt' : 93,
+    'native_tan' : 94,
+    's_abs' : 141,
+    's_abs_diff' : 142,
+    's_add_sat' : 143,
+    'u_add_sat' : 144,
+    's_hadd' : 145,
+    'u_hadd' : 146,
+    's_rhadd' : 147,
+    'u_rhadd' : 148,
+    's_clamp' : 149,
+    'u_clamp' : 150,
+    'clz' : 151,
+    'ctz' : 152,
+    's_mad_hi' : 153,
+    'u_mad_sat' : 154,
+    's_mad_sat' : 155,
+    's_max' : 156,
+    'u_max' : 157,
+    's_min' : 158,
+    'u_min' : 159,
+    's_mul_hi' : 160,
+    'rotate' : 161,
+    's_sub_sat' : 162,
+    'u_sub_sat' : 163,
+    'u_upsample' : 164,
+    's_upsample' : 165,
+    'popcount' : 166,
+    's_mad24' : 167,
+    'u_mad24' : 168,
+    's_mul24' : 169,
+    'u_mul24' : 170,
+    'u_abs' : 201,
+    'u_abs_diff' : 202,
+    'u_mul_hi' : 203,
+    'u_mad_hi' : 204,
+    'fclamp' : 95,
+    'degrees' : 96,
+    'fmax_common' : 97,
+    'fmin_common' : 98,
+    'mix' : 99,
+    'radians' : 100,
+    'step' : 101,
+    'smoothstep' : 102,
+    'sign' : 103,
+    'cross' : 104,
+    'distance' : 105,
+    'length' : 106,
+    'normalize' : 107,
+    'fast_distance' : 108,
+    'fast_length' : 109,
+    'fast_normalize' : 110,
+    'bitselect' : 186,
+    'select' : 187,
+    'vloadn' : 171,
+    'vstoren' : 172,
+    'vload_half' : 173,
+    'vload_halfn' : 174,
+    'vstore_half' : 175,
+    'vstore_half_r' : 176,
+    'vstore_halfn' : 177,
+    'vstore_halfn_r' : 178,
+    'vloada_halfn' : 179,
+    'vstorea_halfn' : 180,
+    'vstorea_halfn_r' : 181,
+    'shuffle' : 182,
+    'shuffle2' : 183,
+    'printf' : 184,
+    'prefetch' : 185,
+}
+
+InstructionNames = {
+    0 : 'acos',
+    1 : 'acosh',
+    2 : 'acospi',
+    3 : 'asin',
+    4 : 'asinh',
+    5 : 'asinpi',
+    6 : 'atan',
+    7 : 'atan2',
+    8 : 'atanh',
+    9 : 'atanpi',
+    10 : 'atan2pi',
+    11 : 'cbrt',
+    12 : 'ceil',
+    13 : 'copysign',
+    14 : 'cos',
+    15 : 'cosh',
+    16 : 'cospi',
+    17 : 'erfc',
+    18 : 'erf',
+    19 : 'exp',
+    20 : 'exp2',
+    21 : 'exp10',
+    22 : 'expm1',
+    23 : 'fabs',
+    24 : 'fdim',
+    25 : 'floor',
+    26 : 'fma',
+    27 : 'fmax',
+    28 : 'fmin',
+    29 : 'fmod',
+    30 : 'fract',
+    31 : 'frexp',
+    32 : 'hypot',
+    33 : 'ilogb',
+    34 : 'ldexp',
+    35 : 'lgamma',
+    36 : 'lgamma_r',
+    37 : 'log',
+    38 : 'log2',
+    39 : 'log10',
+    40 : 'log1p',
+    41 : 'logb',
+    42 : 'mad',
+    43 : 'maxmag',
+    44 : 'minmag',
+    45 : 'modf',
+    46 : 'nan',
+    47 : 'nextafter',
+    48 : 'pow',
+    49 : 'pown',
+    50 : 'powr',
+    51 : 'remainder',
+    52 : 'remquo',
+    53 : 'rint',
+    54 : 'rootn',
+    55 : 'round',
+    56 : 'rsqrt',
+    57 : 'sin',
+    58 : 'sincos',
+    59 : 'sinh',
+    60 : 'sinpi',
+    61 : 'sqrt',
+    62 : 'tan',
+    63 : 'tanh',
+    64 : 'tanpi',
+    65 : 'tgamma',
+    66 : 'trunc',
+    67 : 'half_cos',
+    68 : 'half_divide',
+    69 : 'half_exp',
+    70 : 'half_exp2',
+    71 : 'half_exp10',
+    72 : 'half_log',
+    73 : 'half_log2',
+    74 : 'half_log10',
+    75 : 'half_powr',
+    76 : 'half_recip',
+    77 : 'half_rsqrt',
+    78 : 'half_sin',
+    79 : 'half_sqrt',
+    80 : 'half_tan',
+    81 : 'native_cos',
+    82 : 'native_divide',
+    83 : 'native_exp',
+    84 : 'native_exp2',
+    85 : 'native_exp10',
+    86 : 'native_log',
+    87 : 'native_log2',
+    88 : 'native_log10',
+    89 : 'native_powr',
+    90 : 'native_recip',
+    91 : 'native_rsqrt',
+    92 : 'native_sin',
+    93 : 'native_sqrt',
+    94 : 'native_tan',
+    141 : 's_abs',
+    142 : 's_abs_diff',
+    143 : 's_add_sat',
+    144 : 'u_add_sat',
+    145 : 's_hadd',
+    146 : 'u_hadd',
+    147 : 's_rhadd',
+    148 : 'u_rhadd',
+    149 : 's_clamp',
+    150 : 'u_clamp',
+    151 : 'clz',
+    152 : 'ctz',
+    153 : 's_mad_hi',
+    154 : 'u_mad_sat',
+    155 : 's_mad_sat',
+    156 : 's_max',
+    157 : 'u_max',
+    158 : 's_min',
+    159 : 'u_min',
+    160 : 's_mul_hi',
+    161 : 'rotate',
+    162 : 's_sub_sat',
+    163 : 'u_sub_sat',
+    164 : 'u_upsample',
+    165 : 's_upsample',
+    166 : 'popcount',
+    167 : 's_mad24',
+    168 : 'u_mad24',
+    169 : 's_mul24',
+    170 : 'u_mul24',
+    201 : 'u_abs',
+    202 : 'u_abs_diff',
+    203 : 'u_mul_hi',
+    204 : 'u_mad_hi',
+    95 : 'fclamp',
+    96 : 'degrees',
+    97 : 'fmax_common',
+    98 : 'fmin_common',
+    99 : 'mix',
+    100 : 'radians',
+    101 : 'step',
+    102 : 'smoothstep',
+    103 : 'sign',
+    104 : 'cross',
+    105 : 'distance',
+    106 : 'length',
+    107 : 'normalize',
+    108 : 'fast_distance',
+    109 : 'fast_length',
+    110 : 'fast_normalize',
+    186 : 'bitselect',
+    187 : 'select',
+    171 : 'vloadn',
+    172 : 'vstoren',
+    173 : 'vload_half',
+    174 : 'vload_halfn',
+    175 : 'vstore_half',
+    176 : 'vstore_half_r',
+    177 : 'vstore_halfn',
+    178 : 'vstore_halfn_r',
+    179 : 'vloada_halfn',
+    180 : 'vstorea_halfn',
+    181 : 'vstorea_halfn_r',
+    182 : 'shuffle',
+    183 : 'shuffle2',
+    184 : 'printf',
+    185 : 'prefetch',
+}
+
+InstructionOperands = {
+    0 : (
+        ('IdRef', None, "'x'"),
+    ),
+    1 : (
+        ('IdRef', None, "'x'"),
+    ),
+    2 : (
+        ('IdRef', None, "'x'"),
+    ),
+    3 : (
+        ('IdRef', None, "'x'"),
+    ),
+    4 : (
+        ('IdRef', None, "'x'"),
+    ),
+    5 : (
+        ('IdRef', None, "'x'"),
+    ),
+    6 : (
+        ('IdRef', None, "'x'"),
+    ),
+    7 : (
+        ('IdRef', None, "'y'"),
+        ('IdRef', None, "'x'"),
+    ),
+    8 : (
+        ('IdRef', None, "'x'"),
+    ),
+    9 : (
+        ('IdRef', None, "'x'"),
+    ),
+    10 : (
+        ('IdRef', None, "'y'"),
+        ('IdRef', None, "'x'"),
+    ),
+    11 : (
+        ('IdRef', None, "'x'"),
+    ),
+    12 : (
+        ('IdRef', None, "'x'"),
+    ),
+    13 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    14 : (
+        ('IdRef', None, "'x'"),
+    ),
+    15 : (
+        ('IdRef', None, "'x'"),
+    ),
+    16 : (
+        ('IdRef', None, "'x'"),
+    ),
+    17 : (
+        ('IdRef', None, "'x'"),
+    ),
+    18 : (
+        ('IdRef', None, "'x'"),
+    ),
+    19 : (
+        ('IdRef', None, "'x'"),
+    ),
+    20 : (
+        ('IdRef', None, "'x'"),
+    ),
+    21 : (
+        ('IdRef', None, "'x'"),
+    ),
+    22 : (
+        ('IdRef', None, "'x'"),
+    ),
+    23 : (
+        ('IdRef', None, "'x'"),
+    ),
+    24 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    25 : (
+        ('IdRef', None, "'x'"),
+    ),
+    26 : (
+        ('IdRef', None, "'a'"),
+        ('IdRef', None, "'b'"),
+        ('IdRef', None, "'c'"),
+    ),
+    27 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    28 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    29 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    30 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'ptr'"),
+    ),
+    31 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'exp'"),
+    ),
+    32 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    33 : (
+        ('IdRef', None, "'x'"),
+    ),
+    34 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'k'"),
+    ),
+    35 : (
+        ('IdRef', None, "'x'"),
+    ),
+    36 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'signp'"),
+    ),
+    37 : (
+        ('IdRef', None, "'x'"),
+    ),
+    38 : (
+        ('IdRef', None, "'x'"),
+    ),
+    39 : (
+        ('IdRef', None, "'x'"),
+    ),
+    40 : (
+        ('IdRef', None, "'x'"),
+    ),
+    41 : (
+        ('IdRef', None, "'x'"),
+    ),
+    42 : (
+        ('IdRef', None, "'a'"),
+        ('IdRef', None, "'b'"),
+        ('IdRef', None, "'c'"),
+    ),
+    43 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    44 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    45 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'iptr'"),
+    ),
+    46 : (
+        ('IdRef', None, "'nancode'"),
+    ),
+    47 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    48 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y"),
+    ),
+    49 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    50 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    51 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    52 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+        ('IdRef', None, "'quo'"),
+    ),
+    53 : (
+        ('IdRef', None, "'x'"),
+    ),
+    54 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    55 : (
+        ('IdRef', None, "'x'"),
+    ),
+    56 : (
+        ('IdRef', None, "'x'"),
+    ),
+    57 : (
+        ('IdRef', None, "'x'"),
+    ),
+    58 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'cosval'"),
+    ),
+    59 : (
+        ('IdRef', None, "'x'"),
+    ),
+    60 : (
+        ('IdRef', None, "'x'"),
+    ),
+    61 : (
+        ('IdRef', None, "'x'"),
+    ),
+    62 : (
+        ('IdRef', None, "'x'"),
+    ),
+    63 : (
+        ('IdRef', None, "'x'"),
+    ),
+    64 : (
+        ('IdRef', None, "'x'"),
+    ),
+    65 : (
+        ('IdRef', None, "'x'"),
+    ),
+    66 : (
+        ('IdRef', None, "'x'"),
+    ),
+    67 : (
+        ('IdRef', None, "'x'"),
+    ),
+    68 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    69 : (
+        ('IdRef', None, "'x'"),
+    ),
+    70 : (
+        ('IdRef', None, "'x'"),
+    ),
+    71 : (
+        ('IdRef', None, "'x'"),
+    ),
+    72 : (
+        ('IdRef', None, "'x'"),
+    ),
+    73 : (
+        ('IdRef', None, "'x'"),
+    ),
+    74 : (
+        ('IdRef', None, "'x'"),
+    ),
+    75 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    76 : (
+        ('IdRef', None, "'x'"),
+    ),
+    77 : (
+        ('IdRef', None, "'x'"),
+    ),
+    78 : (
+        ('IdRef', None, "'x'"),
+    ),
+    79 : (
+        ('IdRef', None, "'x'"),
+    ),
+    80 : (
+        ('IdRef', None, "'x'"),
+    ),
+    81 : (
+        ('IdRef', None, "'x'"),
+    ),
+    82 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    83 : (
+        ('IdRef', None, "'x'"),
+    ),
+    84 : (
+        ('IdRef', None, "'x'"),
+    ),
+    85 : (
+        ('IdRef', None, "'x'"),
+    ),
+    86 : (
+        ('IdRef', None, "'x'"),
+    ),
+    87 : (
+        ('IdRef', None, "'x'"),
+    ),
+    88 : (
+        ('IdRef', None, "'x'"),
+    ),
+    89 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    90 : (
+        ('IdRef', None, "'x'"),
+    ),
+    91 : (
+        ('IdRef', None, "'x'"),
+    ),
+    92 : (
+        ('IdRef', None, "'x'"),
+    ),
+    93 : (
+        ('IdRef', None, "'x'"),
+    ),
+    94 : (
+        ('IdRef', None, "'x'"),
+    ),
+    141 : (
+        ('IdRef', None, "'x'"),
+    ),
+    142 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    143 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    144 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    145 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    146 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    147 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    148 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    149 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'minval'"),
+        ('IdRef', None, "'maxval'"),
+    ),
+    150 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'minval'"),
+        ('IdRef', None, "'maxval'"),
+    ),
+    151 : (
+        ('IdRef', None, "'x'"),
+    ),
+    152 : (
+        ('IdRef', None, "'x'"),
+    ),
+    153 : (
+        ('IdRef', None, "'a'"),
+        ('IdRef', None, "'b'"),
+        ('IdRef', None, "'c'"),
+    ),
+    154 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+        ('IdRef', None, "'z'"),
+    ),
+    155 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+        ('IdRef', None, "'z'"),
+    ),
+    156 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    157 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    158 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    159 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    160 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    161 : (
+        ('IdRef', None, "'v'"),
+        ('IdRef', None, "'i'"),
+    ),
+    162 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    163 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    164 : (
+        ('IdRef', None, "'hi'"),
+        ('IdRef', None, "'lo'"),
+    ),
+    165 : (
+        ('IdRef', None, "'hi'"),
+        ('IdRef', None, "'lo'"),
+    ),
+    166 : (
+        ('IdRef', None, "'x'"),
+    ),
+    167 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+        ('IdRef', None, "'z'"),
+    ),
+    168 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+        ('IdRef', None, "'z'"),
+    ),
+    169 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    170 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    201 : (
+        ('IdRef', None, "'x'"),
+    ),
+    202 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    203 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    204 : (
+        ('IdRef', None, "'a'"),
+        ('IdRef', None, "'b'"),
+        ('IdRef', None, "'c'"),
+    ),
+    95 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'minval'"),
+        ('IdRef', None, "'maxval'"),
+    ),
+    96 : (
+        ('IdRef', None, "'radians'"),
+    ),
+    97 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    98 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+    ),
+    99 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+        ('IdRef', None, "'a'"),
+    ),
+    100 : (
+        ('IdRef', None, "'degrees'"),
+    ),
+    101 : (
+        ('IdRef', None, "'edge'"),
+        ('IdRef', None, "'x'"),
+    ),
+    102 : (
+        ('IdRef', None, "'edge0'"),
+        ('IdRef', None, "'edge1'"),
+        ('IdRef', None, "'x'"),
+    ),
+    103 : (
+        ('IdRef', None, "'x'"),
+    ),
+    104 : (
+        ('IdRef', None, "'p0'"),
+        ('IdRef', None, "'p1'"),
+    ),
+    105 : (
+        ('IdRef', None, "'p0'"),
+        ('IdRef', None, "'p1'"),
+    ),
+    106 : (
+        ('IdRef', None, "'p'"),
+    ),
+    107 : (
+        ('IdRef', None, "'p'"),
+    ),
+    108 : (
+        ('IdRef', None, "'p0'"),
+        ('IdRef', None, "'p1'"),
+    ),
+    109 : (
+        ('IdRef', None, "'p'"),
+    ),
+    110 : (
+        ('IdRef', None, "'p'"),
+    ),
+    186 : (
+        ('IdRef', None, "'a'"),
+        ('IdRef', None, "'b'"),
+        ('IdRef', None, "'c'"),
+    ),
+    187 : (
+        ('IdRef', None, "'a'"),
+        ('IdRef', None, "'b'"),
+        ('IdRef', None, "'c'"),
+    ),
+    171 : (
+        ('IdRef', None, "'offset'"),
+        ('IdRef', None, "'p'"),
+        ('LiteralInteger', None, "'n'"),
+    ),
+    172 : (
+        ('IdRef', None, "'data'"),
+        ('IdRef', None, "'offset'"),
+        ('IdRef', None, "'p'"),
+    ),
+    173 : (
+        ('IdRef', None, "'offset'"),
+        ('IdRef', None, "'p'"),
+    ),
+    174 : (
+        ('IdRef', None, "'offset'"),
+        ('IdRef', None, "'p'"),
+        ('LiteralInteger', None, "'n'"),
+    ),
+    175 : (
+        ('IdRef', None, "'data'"),
+        ('IdRef', None, "'offset'"),
+        ('IdRef', None, "'p'"),
+    ),
+    176 : (
+        ('IdRef', None, "'data'"),
+        ('IdRef', None, "'offset'"),
+        ('IdRef', None, "'p'"),
+        ('FPRoundingMode', None, "'mode'"),
+    ),
+    177 : (
+        ('IdRef', None, "'data'"),
+        ('IdRef', None, "'offset'"),
+        ('IdRef', None, "'p'"),
+    ),
+    178 : (
+        ('IdRef', None, "'data'"),
+        ('IdRef', None, "'offset'"),
+        ('IdRef', None, "'p'"),
+        ('FPRoundingMode', None, "'mode'"),
+    ),
+    179 : (
+        ('IdRef', None, "'offset'"),
+        ('IdRef', None, "'p'"),
+        ('LiteralInteger', None, "'n'"),
+    ),
+    180 : (
+        ('IdRef', None, "'data'"),
+        ('IdRef', None, "'offset'"),
+        ('IdRef', None, "'p'"),
+    ),
+    181 : (
+        ('IdRef', None, "'data'"),
+        ('IdRef', None, "'offset'"),
+        ('IdRef', None, "'p'"),
+        ('FPRoundingMode', None, "'mode'"),
+    ),
+    182 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'shuffle mask'"),
+    ),
+    183 : (
+        ('IdRef', None, "'x'"),
+        ('IdRef', None, "'y'"),
+        ('IdRef', None, "'shuffle mask'"),
+    ),
+    184 : (
+        ('IdRef', None, "'format'"),
+        ('IdRef', '*', "'additional arguments'"),
+    ),
+    185 : (
+        ('IdRef', None, "'ptr'"),
+        ('IdRef', None, "'num elements'"),
+    ),
+}
+
+OperandKindCategories = {
+}
+
+OperandKinds = {
+}
+
+OperandKindNames = {
+}
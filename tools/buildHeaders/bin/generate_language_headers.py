@@ -25,7 +25,7 @@
 # TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
 # MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
 
-"""Generates a C language headers from a SPIR-V JSON grammar file"""
+"""Generates C language headers and Python modules from a SPIR-V JSON grammar file"""
 
 import errno
 import json
@@ -126,7 +126,7 @@ class LangGenerator:
         parts.append('')
 
         guard = 'SPIRV_UNIFIED1_{}_H_'.format(grammar.name)
-        if self.uses_guards:
+        if self.uses_guards():
             parts.append('#ifndef {}'.format(guard))
             parts.append('#define {}'.format(guard))
         parts.append('')
@@ -158,7 +158,7 @@ class LangGenerator:
 
         parts.append(self.cpp_guard_postamble())
 
-        if self.uses_guards:
+        if self.uses_guards():
             parts.append('#endif // {}'.format(guard))
 
         # Ensre the file ends in an end of line
@@ -197,6 +197,116 @@ class CGenerator(CLikeGenerator):
     pass
 
 
+class PythonGenerator(LangGenerator):
+    """Generates an importable Python module with forward and reverse maps
+    for the instructions and operand kinds of the grammar, and the operand
+    list of each instruction, so that decoders need not parse the JSON."""
+
+    def comment_prefix(self):
+        return "# "
+
+    def const_definition(self, prefix, var, value):
+        return '{} = {}'.format(var, value)
+
+    def literal(self, value):
+        # Grammar values are either numbers or strings holding hex literals.
+        return value if isinstance(value, str) else str(value)
+
+    def forward_and_reverse(self, var, reverse_var, entries):
+        """Returns the lines defining a name to value dict called var and
+        the matching value to name dict called reverse_var, which keeps the
+        first name seen for each value."""
+        parts = ['{} = {}'.format(var, '{')]
+        for name, value in entries:
+            parts.append("    '{}' : {},".format(name, self.literal(value)))
+        parts.append('}')
+        parts.append('')
+
+        seen = set()
+        parts.append('{} = {}'.format(reverse_var, '{'))
+        for name, value in entries:
+            if int(self.literal(value), 0) not in seen:
+                seen.add(int(self.literal(value), 0))
+                parts.append("    {} : '{}',".format(self.literal(value), name))
+        parts.append('}')
+        parts.append('')
+        return parts
+
+    def operand(self, operand):
+        return '({!r}, {!r}, {!r})'.format(
+            operand['kind'], operand.get('quantifier'), operand.get('name'))
+
+    def generate(self, grammar):
+        """Returns the text of the Python module for the given grammar"""
+
+        parts = []
+        if grammar.copyright:
+            parts.extend(["{}{}".format(self.comment_prefix(), f).rstrip() for f in grammar.copyright])
+        parts.append('')
+        parts.append('# Instruction and operand kind tables for the {} extended instruction set.'.format(grammar.name))
+        parts.append('# Operands are (kind, quantifier, name) tuples.')
+        parts.append('')
+
+        parts.append(self.const_definition(grammar.name, 'Name', repr(grammar.name)))
+        if grammar.version:
+            parts.append(self.const_definition(grammar.name, 'Version', grammar.version))
+        if grammar.revision is not None:
+            parts.append(self.const_definition(grammar.name, 'Revision', grammar.revision))
+        parts.append('')
+
+        parts.extend(self.forward_and_reverse(
+            'Instructions', 'InstructionNames', [(i['opname'], i['opcode']) for i in grammar.instructions]))
+
+        parts.append('InstructionOperands = {')
+        for inst in grammar.instructions:
+            operands = [self.operand(o) for o in inst.get('operands', [])]
+            if not operands:
+                parts.append('    {} : (),'.format(inst['opcode']))
+                continue
+            parts.append('    {} : ('.format(inst['opcode']))
+            for o in operands:
+                parts.append('        {},'.format(o))
+            parts.append('    ),')
+        parts.append('}')
+        parts.append('')
+
+        parts.append('OperandKindCategories = {')
+        for kind in grammar.operand_kinds:
+            parts.append("    '{}' : '{}',".format(kind['kind'], kind['category']))
+        parts.append('}')
+        parts.append('')
+
+        parts.append('OperandKinds = {')
+        for kind in grammar.operand_kinds:
+            parts.append("    '{}' : {}".format(kind['kind'], '{'))
+            for e in kind.get('enumerants', []):
+                parts.append("        '{}' : {},".format(e['enumerant'], self.literal(e['value'])))
+            parts.append('    },')
+        parts.append('}')
+        parts.append('')
+
+        parts.append('OperandKindNames = {')
+        for kind in grammar.operand_kinds:
+            parts.append("    '{}' : {}".format(kind['kind'], '{'))
+            seen = set()
+            for e in kind.get('enumerants', []):
+                value = int(self.literal(e['value']), 0)
+                if value not in seen:
+                    seen.add(value)
+                    parts.append("        {} : '{}',".format(self.literal(e['value']), e['enumerant']))
+            parts.append('    },')
+        parts.append('}')
+        parts.append('')
+
+        return '\n'.join(parts)
+
+
+GENERATORS = {
+    'c': (CGenerator, '.h'),
+    'python': (PythonGenerator, '.py'),
+}
+
+
 def main():
     import argparse
     parser = argparse.ArgumentParser(description='Generate language headers from a JSON grammar')
@@ -210,6 +320,9 @@ def main():
     parser.add_argument('--extinst-output-base', metavar='<path>',
                         type=str, required=True,
                         help='Basename of the language-specific output file.')
+    parser.add_argument('--extinst-language', choices=sorted(GENERATORS),
+                        action='append',
+                        help='Language of an output file; may be repeated. Defaults to c.')
     args = parser.parse_args()
 
     with open(args.extinst_grammar) as json_file:
@@ -234,8 +347,10 @@ def main():
                                  version = version,
                                  revision = grammar_json['revision'])
         make_path_to_file(args.extinst_output_base)
-        with open(args.extinst_output_base + '.h', 'w') as f:
-            f.write(CGenerator().generate(grammar))
+        for language in args.extinst_language or ['c']:
+            generator, suffix = GENERATORS[language]
+            with open(args.extinst_output_base + suffix, 'w') as f:
+                f.write(generator().generate(grammar))
 
 
 if __name__ == '__main__':
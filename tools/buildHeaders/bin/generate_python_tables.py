@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Generates Python table modules derived from the generated spirv.py"""
+
+import argparse
+import importlib.util
+import keyword
+
+
+def load_spirv_py(path):
+    """Imports a generated spirv.py and returns the module together with
+    the comment block at the top of the file."""
+    spec = importlib.util.spec_from_file_location('spirv_py_source', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    comments = []
+    with open(path) as source:
+        for line in source:
+            if not line.startswith('#') and line.strip():
+                break
+            comments.append(line.rstrip('\n').rstrip())
+    return module, comments
+
+
+class PythonTablesGenerator:
+    """Base class for the modules generated from a spv dictionary"""
+
+    description = ''
+
+    def __init__(self, spv, comments):
+        self.spv = spv
+        self.comments = comments
+
+    def constants(self):
+        """Returns the (name, value) pairs of the scalar spv entries"""
+        return [(k, v) for k, v in self.spv.items() if not isinstance(v, dict)]
+
+    def tables(self):
+        """Returns the (name, dict) pairs of the enumeration spv entries"""
+        return [(k, v) for k, v in self.spv.items() if isinstance(v, dict)]
+
+    def header(self):
+        parts = list(self.comments)
+        while parts and not parts[-1]:
+            parts.pop()
+        parts.append('')
+        parts.extend('# ' + line if line else '#'
+                     for line in self.description.strip('\n').split('\n'))
+        parts.append('')
+        return parts
+
+    def generate(self):
+        """Returns the text of the generated module"""
+        raise NotImplementedError
+
+
+class LazyTablesGenerator(PythonTablesGenerator):
+    """Generates a variant of spirv.py whose enumerations are built on
+    first access.
+
+    Each enumeration is stored as a single string of name/value pairs, which
+    is much cheaper to unmarshal than a dict display.  The dict for a
+    category is parsed out of its string the first time it is looked up."""
+
+    description = """
+This file is automatically generated from spirv.py by
+tools/buildHeaders/bin/generate_python_tables.py.
+
+Lazily built variant of spirv.py.  The spv dictionary has the same keys and
+values, but each enumeration is only turned into a dict the first time it is
+looked up, so importing this module costs far less than importing spirv.py.
+"""
+
+    body = '''
+class LazySpv(dict):
+    """The spv dictionary, building each enumeration on first access.
+
+    Until every enumeration is built, _built is False and the keys come
+    from _order.  Methods that need the whole dictionary, and those that
+    change it, build the rest first and then act on the plain dict.
+    """
+
+    __slots__ = ('_built',)
+
+    def __init__(self, constants):
+        dict.__init__(self, constants)
+        self._built = False
+
+    def __missing__(self, key):
+        if self._built:
+            raise KeyError(key)
+        words = _tables[key].split()
+        table = dict(zip(words[0::2], map(int, words[1::2])))
+        dict.__setitem__(self, key, table)
+        return table
+
+    def _materialize(self):
+        if not self._built:
+            items = [(key, self[key]) for key in _order]
+            dict.clear(self)
+            dict.update(self, items)
+            self._built = True
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or (not self._built and key in _tables)
+
+    def __iter__(self):
+        return dict.__iter__(self) if self._built else iter(_order)
+
+    def __len__(self):
+        return dict.__len__(self) if self._built else len(_order)
+
+    def __repr__(self):
+        self._materialize()
+        return dict.__repr__(self)
+
+    def __eq__(self, other):
+        self._materialize()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        self._materialize()
+        return dict.__ne__(self, other)
+
+    __hash__ = None
+
+    def __reduce__(self):
+        self._materialize()
+        return (dict, (dict(self.items()),))
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        self._materialize()
+        return dict.keys(self)
+
+    def values(self):
+        self._materialize()
+        return dict.values(self)
+
+    def items(self):
+        self._materialize()
+        return dict.items(self)
+
+    def copy(self):
+        self._materialize()
+        return dict(self.items())
+
+    def __setitem__(self, key, value):
+        self._materialize()
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        self._materialize()
+        dict.__delitem__(self, key)
+
+    def pop(self, key, *default):
+        self._materialize()
+        return dict.pop(self, key, *default)
+
+    def popitem(self):
+        self._materialize()
+        return dict.popitem(self)
+
+    def setdefault(self, key, default=None):
+        self._materialize()
+        return dict.setdefault(self, key, default)
+
+    def update(self, *args, **kwargs):
+        self._materialize()
+        dict.update(self, *args, **kwargs)
+
+    def clear(self):
+        self._materialize()
+        dict.clear(self)
+
+
+spv = LazySpv(_constants)
+'''
+
+    def generate(self):
+        parts = self.header()
+
+        parts.append('_constants = {')
+        for name, value in self.constants():
+            parts.append("    '{}' : {},".format(name, value))
+        parts.append('}')
+        parts.append('')
+
+        # Adjacent string literals are joined by the compiler, so each
+        # enumeration is still a single constant, one pair per line.
+        parts.append('_tables = {')
+        for name, table in self.tables():
+            if not table:
+                parts.append("    '{}' : '',".format(name))
+                continue
+            parts.append("    '{}' : (".format(name))
+            for k, v in table.items():
+                parts.append("        '{} {} '".format(k, v))
+            parts.append('    ),')
+        parts.append('}')
+        parts.append('')
+
+        parts.append('_order = (')
+        for name in self.spv:
+            parts.append("    '{}',".format(name))
+        parts.append(')')
+        parts.append('')
+        parts.append(self.body)
+
+        return '\n'.join(parts)
+
+
+class NamespaceGenerator(PythonTablesGenerator):
+    """Generates a module with one class per enumeration, so that tokens can
+    be read as attributes, e.g. Op.OpLoad, instead of through two dict
+    lookups."""
+
+    description = """
+This file is automatically generated from spirv.py by
+tools/buildHeaders/bin/generate_python_tables.py.
+
+Attribute-style variant of spirv.py.  The scalar tokens are module-level
+constants and each enumeration is a class whose attributes are its tokens,
+e.g. Op.OpLoad or Decoration.Binding.  Tokens that are Python keywords get a
+trailing underscore, e.g. SamplerAddressingMode.None_.  The classes can be
+bound to locals once before a hot loop.
+"""
+
+    def identifier(self, name):
+        if keyword.iskeyword(name):
+            return name + '_'
+        return name
+
+    # Matches the formatting of the scalar tokens in spirv.py
+    constant_formats = {
+        'MagicNumber': '0x{:08x}',
+        'Version': '0x{:08x}',
+        'OpCodeMask': '0x{:04x}',
+    }
+
+    def value(self, name, value):
+        if name in self.constant_formats:
+            return self.constant_formats[name].format(value)
+        if name.endswith('Mask'):
+            return '0x{:08x}'.format(value)
+        return str(value)
+
+    def generate(self):
+        parts = self.header()
+
+        for name, value in self.constants():
+            parts.append('{} = {}'.format(name, self.value(name, value)))
+        parts.append('')
+
+        for name, table in self.tables():
+            parts.append('')
+            parts.append('class {}:'.format(name))
+            parts.append('    __slots__ = ()')
+            for k, v in table.items():
+                parts.append('    {} = {}'.format(self.identifier(k), self.value(name, v)))
+            parts.append('')
+
+        return '\n'.join(parts)
+
+
+GENERATORS = {
+    'lazy': LazyTablesGenerator,
+    'namespace': NamespaceGenerator,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate Python table modules from spirv.py')
+
+    parser.add_argument('--spirv-py', metavar='<path>',
+                        type=str, required=True,
+                        help='input generated spirv.py file')
+    parser.add_argument('--kind', choices=sorted(GENERATORS),
+                        type=str, required=True,
+                        help='which module to generate')
+    parser.add_argument('--output', metavar='<path>',
+                        type=str, required=True,
+                        help='output Python file')
+    args = parser.parse_args()
+
+    module, comments = load_spirv_py(args.spirv_py)
+    generator = GENERATORS[args.kind](module.spv, comments)
+    with open(args.output, 'w', newline='\n') as f:
+        f.write(generator.generate())
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-"""Generate C headers for certain extended instruction sets"""
+"""Generate C headers and Python modules for certain extended instruction sets"""
 
 import subprocess
 import os
@@ -7,15 +7,19 @@ import os
 # Assume we are running from the tools/buildHeaders directory
 os.chdir('../../include/spirv/unified1')
 
-def mk_extinst(name, grammar_file):
-  """Generate one C header from a grammar"""
+SUFFIXES = {'c': '.h', 'python': '.py'}
+
+def mk_extinst(name, grammar_file, languages=('c', 'python')):
+  """Generate one C header and/or Python module from a grammar"""
   script = '../../../tools/buildHeaders/bin/generate_language_headers.py'
   subprocess.check_call(['python3',
                          script,
                          '--extinst-name=' + name,
                          '--extinst-grammar=' + grammar_file,
-                         '--extinst-output-base=' + name])
-  subprocess.check_call(['dos2unix', name + '.h'])
+                         '--extinst-output-base=' + name] +
+                        ['--extinst-language=' + l for l in languages])
+  for l in languages:
+    subprocess.check_call(['dos2unix', name + SUFFIXES[l]])
 
 
 mk_extinst('DebugInfo', 'extinst.debuginfo.grammar.json')
@@ -28,3 +32,8 @@ mk_extinst('NonSemanticDebugPrintf', 'extinst.nonsemantic.debugprintf.grammar.js
 mk_extinst('NonSemanticClspvReflection', 'extinst.nonsemantic.clspvreflection.grammar.json')
 mk_extinst('NonSemanticDebugBreak', 'extinst.nonsemantic.debugbreak.grammar.json')
 mk_extinst('NonSemanticVkspReflection', 'extinst.nonsemantic.vkspreflection.grammar.json')
+
+# The C headers for these are maintained manually.
+mk_extinst('GLSL_std_450', 'extinst.glsl.std.450.grammar.json', languages=['python'])
+mk_extinst('OpenCL_std', 'extinst.opencl.std.100.grammar.json', languages=['python'])
+mk_extinst('NonSemanticShaderDebugInfo100', 'extinst.nonsemantic.shader.debuginfo.100.grammar.json', languages=['python'])
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Measures the throughput of the text assembler in instructions/s.
+
+The text is the disassembly of a synthetic module, with numbered ids and
+with friendly names.
+"""
+
+import argparse
+import io
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from spirv_headers.assembler import Assembler
+from spirv_headers.disassembler import disassemble
+from synthetic import make_module
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=200000,
+                        help='number of instructions in the module body')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='number of runs; the fastest one is reported')
+    args = parser.parse_args()
+
+    data = make_module(args.count).tobytes()
+    assembler = Assembler()
+    for label, friendly_names in (('numbered ids', False), ('friendly names', True)):
+        text = io.StringIO()
+        count = disassemble(data, text, friendly_names=friendly_names)
+        text = text.getvalue()
+        assert len(assembler.assemble(text)) == len(data)
+        best = min(timeit.repeat(lambda: assembler.assemble(text), number=1,
+                                 repeat=args.repeat))
+        print('  {:<15} {:7.2f} MB/s of text {:9.0f} instructions/s'.format(
+            label, len(text) / best / 1e6, count / best))
+
+
+if __name__ == '__main__':
+    main()
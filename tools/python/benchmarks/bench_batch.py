@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Measures how batch.run scales with the number of worker processes.
+
+A directory of synthetic modules of varying sizes is decoded instruction by
+instruction with 1, 2, 4, ... processes, up to the number of CPUs.
+"""
+
+import argparse
+import os.path
+import random
+import shutil
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from spirv_headers import batch
+from spirv_headers.decoders import load_decoders
+from spirv_headers.module import Module
+from synthetic import make_module
+
+
+def decode_module(path):
+    """Decodes every instruction and returns the number of operands"""
+    decoders = load_decoders()
+    operands = 0
+    with Module.open(path) as module:
+        for offset, opcode, word_count, words in module.instructions():
+            operands += len(decoders[opcode](words))
+            words.release()
+    return operands
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--files', type=int, default=400,
+                        help='number of modules to process')
+    parser.add_argument('--count', type=int, default=2000,
+                        help='mean number of instructions per module')
+    parser.add_argument('--max-processes', type=int, default=os.cpu_count() or 1,
+                        help='largest number of processes to try')
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    directory = tempfile.mkdtemp()
+    try:
+        total = 0
+        for i in range(args.files):
+            path = os.path.join(directory, '{:05}.spv'.format(i))
+            with open(path, 'wb') as f:
+                f.write(make_module(rng.randrange(args.count // 4, args.count * 7 // 4), i))
+            total += os.path.getsize(path)
+        paths = list(batch.find_modules([directory]))
+        batch.preload()
+        print('{} modules, {:.1f} MiB, {} CPUs'.format(
+            len(paths), total / 2**20, os.cpu_count()))
+
+        processes = 1
+        baseline = None
+        expected = None
+        while processes <= args.max_processes:
+            start = timeit.default_timer()
+            results = list(batch.run(decode_module, paths, processes))
+            elapsed = timeit.default_timer() - start
+            assert all(result.error is None for result in results)
+            assert [result.path for result in results] == paths
+            values = [result.value for result in results]
+            assert expected is None or values == expected
+            expected = values
+            baseline = baseline or elapsed
+            print('  {:3} processes {:8.1f} files/s {:7.2f} MB/s  speedup {:.2f}'.format(
+                processes, len(paths) / elapsed, total / elapsed / 1e6, baseline / elapsed))
+            processes *= 2
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Measures building many small modules with ModuleBuilder.
+
+Each permutation is a compute shader adding a different set of constants.
+It is built once with ModuleBuilder and once with the usual approach of a
+list of per-instruction word lists per section, joined at the end.  The
+peak memory of holding all the modules is measured with tracemalloc.
+"""
+
+import argparse
+import array
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from spirv_headers.binary import MAGIC_NUMBER, WORD_COUNT_SHIFT, encode_string
+from spirv_headers.builder import ModuleBuilder
+from spirv_headers.layout import SECTIONS
+from synthetic import Op, spv
+
+MAIN = encode_string('main')
+
+
+def build(permutation, body):
+    """Returns a module built with ModuleBuilder"""
+    b = ModuleBuilder()
+    emit, define = b.emit, b.define
+    main = b.new_id()
+    emit(Op['OpCapability'], spv['Capability']['Shader'])
+    emit(Op['OpMemoryModel'], 0, 1)
+    b.emit_words(Op['OpEntryPoint'], [spv['ExecutionModel']['GLCompute'], main] + MAIN.tolist())
+    void = define(Op['OpTypeVoid'])
+    func = define(Op['OpTypeFunction'], void)
+    uint = define(Op['OpTypeInt'], 32, 0)
+    ptr = define(Op['OpTypePointer'], spv['StorageClass']['Function'], uint)
+    emit(Op['OpFunction'], void, main, 0, func)
+    define(Op['OpLabel'])
+    variable = define(Op['OpVariable'], ptr, spv['StorageClass']['Function'])
+    for i in range(body):
+        # The constants land in the globals section.
+        value = define(Op['OpConstant'], uint, permutation + i)
+        loaded = define(Op['OpLoad'], uint, variable)
+        emit(Op['OpStore'], variable, define(Op['OpIAdd'], uint, loaded, value))
+    emit(Op['OpReturn'])
+    emit(Op['OpFunctionEnd'])
+    return b.to_bytes()
+
+
+def build_lists(permutation, body):
+    """Returns the same module built from per-instruction lists"""
+    sections = [[] for section in SECTIONS]
+    next_id = [1]
+
+    def new_id():
+        next_id[0] += 1
+        return next_id[0] - 1
+
+    def emit(section, opcode, *operands):
+        sections[SECTIONS.index(section)].append(
+            [(len(operands) + 1) << WORD_COUNT_SHIFT | opcode] + list(operands))
+
+    main = new_id()
+    emit('capabilities', Op['OpCapability'], spv['Capability']['Shader'])
+    emit('memory_model', Op['OpMemoryModel'], 0, 1)
+    emit('entry_points', Op['OpEntryPoint'], spv['ExecutionModel']['GLCompute'], main,
+         *MAIN.tolist())
+    void, func, uint, ptr = new_id(), new_id(), new_id(), new_id()
+    emit('globals', Op['OpTypeVoid'], void)
+    emit('globals', Op['OpTypeFunction'], func, void)
+    emit('globals', Op['OpTypeInt'], uint, 32, 0)
+    emit('globals', Op['OpTypePointer'], ptr, spv['StorageClass']['Function'], uint)
+    emit('function_definitions', Op['OpFunction'], void, main, 0, func)
+    emit('function_definitions', Op['OpLabel'], new_id())
+    variable = new_id()
+    emit('function_definitions', Op['OpVariable'], ptr, variable, spv['StorageClass']['Function'])
+    for i in range(body):
+        value, loaded, total = new_id(), new_id(), new_id()
+        emit('globals', Op['OpConstant'], uint, value, permutation + i)
+        emit('function_definitions', Op['OpLoad'], uint, loaded, variable)
+        emit('function_definitions', Op['OpIAdd'], uint, total, loaded, value)
+        emit('function_definitions', Op['OpStore'], variable, total)
+    emit('function_definitions', Op['OpReturn'])
+    emit('function_definitions', Op['OpFunctionEnd'])
+    words = array.array('I', [MAGIC_NUMBER, spv['Version'], 0, next_id[0], 0])
+    for section in sections:
+        for instruction in section:
+            words.extend(instruction)
+    return words.tobytes()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--permutations', type=int, default=10000,
+                        help='number of modules built')
+    parser.add_argument('--body', type=int, default=32,
+                        help='number of constants added by each module')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='number of runs; the fastest one is reported')
+    args = parser.parse_args()
+
+    assert build(0, args.body) == build_lists(0, args.body)
+    instructions = 12 + 4 * args.body
+    print('{} modules of {} instructions'.format(args.permutations, instructions))
+    for label, func in (('ModuleBuilder', build), ('instruction lists', build_lists)):
+        best = min(timeit.repeat(
+            lambda: [func(i, args.body) for i in range(args.permutations)],
+            number=1, repeat=args.repeat))
+        # Only the last module is alive at a time: the peak is the cost of
+        # building one, not of holding them all.
+        tracemalloc.start()
+        func(0, args.body * 64)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print('  {:<18} {:8.0f} modules/s {:10.0f} instructions/s, '
+              '{:7.1f} KiB peak for {} instructions'.format(
+                  label, args.permutations / best, args.permutations * instructions / best,
+                  peak / 1024, 12 + 4 * 64 * args.body))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Compares the cost of reading a token from spirv.py and spirv_ns.py"""
+
+import argparse
+import os.path
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from spirv_headers.tables import load_module
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=1000000,
+                        help='number of accesses per run')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='number of runs; the fastest one is reported')
+    args = parser.parse_args()
+
+    namespace = {
+        'spv': load_module('spirv').spv,
+        'ns': load_module('spirv_ns'),
+        'count': args.count,
+    }
+    cases = (
+        ("spv['Op']['OpLoad']",
+         "for _ in range(count): spv['Op']['OpLoad']"),
+        ("Op = spv['Op']; Op['OpLoad']",
+         "Op = spv['Op']\nfor _ in range(count): Op['OpLoad']"),
+        ('ns.Op.OpLoad',
+         'for _ in range(count): ns.Op.OpLoad'),
+        ('Op = ns.Op; Op.OpLoad',
+         'Op = ns.Op\nfor _ in range(count): Op.OpLoad'),
+        ('OpLoad = ns.Op.OpLoad',
+         'OpLoad = ns.Op.OpLoad\nfor _ in range(count): OpLoad'),
+        ('empty loop',
+         'for _ in range(count): pass'),
+    )
+
+    # Run the statements inside a function so that bound names are locals.
+    for name, body in cases:
+        source = 'def run():\n' + ''.join('    ' + line + '\n' for line in body.split('\n'))
+        exec(source, namespace)
+        best = min(timeit.repeat(namespace['run'], number=1, repeat=args.repeat))
+        print('{:<32} {:6.1f} ns/access'.format(name, best / args.count * 1e9))
+
+
+if __name__ == '__main__':
+    main()
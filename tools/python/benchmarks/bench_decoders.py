@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Compares the compiled operand decoders with a generic interpreter.
+
+The interpreter walks the grammar's operand list of each instruction and
+dispatches on the kind of every operand, as a hand-written decoder would.
+Both produce the same (kind, value) pairs.
+"""
+
+import argparse
+import os.path
+import shutil
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from spirv_headers import decoders as decoders_module
+from spirv_headers.binary import decode_string, iter_module
+from spirv_headers.decoders import decode_number, load_decoders
+from spirv_headers.grammar import instructions, operand_kinds
+from synthetic import make_module
+
+
+def interpret(kinds, kind, words, i, out):
+    """Appends the pairs of one operand at words[i] and returns the offset
+    of the next one."""
+    operand_kind = kinds.get(kind)
+    category = operand_kind.category if operand_kind else 'Literal'
+    if kind == 'LiteralString':
+        text, i = decode_string(words, i)
+        out.append((kind, text))
+        return i
+    if kind == 'LiteralContextDependentNumber':
+        out.append((kind, decode_number(words, i)))
+        return len(words)
+    if category == 'Composite':
+        for base in operand_kind.bases:
+            i = interpret(kinds, base, words, i, out)
+        return i
+    value = words[i]
+    out.append((kind, value))
+    i += 1
+    if category == 'BitEnum':
+        for bit, parameters in sorted(operand_kind.parameters.items()):
+            if value & bit:
+                for parameter in parameters:
+                    i = interpret(kinds, parameter, words, i, out)
+    elif category == 'ValueEnum':
+        for parameter in operand_kind.parameters.get(value, ()):
+            i = interpret(kinds, parameter, words, i, out)
+    return i
+
+
+def interpret_instruction(kinds, inst, words):
+    out = []
+    i = 0
+    for operand in inst.operands:
+        if operand.quantifier is None:
+            i = interpret(kinds, operand.kind, words, i, out)
+        elif operand.quantifier == '?':
+            if i < len(words):
+                i = interpret(kinds, operand.kind, words, i, out)
+        else:
+            while i < len(words):
+                i = interpret(kinds, operand.kind, words, i, out)
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=200000,
+                        help='number of instructions in the module body')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='number of runs; the fastest one is reported')
+    args = parser.parse_args()
+
+    data = make_module(args.count).tobytes()
+    kinds = operand_kinds()
+    grammar = {}
+    for inst in instructions():
+        grammar.setdefault(inst.opcode, inst)
+    module = [(opcode, operands) for offset, opcode, word_count, operands in iter_module(data)]
+
+    cache_dir = tempfile.mkdtemp()
+    try:
+        start = timeit.default_timer()
+        load_decoders(cache_dir=cache_dir)
+        generate = timeit.default_timer() - start
+        decoders_module._decoders_cache.clear()
+        start = timeit.default_timer()
+        decoders = load_decoders(cache_dir=cache_dir)
+        load = timeit.default_timer() - start
+    finally:
+        shutil.rmtree(cache_dir)
+
+    def generic():
+        return [interpret_instruction(kinds, grammar[opcode], operands)
+                for opcode, operands in module]
+
+    def compiled():
+        return [decoders[opcode](operands) for opcode, operands in module]
+
+    assert generic() == compiled()
+    print('{} instructions'.format(len(module)))
+    print('  generating decoders   {:8.1f} ms'.format(generate * 1e3))
+    print('  loading cached ones   {:8.1f} ms'.format(load * 1e3))
+    for label, func in (('generic interpreter', generic), ('compiled decoders', compiled)):
+        best = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        print('  {:<20} {:8.1f} ms {:7.1f} ns/instruction'.format(
+            label, best * 1e3, best / len(module) * 1e9))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Measures the type and constant deduplication pass.
+
+The synthetic module declares its float type twice and its constants with
+either, drawing from 16 values, so most constants are duplicates once the
+types are merged.  The size saved and the time taken are reported.
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from spirv_headers.dedup import dedup
+from synthetic import make_module
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=200000,
+                        help='number of instructions in the module body')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='number of runs; the fastest one is reported')
+    args = parser.parse_args()
+
+    data = make_module(args.count).tobytes()
+    result = dedup(data)
+    print('{} instructions removed, {} -> {} bytes ({:.1f}% saved)'.format(
+        result.removed, result.old_size, result.new_size,
+        100 * (result.old_size - result.new_size) / result.old_size))
+    best = min(timeit.repeat(lambda: dedup(data), number=1, repeat=args.repeat))
+    print('  dedup {:8.1f} ms {:7.1f} MB/s'.format(best * 1e3, len(data) / best / 1e6))
+
+
+if __name__ == '__main__':
+    main()
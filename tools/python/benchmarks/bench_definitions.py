@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Compares a dict of result id definitions with DefinitionTable.
+
+Reports the time to build each from a module and the memory it holds, as
+measured by tracemalloc.
+"""
+
+import argparse
+import os.path
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from spirv_headers.binary import iter_module
+from spirv_headers.grammar import result_id_positions
+from spirv_headers.ids import DefinitionTable
+from synthetic import make_module
+
+
+def definition_dict(data):
+    positions = result_id_positions()
+    definitions = {}
+    for offset, opcode, word_count, operands in iter_module(data):
+        position = positions.get(opcode)
+        if position is not None:
+            definitions[operands[position]] = offset
+    return definitions
+
+
+def measure(func, data):
+    """Returns the bytes still allocated by the result of func(data)"""
+    tracemalloc.start()
+    result = func(data)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=1000000,
+                        help='number of instructions in the module body')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='number of runs; the fastest one is reported')
+    args = parser.parse_args()
+
+    data = make_module(args.count).tobytes()
+    table = DefinitionTable.from_module(data)
+    assert definition_dict(data) == {i: table[i] for i in table.ids()}
+    print('{} ids'.format(len(table)))
+    for label, func in (('dict', definition_dict),
+                        ('DefinitionTable', DefinitionTable.from_module)):
+        best = min(timeit.repeat(lambda: func(data), number=1, repeat=args.repeat))
+        size = measure(func, data)
+        print('  {:<16} {:8.1f} ms {:8.1f} MiB {:6.1f} bytes/id'.format(
+            label, best * 1e3, size / 2**20, size / len(table)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Compares def-use chains held as per-id lists with the DefUse CSR layout.
+
+Both are built from the same uses; the memory each layout holds once built
+is measured with tracemalloc, and iterating over the users of every id is
+timed.
+"""
+
+import argparse
+import os.path
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from spirv_headers.ids import DefUse
+from synthetic import make_module
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=1000000,
+                        help='number of instructions in the module body')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='number of runs; the fastest one is reported')
+    args = parser.parse_args()
+
+    data = make_module(args.count).tobytes()
+    start = timeit.default_timer()
+    chains = DefUse.from_module(data)
+    build = timeit.default_timer() - start
+
+    tracemalloc.start()
+    lists = {}
+    for result_id in range(len(chains)):
+        users = chains.users_of(result_id)
+        if len(users):
+            lists[result_id] = users.tolist()
+        users.release()
+    lists_size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    csr_size = chains.starts.itemsize * len(chains.starts) + chains.users.itemsize * len(chains.users)
+
+    def iterate_lists():
+        total = 0
+        for users in lists.values():
+            for user in users:
+                total += user
+        return total
+
+    def iterate_csr():
+        # The rows are contiguous: visiting every use is one flat scan.
+        total = 0
+        for user in chains.users:
+            total += user
+        return total
+
+    assert iterate_lists() == iterate_csr()
+    print('{} ids, {} uses, built in {:.1f} ms'.format(len(chains), len(chains.users), build * 1e3))
+    for label, size, func in (('dict of lists', lists_size, iterate_lists),
+                              ('DefUse (CSR)', csr_size, iterate_csr)):
+        best = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        print('  {:<14} {:8.1f} MiB {:8.1f} ms to visit every use'.format(
+            label, size / 2**20, best * 1e3))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Measures the throughput of the streaming disassembler in MB/s.
+
+The module is disassembled from memory and from a file, with and without
+friendly names, and the text is written to os.devnull.
+"""
+
+import argparse
+import io
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from spirv_headers.disassembler import disassemble
+from synthetic import make_module
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=200000,
+                        help='number of instructions in the module body')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='number of runs; the fastest one is reported')
+    args = parser.parse_args()
+
+    data = make_module(args.count).tobytes()
+    text = io.StringIO()
+    count = disassemble(data, text)
+    print('{} instructions, {:.1f} MB of binary, {:.1f} MB of text'.format(
+        count, len(data) / 1e6, len(text.getvalue()) / 1e6))
+
+    with open(os.devnull, 'w') as out:
+        for label, func in (
+                ('from memory', lambda: disassemble(data, out)),
+                ('from a file', lambda: disassemble(io.BytesIO(data), out)),
+                ('friendly names', lambda: disassemble(data, out, friendly_names=True))):
+            best = min(timeit.repeat(func, number=1, repeat=args.repeat))
+            print('  {:<15} {:7.2f} MB/s {:9.0f} instructions/s'.format(
+                label, len(data) / best / 1e6, count / best))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Compares indexing a module with iter_module against InstructionIndex.
+
+Both build the list of instruction offsets, count instructions per opcode
+and select the offsets of the OpLoad instructions.
+"""
+
+import argparse
+import collections
+import os.path
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from spirv_headers.binary import iter_module
+from spirv_headers.index import InstructionIndex
+from synthetic import Op, make_module
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=1000000,
+                        help='number of instructions in the module body')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='number of runs; the fastest one is reported')
+    args = parser.parse_args()
+
+    data = make_module(args.count).tobytes()
+    load = Op['OpLoad']
+
+    def walk():
+        offsets = []
+        histogram = collections.Counter()
+        loads = []
+        for offset, opcode, word_count, operands in iter_module(data):
+            offsets.append(offset)
+            histogram[opcode] += 1
+            if opcode == load:
+                loads.append(offset)
+        return offsets, histogram, loads
+
+    def vectorized():
+        index = InstructionIndex(data)
+        return index.offsets, index.histogram(), index.select(load)
+
+    offsets, histogram, loads = walk()
+    index_offsets, index_histogram, index_loads = vectorized()
+    assert offsets == index_offsets.tolist() and loads == index_loads.tolist()
+    assert all(index_histogram[opcode] == n for opcode, n in histogram.items())
+
+    print('{} instructions, {:.1f} MiB'.format(len(offsets), len(data) / 2**20))
+    for label, func in (('iter_module', walk), ('InstructionIndex', vectorized)):
+        best = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        print('  {:<18} {:8.1f} ms {:7.1f} ns/instruction'.format(
+            label, best * 1e3, best / len(offsets) * 1e9))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Compares OpcodeTable lookups against a plain dict keyed by opcode"""
+
+import argparse
+import os.path
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from spirv_headers.opcodes import opcode_table
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=1000000,
+                        help='number of opcodes looked up per run')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='number of runs; the fastest one is reported')
+    parser.add_argument('--vendor-fraction', type=float, default=0.1,
+                        help='fraction of lookups hitting opcodes above 4000')
+    args = parser.parse_args()
+
+    table = opcode_table()
+    by_opcode = {info.opcode: info for info in table}
+    core = [op for op in by_opcode if op < 4000]
+    vendor = [op for op in by_opcode if op >= 4000]
+    rng = random.Random(0)
+    stream = [rng.choice(vendor if rng.random() < args.vendor_fraction else core)
+              for _ in range(args.count)]
+
+    dense, sparse = table.dense, table.sparse
+    limit = len(dense)
+
+    def dict_lookup():
+        for op in stream:
+            by_opcode[op]
+
+    def list_index():
+        for op in stream:
+            dense[op]
+
+    def list_lookup():
+        for op in stream:
+            dense[op] if op < limit else sparse.get(op)
+
+    def table_get():
+        get = table.get
+        for op in stream:
+            get(op)
+
+    print('{} lookups, {} dense slots, {} sparse entries'.format(
+        args.count, len(dense), len(sparse)))
+    for name, func in (('dict[op]', dict_lookup),
+                       ('dense[op]', list_index),
+                       ('dense list, inlined', list_lookup),
+                       ('OpcodeTable.get', table_get)):
+        best = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        print('  {:<22} {:7.1f} ns/lookup'.format(name, best / args.count * 1e9))
+
+
+if __name__ == '__main__':
+    main()
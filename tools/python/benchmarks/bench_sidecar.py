@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Compares answering queries by rescanning a module with using its sidecar.
+
+Each query finds the instruction defining a random result id.  Opening the
+sidecar includes hashing the module to find it.
+"""
+
+import argparse
+import os.path
+import random
+import shutil
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from spirv_headers.grammar import result_id_positions
+from spirv_headers.module import Module
+from spirv_headers.sidecar import load_sidecar
+from synthetic import make_module
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=1000000,
+                        help='number of instructions in the module body')
+    parser.add_argument('--queries', type=int, default=10,
+                        help='number of result ids looked up')
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, 'module.spv')
+        with open(path, 'wb') as f:
+            f.write(make_module(args.count))
+        cache_dir = os.path.join(directory, 'cache')
+        positions = result_id_positions()
+
+        with Module.open(path) as module:
+            bound = module.bound
+        rng = random.Random(0)
+        ids = [rng.randrange(1, bound) for _ in range(args.queries)]
+
+        def rescan():
+            found = []
+            with Module.open(path) as module:
+                for result_id in ids:
+                    for offset, opcode, word_count, operands in module.instructions():
+                        position = positions.get(opcode)
+                        if position is not None and operands[position] == result_id:
+                            found.append(offset)
+                            break
+                    operands.release()
+            return found
+
+        def sidecar():
+            with load_sidecar(path, cache_dir=cache_dir) as index:
+                return [index.definition(result_id) for result_id in ids]
+
+        start = timeit.default_timer()
+        sidecar()
+        build = timeit.default_timer() - start
+        assert rescan() == sidecar()
+
+        print('{} MiB module, {} queries'.format(os.path.getsize(path) >> 20, len(ids)))
+        print('  building the sidecar  {:8.1f} ms'.format(build * 1e3))
+        for label, func in (('rescanning', rescan), ('using the sidecar', sidecar)):
+            best = min(timeit.repeat(func, number=1, repeat=3))
+            print('  {:<21} {:8.1f} ms'.format(label, best * 1e3))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
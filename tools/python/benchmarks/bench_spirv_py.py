@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Benchmarks importing and querying the shipped spirv.py modules.
+
+For every include/spirv/<version>/spirv.py (plus the spirv_lazy.py and
+spirv_ns.py variants under unified1) this measures:
+  - cold import time, with no cached bytecode
+  - warm import time, with bytecode cached
+  - RSS growth and bytes allocated by the import
+  - forward (name -> value) and reverse (value -> name) lookup latency
+
+Imports are timed in fresh interpreter processes.  Results are written as
+JSON; pass a previous result with --baseline to fail when a size metric grows
+by more than --tolerance or a timing by more than --time-tolerance.
+"""
+
+import argparse
+import json
+import os.path
+import platform
+import subprocess
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from spirv_headers.enums import names
+from spirv_headers.tables import VERSIONS, header_path, load_module
+
+# Runs in a child process: imports one module by path and prints the import
+# time in seconds, the RSS growth in KiB and, with tracemalloc, the bytes
+# still allocated afterwards.  RSS comes from /proc where available, and
+# from the peak RSS elsewhere.
+CHILD = '''
+import importlib.util, resource, sys, time, tracemalloc
+path, trace = sys.argv[1], sys.argv[2] == '1'
+def rss_kib():
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * resource.getpagesize() // 1024
+    except OSError:
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss // 1024 if sys.platform == 'darwin' else rss
+if trace:
+    tracemalloc.start()
+rss = rss_kib()
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location('bench_module', path)
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+elapsed = time.perf_counter() - start
+print(elapsed, rss_kib() - rss, tracemalloc.get_traced_memory()[0] if trace else 0)
+'''
+
+# Metrics compared against a baseline; all of them are "lower is better".
+# Sizes are deterministic, timings are noisy and get a wider tolerance.
+SIZE_METRICS = ('size_bytes', 'allocated_kib')
+TIME_METRICS = ('cold_import_ms', 'warm_import_ms',
+                'forward_lookup_ns', 'reverse_lookup_ns')
+
+
+def modules():
+    """Returns (version, module name) pairs for every shipped module"""
+    result = [(version, 'spirv') for version in VERSIONS]
+    for variant in ('spirv_lazy', 'spirv_ns'):
+        if os.path.exists(header_path(variant + '.py')):
+            result.append(('unified1', variant))
+    return result
+
+
+def run_child(path, cache_dir, dont_write, trace=False):
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=cache_dir)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    if dont_write:
+        env['PYTHONDONTWRITEBYTECODE'] = '1'
+    output = subprocess.check_output(
+        [sys.executable, '-c', CHILD, path, '1' if trace else '0'], env=env)
+    elapsed, rss, allocated = output.split()
+    return float(elapsed), int(rss), int(allocated)
+
+
+def measure_imports(path, runs):
+    """Returns import metrics for the module at path"""
+    with tempfile.TemporaryDirectory() as empty_cache:
+        cold = [run_child(path, empty_cache, True)[0] for _ in range(runs)]
+    with tempfile.TemporaryDirectory() as warm_cache:
+        run_child(path, warm_cache, False)
+        warm = [run_child(path, warm_cache, True) for _ in range(runs)]
+        _, _, allocated = run_child(path, warm_cache, True, trace=True)
+    return {
+        'cold_import_ms': min(cold) * 1e3,
+        'warm_import_ms': min(w[0] for w in warm) * 1e3,
+        'rss_delta_kib': min(w[1] for w in warm),
+        'allocated_kib': allocated / 1024,
+    }
+
+
+def per_lookup_ns(func, count, repeat):
+    return min(timeit.repeat(func, number=1, repeat=repeat)) / count * 1e9
+
+
+def measure_lookups(version, name, repeat):
+    """Returns forward and reverse lookup latency over every token"""
+    spv = load_module(name, version).spv
+    pairs = [(category, token, value)
+             for category, table in spv.items() if isinstance(table, dict)
+             for token, value in table.items()]
+    reverse = {category: names(category, version) for category, _, _ in pairs}
+
+    def forward():
+        for category, token, _ in pairs:
+            spv[category][token]
+
+    def backward():
+        for category, _, value in pairs:
+            reverse[category][value]
+
+    return {
+        'tokens': len(pairs),
+        'forward_lookup_ns': per_lookup_ns(forward, len(pairs), repeat),
+        'reverse_lookup_ns': per_lookup_ns(backward, len(pairs), repeat),
+    }
+
+
+def compare(results, baseline, tolerance, time_tolerance):
+    """Returns a message for every metric that regressed past its tolerance"""
+    previous = {(r['version'], r['module']): r for r in baseline['results']}
+    regressions = []
+    for result in results:
+        old = previous.get((result['version'], result['module']))
+        if old is None:
+            continue
+        for metric in SIZE_METRICS + TIME_METRICS:
+            limit = tolerance if metric in SIZE_METRICS else time_tolerance
+            if metric in result and metric in old and old[metric] > 0 and \
+                    result[metric] > old[metric] * (1 + limit):
+                regressions.append('{}/{}.py {}: {:.1f} -> {:.1f}'.format(
+                    result['version'], result['module'], metric,
+                    old[metric], result[metric]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5,
+                        help='child processes per import measurement; the fastest is kept')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='repetitions per lookup measurement; the fastest is kept')
+    parser.add_argument('--output', metavar='<path>',
+                        help='write the JSON results here instead of stdout')
+    parser.add_argument('--baseline', metavar='<path>',
+                        help='JSON results of an earlier run to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.1,
+                        help='allowed relative growth of size metrics over the baseline')
+    parser.add_argument('--time-tolerance', type=float, default=1.0,
+                        help='allowed relative growth of timing metrics over the baseline')
+    args = parser.parse_args()
+
+    results = []
+    for version, name in modules():
+        path = header_path(name + '.py', version)
+        result = {'version': version, 'module': name,
+                  'size_bytes': os.path.getsize(path)}
+        result.update(measure_imports(path, args.runs))
+        if name != 'spirv_ns':
+            result.update(measure_lookups(version, name, args.repeat))
+        results.append(result)
+
+    report = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'results': results,
+    }
+    text = json.dumps(report, indent=2) + '\n'
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text)
+    else:
+        sys.stdout.write(text)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance,
+                                  args.time_tolerance)
+        for message in regressions:
+            print('regression: ' + message, file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Measures stripping debug information with strip_debug.
+
+It is compared with writing the module unchanged, and with rebuilding the
+module one kept instruction at a time.  The output goes to an in-memory
+file.
+"""
+
+import argparse
+import array
+import io
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from spirv_headers.binary import HEADER_WORDS, WORD_COUNT_SHIFT, iter_module, native_words
+from spirv_headers.debuginfo import NON_SEMANTIC_PREFIX, debug_opcodes, strip_debug
+from synthetic import make_module
+
+
+def rebuild(data, out):
+    """Strips the debug instructions by copying the others one by one.  The
+    module has no NonSemantic instructions."""
+    debug = debug_opcodes()
+    words = array.array('I', native_words(data)[:HEADER_WORDS])
+    for offset, opcode, word_count, operands in iter_module(data):
+        if opcode not in debug:
+            words.append(word_count << WORD_COUNT_SHIFT | opcode)
+            words.extend(operands)
+    return out.write(words)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=200000,
+                        help='number of instructions in the module body')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='number of runs; the fastest one is reported')
+    args = parser.parse_args()
+
+    data = make_module(args.count).tobytes()
+    assert NON_SEMANTIC_PREFIX not in data.decode('latin-1')
+    size = strip_debug(data, io.BytesIO())
+    assert rebuild(data, io.BytesIO()) == size
+    print('{:.1f} MB module, {:.1f} MB stripped'.format(len(data) / 1e6, size / 1e6))
+    for label, func in (
+            ('unchanged', lambda: io.BytesIO().write(data)),
+            ('strip_debug', lambda: strip_debug(data, io.BytesIO())),
+            ('rebuild', lambda: rebuild(data, io.BytesIO()))):
+        best = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        print('  {:<12} {:9.1f} MB/s'.format(label, len(data) / best / 1e6))
+
+
+if __name__ == '__main__':
+    main()
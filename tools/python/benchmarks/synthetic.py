@@ -0,0 +1,132 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Builds synthetic SPIR-V modules for the benchmarks.
+
+The modules follow the logical layout of a compute shader: capabilities, an
+extended instruction set import, debug names and lines, decorations, types
+and constants (with duplicates), and one function whose body loads, adds and
+stores floats.  They are meant to be walked and rewritten, not executed.
+"""
+
+import array
+import random
+import struct
+
+from spirv_headers.binary import MAGIC_NUMBER, WORD_COUNT_SHIFT, encode_string
+from spirv_headers.tables import load_spv
+
+spv = load_spv()
+Op = spv['Op']
+
+
+def make_module(count, seed=0):
+    """Returns a module as an array('I') with about count instructions in
+    its function body."""
+    rng = random.Random(seed)
+    words = array.array('I', [MAGIC_NUMBER, 0x00010600, 0, 0, 0])
+    next_id = [1]
+
+    def new_id():
+        next_id[0] += 1
+        return next_id[0] - 1
+
+    def emit(opname, *operands):
+        start = len(words)
+        words.append(0)
+        for operand in operands:
+            if isinstance(operand, array.array):
+                words.extend(operand)
+            else:
+                words.append(operand)
+        words[start] = (len(words) - start) << WORD_COUNT_SHIFT | Op[opname]
+
+    def emit_string(opname, *operands):
+        # Operands up to the last, which is a literal string.
+        emit(opname, *(operands[:-1] + (encode_string(operands[-1]),)))
+
+    glsl, main, source = new_id(), new_id(), new_id()
+    emit('OpCapability', spv['Capability']['Shader'])
+    emit_string('OpExtInstImport', glsl, 'GLSL.std.450')
+    emit('OpMemoryModel', spv['AddressingModel']['Logical'], spv['MemoryModel']['GLSL450'])
+    emit_string('OpEntryPoint', spv['ExecutionModel']['GLCompute'], main, 'main')
+    emit('OpExecutionMode', main, spv['ExecutionMode']['LocalSize'], 1, 1, 1)
+    emit_string('OpString', source, 'synthetic.comp')
+    emit('OpSource', spv['SourceLanguage']['GLSL'], 450, source)
+    emit_string('OpName', main, 'main')
+    variables = [new_id() for i in range(4)]
+    for i, variable in enumerate(variables):
+        emit_string('OpName', variable, 'v{}'.format(i))
+
+    void, float, uint, func = new_id(), new_id(), new_id(), new_id()
+    ptr_func, ptr_buffer, buffer = new_id(), new_id(), new_id()
+    emit('OpDecorate', buffer, spv['Decoration']['DescriptorSet'], 0)
+    emit('OpDecorate', buffer, spv['Decoration']['Binding'], 0)
+    emit('OpTypeVoid', void)
+    emit('OpTypeFloat', float, 32)
+    emit('OpTypeInt', uint, 32, 0)
+    emit('OpTypeFunction', func, void)
+    emit('OpTypePointer', ptr_func, spv['StorageClass']['Function'], float)
+    emit('OpTypePointer', ptr_buffer, spv['StorageClass']['StorageBuffer'], float)
+    # A second, identical float type, as produced by naive linking.
+    float2 = new_id()
+    emit('OpTypeFloat', float2, 32)
+    constants = []
+    for i in range(max(8, count // 64)):
+        constant = new_id()
+        value = struct.unpack('<I', struct.pack('<f', rng.randrange(16) / 4))[0]
+        emit('OpConstant', rng.choice((float, float2)), constant, value)
+        constants.append(constant)
+    emit('OpVariable', ptr_buffer, buffer, spv['StorageClass']['StorageBuffer'])
+
+    emit('OpFunction', void, main, 0, func)
+    emit('OpLabel', new_id())
+    for variable in variables:
+        emit('OpVariable', ptr_func, variable, spv['StorageClass']['Function'])
+    values = list(constants)
+    emitted = 0
+    while emitted < count:
+        if rng.random() < 0.1:
+            emit('OpLine', source, emitted + 1, 1)
+            emitted += 1
+        value = new_id()
+        emit('OpLoad', float, value, rng.choice(variables + [buffer]))
+        total = new_id()
+        emit('OpFAdd', float, total, value, rng.choice(values))
+        if rng.random() < 0.2:
+            root = new_id()
+            emit('OpExtInst', float, root, glsl, 31, total)
+            total = root
+            emitted += 1
+        emit('OpStore', rng.choice(variables), total)
+        values.append(total)
+        if len(values) > 64:
+            del values[len(constants):len(constants) + 32]
+        emitted += 3
+    emit('OpReturn')
+    emit('OpFunctionEnd')
+    words[3] = next_id[0]
+    return words
@@ -0,0 +1,60 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Python utilities built on the SPIR-V headers and JSON grammars.
+
+The tables come from the generated include/spirv/<version>/spirv.py modules
+and the spirv.core.grammar.json files next to them.
+"""
+
+from .assembler import AssemblyError, Assembler, assemble
+from .binary import (Header, InvalidBinaryError, as_words, decode_string,
+                     encode_string, is_swapped, iter_instructions, iter_module,
+                     iter_stream, native_array, native_words, read_header,
+                     swapped_words)
+from .builder import ModuleBuilder, global_table
+from .debuginfo import (debug_opcodes, index_kept_ranges, is_debug_set, kept_ranges,
+                        strip_debug, stripped)
+from .decoders import SwitchWidths, decode, decoder_source, load_decoders
+from .dedup import Deduplication, dedup, dedup_opcodes
+from .digest import canonical_digest
+from .disassembler import Disassembler, disassemble
+from .enums import (all_names, decode_mask, decode_masks, mask_bits, name_of,
+                    names)
+from .extinst import extinst_grammar_name, extinst_module_name, load_extinst
+from .grammar import (Instruction, Operand, OperandKind, instructions,
+                      operand_kinds, result_id_positions)
+from .ids import (ID_USE_KINDS, NO_OFFSET, DefinitionTable, DefUse, IdOperands,
+                  IdUseLayout, id_use_layouts)
+from .index import InstructionIndex, instruction_offsets
+from .layout import (SECTIONS, SectionTracker, find_sections, iter_section,
+                     section_offsets)
+from .module import Module
+from .opcodes import OpcodeTable, opcode_table
+from .registry import EnumRegistry, Token, encode_version, enum_registry
+from .sidecar import SidecarIndex, build_sidecar, load_sidecar
+from .tables import (DEFAULT_VERSION, INCLUDE_DIR, VERSIONS, default_cache_dir,
+                     load_generators, load_grammar, load_spv)
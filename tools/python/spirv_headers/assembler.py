@@ -0,0 +1,447 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Assembles SPIR-V text into binaries.
+
+The text uses the syntax written by the disassembler: one instruction per
+line, "%result = OpName operands...", with ';' starting a comment.  Ids are
+written %<number> or %<name>; named ids get the numbers following the
+largest numbered one, in order of appearance.  Mnemonics and enumerants are
+looked up in the spv tables and the operands are laid out following the
+grammar.  Enumerants may be written with or without the kind prefix that
+the headers add to names starting with a digit (e.g. 1D or Dim1D), and
+masks as flags joined by '|'.
+
+The disassembler's header comments ("; Version: 1.6", "; Generator: ...")
+set the corresponding header words.
+"""
+
+import array
+import re
+import struct
+
+from .binary import HEADER_WORDS, MAGIC_NUMBER, WORD_COUNT_SHIFT, encode_string
+from .decoders import SwitchWidths
+from .extinst import extinst_grammar_name, load_extinst
+from .grammar import SELECTOR_SIZED_KINDS, instructions, operand_kinds
+from .tables import CORE_GRAMMAR, DEFAULT_VERSION, load_generators, load_spv
+
+_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|;.*|[^\s";]+|"')
+_ESCAPE = re.compile(r'\\(.)')
+# Numbered id tokens, skipping the literal strings and comments that may
+# hold text looking like one: those match with an empty group.
+_NUMBERED_ID = re.compile(r'"(?:[^"\\\r\n]|\\.)*"|;.*|(?<![^\s"])%([0-9]+)(?![^\s";])')
+_VERSION_COMMENT = re.compile(r';\s*Version:\s*(\d+)\.(\d+)')
+_GENERATOR_COMMENT = re.compile(r';\s*Generator:\s*(.*);\s*(\d+)\s*$')
+_UNKNOWN_GENERATOR = re.compile(r'Unknown\((\d+)\)$')
+
+_FLOAT_FORMATS = {16: '<e', 32: '<f', 64: '<d'}
+
+
+class AssemblyError(ValueError):
+    """Raised for text that cannot be assembled"""
+
+    def __init__(self, message, line=None):
+        if line is not None:
+            message = '{} at line {}'.format(message, line)
+        ValueError.__init__(self, message)
+        self.line = line
+
+
+def unquote(token):
+    """Returns the text of a literal string token"""
+    if len(token) < 2 or token[0] != '"' or token[-1] != '"':
+        raise AssemblyError('Expected a literal string, got {}'.format(token))
+    return _ESCAPE.sub(r'\1', token[1:-1])
+
+
+def parse_int(token):
+    """Returns the value of an integer literal, in decimal or 0x hex"""
+    try:
+        return int(token, 0)
+    except ValueError:
+        raise AssemblyError('Expected an integer, got {}'.format(token))
+
+
+def encode_float(token, width=32):
+    """Returns the bits of a decimal float literal of width bits as an int.
+    Raises AssemblyError if it is not a float or is too large for the width.
+    """
+    fmt = _FLOAT_FORMATS.get(width)
+    if fmt is None:
+        raise AssemblyError('Unsupported float width {}'.format(width))
+    try:
+        value = float(token)
+    except ValueError:
+        raise AssemblyError('Expected a float, got {}'.format(token))
+    try:
+        return int.from_bytes(struct.pack(fmt, value), 'little')
+    except OverflowError:
+        raise AssemblyError('{} does not fit in a {}-bit float'.format(token, width))
+
+
+def encode_integer(token, width=32, signed=False):
+    """Returns the words of an integer literal of width bits, low word first.
+
+    Negative values are written in two's complement.  Values of signed types
+    narrower than a word are sign-extended to the word, as the specification
+    asks; values of other types are zero-extended.  Raises AssemblyError if
+    the value does not fit in width bits.
+    """
+    value = parse_int(token)
+    if not -(1 << (width - 1)) <= value < (1 << width):
+        raise AssemblyError('{} does not fit in {} bits'.format(token, width))
+    words = (width + 31) // 32
+    if signed and value >= 1 << (width - 1):
+        value -= 1 << width
+    value &= (1 << (32 * words if signed else width)) - 1
+    return [(value >> shift) & 0xffffffff for shift in range(0, 32 * words, 32)]
+
+
+class Assembler:
+    """Turns lines of text into the words of a module.
+
+    Words are written into a preallocated array('I'), grown by doubling if
+    the text holds more than estimated, and turned into bytes once.
+    """
+
+    def __init__(self, version=DEFAULT_VERSION):
+        self.version = version
+        self._spv = load_spv(version)
+        self._ops = self._spv['Op']
+        self._kinds = operand_kinds(CORE_GRAMMAR, version)
+        self._instructions = {}
+        self._by_opcode = {}
+        for inst in instructions(CORE_GRAMMAR, version):
+            self._by_opcode.setdefault(inst.opcode, inst)
+            for name in (inst.opname,) + inst.aliases:
+                self._instructions.setdefault(name, inst)
+        self._ext_grammars = {}   # Grammar name -> {opcode: Instruction}
+        # Instructions taking only ids, the bulk of most modules, skip the
+        # per-operand dispatch: opcode -> (position of the IdResult or -1,
+        # number of ids, whether the last one repeats).
+        self._id_layouts = {}
+        for inst in self._by_opcode.values():
+            operands = inst.operands
+            if all(self._kinds[o.kind].category == 'Id' and
+                   (o.quantifier is None or (o.quantifier == '*' and o is operands[-1]))
+                   for o in operands):
+                kinds = [o.kind for o in operands]
+                self._id_layouts[inst.opcode] = (
+                    kinds.index('IdResult') if 'IdResult' in kinds else -1,
+                    len(operands), bool(operands) and operands[-1].quantifier == '*')
+
+    def _enumerant(self, kind, token, tables):
+        """Returns the value of an enumerant of kind"""
+        value = tables.get(token)
+        if value is None:
+            value = tables.get(kind + token)
+        if value is None:
+            if token[:1].isdigit():
+                return encode_integer(token)[0]
+            raise AssemblyError('Unknown {} {}'.format(kind, token))
+        return value
+
+    def _enum_tables(self, kind):
+        """Returns the (category, name to value dict) of an enum kind"""
+        operand_kind = self._kinds.get(kind)
+        if operand_kind is not None:
+            if operand_kind.category == 'BitEnum':
+                return 'BitEnum', self._spv.get(kind + 'Mask', {})
+            return operand_kind.category, self._spv.get(kind, {})
+        module = self._ext_set[0] if self._ext_set else None
+        categories = getattr(module, 'OperandKindCategories', {})
+        if kind in categories:
+            return categories[kind], module.OperandKinds[kind]
+        return 'Literal', {}
+
+    def _next(self):
+        if self._pos >= len(self._tokens):
+            raise AssemblyError('Missing operand')
+        token = self._tokens[self._pos]
+        self._pos += 1
+        return token
+
+    def _encode(self, kind):
+        """Appends the words of the next operand, of kind, to self._out"""
+        out = self._out
+        if kind == 'IdResult':
+            if self._result is None:
+                raise AssemblyError('Missing result id')
+            out.append(self._id(self._result))
+            return
+        operand_kind = self._kinds.get(kind)
+        category = operand_kind.category if operand_kind else None
+        if category == 'Id':
+            token = self._next()
+            if token[:1] != '%':
+                raise AssemblyError('Expected an id, got {}'.format(token))
+            out.append(self._id(token))
+            if kind == 'IdResultType':
+                self._result_type = out[-1]
+        elif kind in SELECTOR_SIZED_KINDS:
+            # The literals of OpSwitch are as wide as its selector, out[0].
+            literal, other = operand_kind.bases
+            width = 32 * self._widths.literal_words(out[0])
+            out.extend(encode_integer(self._next(), width))
+            self._encode(other)
+        elif category == 'Composite':
+            for base in operand_kind.bases:
+                self._encode(base)
+        elif kind == 'LiteralString':
+            out.extend(encode_string(unquote(self._next())))
+        elif kind == 'LiteralFloat':
+            out.append(encode_float(self._next()))
+        elif kind == 'LiteralContextDependentNumber':
+            out.extend(self._number(self._next()))
+        elif kind == 'LiteralSpecConstantOpInteger':
+            token = self._next()
+            opcode = self._ops.get('Op' + token)
+            if opcode is None:
+                opcode = encode_integer(token)[0]
+            out.append(opcode)
+            inst = self._by_opcode.get(opcode)
+            if inst is None:
+                raise AssemblyError('Unknown opcode {}'.format(token))
+            self._encode_operands(inst.operands[2:])
+        elif kind == 'LiteralExtInstInteger':
+            token = self._next()
+            module = self._ext_set[0] if self._ext_set else None
+            names = getattr(module, 'Instructions', {})
+            out.append(names[token] if token in names else encode_integer(token)[0])
+        elif category in ('ValueEnum', 'BitEnum') or kind not in self._kinds:
+            category, tables = self._enum_tables(kind)
+            token = self._next()
+            if category == 'BitEnum':
+                value = 0
+                for flag in token.split('|'):
+                    if flag != 'None':
+                        value |= self._enumerant(kind, flag, tables)
+            elif category == 'ValueEnum':
+                value = self._enumerant(kind, token, tables)
+            else:
+                value = encode_integer(token)[0]
+            out.append(value & 0xffffffff)
+            parameters = operand_kind.parameters if operand_kind else {}
+            if category == 'BitEnum':
+                for bit in sorted(parameters):
+                    if value & bit:
+                        for parameter in parameters[bit]:
+                            self._encode(parameter)
+            else:
+                for parameter in parameters.get(value, ()):
+                    self._encode(parameter)
+        else:
+            out.extend(encode_integer(self._next()))
+
+    def _encode_operands(self, operands):
+        for operand in operands:
+            if operand.quantifier is None:
+                self._encode(operand.kind)
+            elif operand.quantifier == '?':
+                if self._pos < len(self._tokens):
+                    self._encode(operand.kind)
+            else:
+                while self._pos < len(self._tokens):
+                    self._encode(operand.kind)
+
+    def _number(self, token):
+        """Returns the words of a LiteralContextDependentNumber of the
+        current result type"""
+        kind, width, signed = self._types.get(self._result_type, ('int', 32, 0))
+        if kind == 'float' and not token.lstrip('-').lower().startswith('0x'):
+            value = encode_float(token, width)
+            return [(value >> shift) & 0xffffffff for shift in range(0, max(width, 32), 32)]
+        return encode_integer(token, width, signed)
+
+    def _id(self, token):
+        result_id = self._ids.get(token)
+        if result_id is None:
+            name = token[1:]
+            if name.isdigit():
+                result_id = int(name)
+            else:
+                result_id = self._next_id
+                self._next_id += 1
+            self._ids[token] = result_id
+            if result_id > self._max_id:
+                self._max_id = result_id
+        return result_id
+
+    def _ext_inst(self):
+        """Encodes the operands of an OpExtInst"""
+        self._encode('IdResultType')
+        self._encode('IdResult')
+        token = self._next()
+        set_id = self._id(token)
+        self._out.append(set_id)
+        self._ext_set = self._ext_sets.get(set_id)
+        self._encode('LiteralExtInstInteger')
+        ext_instructions = self._ext_set[1] if self._ext_set else None
+        inst = None
+        if ext_instructions is not None:
+            inst = ext_instructions.get(self._out[-1])
+        if inst is None:
+            while self._pos < len(self._tokens):
+                self._encode('IdRef')
+        else:
+            self._encode_operands(inst.operands)
+        self._ext_set = None
+
+    def _ext_set_tables(self, import_name):
+        """Returns (tables module, {number: Instruction}) for a set"""
+        grammar = extinst_grammar_name(import_name)
+        by_number = None
+        if grammar is not None:
+            by_number = self._ext_grammars.get(grammar)
+            if by_number is None:
+                by_number = self._ext_grammars[grammar] = {
+                    inst.opcode: inst for inst in instructions(grammar)}
+        return load_extinst(import_name), by_number
+
+    def assemble(self, text, module_version=None, generator=None):
+        """Returns the binary of the module described by text, as bytes.
+
+        Arguments:
+            text: The assembly text, as a str.
+            module_version: The (major, minor) SPIR-V version for the header.
+                            Defaults to the text's "; Version:" comment, or
+                            the version of the headers.
+            generator: The generator word for the header.  Defaults to the
+                       text's "; Generator:" comment, or 0.
+        """
+        numbered = [int(n) for n in _NUMBERED_ID.findall(text) if n]
+        self._next_id = max(numbered, default=0) + 1
+        self._max_id = 0
+        self._ids = {}   # Token -> id
+        self._types = {}
+        self._widths = SwitchWidths(self.version)
+        self._ext_sets = {}
+        self._ext_set = None
+        header_version = self._spv['Version']
+        header_generator = 0
+        # Most instructions take at least 4 characters of text per word.
+        words = array.array('I', bytes(4 * (len(text) // 4 + HEADER_WORDS + 16)))
+        position = HEADER_WORDS
+        ids = self._ids
+        id_layouts = self._id_layouts
+        op_ext_inst = self._ops['OpExtInst']
+        op_ext_inst_import = self._ops['OpExtInstImport']
+        op_type_int = self._ops['OpTypeInt']
+        op_type_float = self._ops['OpTypeFloat']
+        for number, line in enumerate(text.splitlines(), 1):
+            tokens = _TOKEN.findall(line)
+            if tokens and tokens[-1][:1] == ';':
+                comment = tokens.pop()
+                match = _VERSION_COMMENT.match(comment)
+                if match:
+                    header_version = int(match.group(1)) << 16 | int(match.group(2)) << 8
+                match = _GENERATOR_COMMENT.match(comment)
+                if match:
+                    header_generator = self._generator_word(match.group(1), int(match.group(2)))
+            if not tokens:
+                continue
+            try:
+                self._result = None
+                if len(tokens) > 1 and tokens[1] == '=':
+                    self._result = tokens[0]
+                    if self._result[:1] != '%':
+                        raise AssemblyError('Expected a result id, got {}'.format(self._result))
+                    del tokens[:2]
+                inst = self._instructions.get(tokens[0])
+                if inst is None:
+                    raise AssemblyError('Unknown instruction {}'.format(tokens[0]))
+                self._tokens = tokens
+                self._pos = 1
+                self._out = out = []
+                self._result_type = None
+                layout = id_layouts.get(inst.opcode)
+                if layout is not None:
+                    result_index, count, repeated = layout
+                    if result_index >= 0:
+                        count -= 1
+                    given = len(tokens) - 1
+                    if given < count - repeated or (given > count and not repeated):
+                        raise AssemblyError('Wrong number of ids for {}'.format(tokens[0]))
+                    for token in tokens[1:]:
+                        if token[:1] != '%':
+                            raise AssemblyError('Expected an id, got {}'.format(token))
+                        out.append(ids[token] if token in ids else self._id(token))
+                    if result_index >= 0:
+                        if self._result is None:
+                            raise AssemblyError('Missing result id')
+                        out.insert(result_index, self._id(self._result))
+                    self._pos = len(tokens)
+                elif inst.opcode == op_ext_inst:
+                    self._ext_inst()
+                else:
+                    self._encode_operands(inst.operands)
+                if self._pos < len(tokens):
+                    raise AssemblyError('Unexpected operand {}'.format(tokens[self._pos]))
+                if inst.opcode == op_ext_inst_import:
+                    self._ext_sets[out[0]] = self._ext_set_tables(unquote(tokens[1]))
+                elif inst.opcode == op_type_int:
+                    self._types[out[0]] = ('int', out[1], out[2])
+                elif inst.opcode == op_type_float:
+                    self._types[out[0]] = ('float', out[1], 0)
+                self._widths.add(inst.opcode, out)
+            except AssemblyError as e:
+                raise AssemblyError(str(e), number)
+            word_count = len(out) + 1
+            if word_count > 0xffff:
+                raise AssemblyError('Instruction too long', number)
+            while position + word_count > len(words):
+                words.extend(array.array('I', bytes(4 * len(words))))
+            words[position] = word_count << WORD_COUNT_SHIFT | inst.opcode
+            words[position + 1:position + word_count] = array.array('I', out)
+            position += word_count
+        bound = self._max_id + 1
+        if generator is None:
+            generator = header_generator
+        if module_version is not None:
+            header_version = module_version[0] << 16 | module_version[1] << 8
+        words[:HEADER_WORDS] = array.array('I', [MAGIC_NUMBER, header_version, generator,
+                                                 bound, 0])
+        return memoryview(words)[:position].tobytes()
+
+    @staticmethod
+    def _generator_word(name, version):
+        """Returns the generator word for a "; Generator:" comment"""
+        match = _UNKNOWN_GENERATOR.match(name)
+        if match:
+            return int(match.group(1)) << 16 | version
+        for tool, description in load_generators().items():
+            if description == name:
+                return tool << 16 | version
+        return version
+
+
+def assemble(text, version=DEFAULT_VERSION, module_version=None, generator=None):
+    """Returns the binary of the module described by text, as bytes.  See
+    Assembler.assemble for the arguments."""
+    if hasattr(text, 'read'):
+        text = text.read()
+    return Assembler(version).assemble(text, module_version, generator)
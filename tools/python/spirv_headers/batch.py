@@ -0,0 +1,185 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Runs an analysis over many modules with a pool of forked processes.
+
+The grammars and the tables built from them are loaded once in the parent
+process.  Where fork is available the workers inherit them copy-on-write, so
+starting a pool costs neither reparsing nor memory per worker.
+"""
+
+import collections
+import gc
+import multiprocessing
+import os
+
+from .decoders import load_decoders
+from .enums import all_names
+from .extinst import EXTINST_GRAMMARS, EXTINST_MODULES, load_extinst
+from .grammar import instructions, operand_kinds
+from .module import Module
+from .opcodes import opcode_table
+from .tables import CORE_GRAMMAR, DEFAULT_VERSION, load_grammar
+
+SPIRV_SUFFIX = '.spv'
+
+# Chunks handed out per worker process: more chunks balance the load
+# better, fewer cost less inter-process traffic.
+DEFAULT_CHUNKS_PER_PROCESS = 4
+
+# The outcome of a task on one file.  error is None, or the exception type
+# and message as a string when the task raised.
+Result = collections.namedtuple('Result', ['path', 'value', 'error'])
+
+# The task run on each file, set before the pool starts.
+_task = None
+
+
+def preload(version=DEFAULT_VERSION):
+    """Loads the core and extended instruction set grammars, and the tables
+    and decoders built from them, into their module caches."""
+    for name in (CORE_GRAMMAR,) + tuple(EXTINST_GRAMMARS.values()):
+        if name != CORE_GRAMMAR and version != DEFAULT_VERSION:
+            continue  # Extended instruction set grammars only exist in unified1.
+        load_grammar(name, version)
+        instructions(name, version)
+        operand_kinds(name, version)
+        load_decoders(name, version)
+    opcode_table(version)
+    all_names(version)
+    for import_name in EXTINST_MODULES:
+        load_extinst(import_name)
+
+
+def find_modules(paths, suffix=SPIRV_SUFFIX):
+    """Yields the files named in paths and those ending with suffix found
+    by walking the directories named in paths, in sorted order."""
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                if name.endswith(suffix):
+                    yield os.path.join(root, name)
+
+
+def balanced_chunks(paths, count):
+    """Splits paths into at most count runs of consecutive files holding
+    about the same number of bytes each.  A file that cannot be read counts
+    as empty, leaving the task to report the error."""
+    sizes = []
+    for path in paths:
+        try:
+            sizes.append(os.path.getsize(path))
+        except OSError:
+            sizes.append(0)
+    target = max(sum(sizes) / max(count, 1), 1)
+    chunks = []
+    chunk = []
+    total = 0
+    for path, size in zip(paths, sizes):
+        chunk.append(path)
+        total += size
+        if total >= target * (len(chunks) + 1):
+            chunks.append(chunk)
+            chunk = []
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def count_opcodes(path):
+    """A sample task: returns a dict of instruction counts by opcode"""
+    counts = collections.Counter()
+    with Module.open(path) as module:
+        for offset, opcode, word_count, operands in module.instructions():
+            counts[opcode] += 1
+            operands.release()
+    return dict(counts)
+
+
+def _run_chunk(chunk):
+    results = []
+    for path in chunk:
+        try:
+            results.append(Result(path, _task(path), None))
+        except Exception as e:
+            results.append(Result(path, None, '{}: {}'.format(type(e).__name__, e)))
+    return results
+
+
+def _init_worker(task, version):
+    """Sets up a worker process that did not fork from the parent"""
+    global _task
+    _task = task
+    preload(version)
+
+
+def run(task, paths, processes=None, chunks_per_process=DEFAULT_CHUNKS_PER_PROCESS,
+        version=DEFAULT_VERSION):
+    """Runs task on every file of paths and yields a Result for each, in
+    the order of paths, as they complete.
+
+    Arguments:
+        task: A function taking a file path.  Its return value must be
+              picklable; with fork the function itself need not be.
+        paths: The files to process, e.g. from find_modules().
+        processes: The number of worker processes, by default one per CPU.
+                   With 1, the files are processed in this process.
+        chunks_per_process: How many size-balanced chunks of files to make
+                            per process.
+        version: The headers and grammar to preload.
+    """
+    global _task
+    paths = list(paths)
+    processes = processes or os.cpu_count() or 1
+    preload(version)
+    chunks = balanced_chunks(paths, processes * chunks_per_process)
+    _task = task
+    try:
+        if processes == 1:
+            for chunk in chunks:
+                yield from _run_chunk(chunk)
+            return
+        if 'fork' in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context('fork')
+            initializer, initargs = None, ()
+        else:
+            context = multiprocessing.get_context()
+            initializer, initargs = _init_worker, (task, version)
+        # Keep the collector from touching, and so copying, the pages of
+        # everything loaded so far in the workers.
+        gc.freeze()
+        try:
+            with context.Pool(processes, initializer, initargs) as pool:
+                for results in pool.imap(_run_chunk, chunks):
+                    yield from results
+        finally:
+            gc.unfreeze()
+    finally:
+        _task = None
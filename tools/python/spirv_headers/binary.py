@@ -0,0 +1,289 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Walks SPIR-V binaries instruction by instruction"""
+
+import array
+import collections
+import sys
+
+from .tables import load_spv
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_spv = load_spv()
+MAGIC_NUMBER = _spv['MagicNumber']
+OPCODE_MASK = _spv['OpCodeMask']
+WORD_COUNT_SHIFT = _spv['WordCountShift']
+del _spv
+
+# The magic number as read from a module of the other byte order.
+SWAPPED_MAGIC_NUMBER = int.from_bytes(MAGIC_NUMBER.to_bytes(4, 'little'), 'big')
+
+HEADER_WORDS = 5
+
+# The largest word count the first word of an instruction can hold.
+MAX_WORD_COUNT = 0xffffffff >> WORD_COUNT_SHIFT
+
+# Words read per chunk by iter_stream.
+DEFAULT_CHUNK_WORDS = 1 << 16
+
+# The five header words of a module.
+Header = collections.namedtuple('Header', [
+    'magic', 'version', 'generator', 'bound', 'schema'])
+
+
+class InvalidBinaryError(ValueError):
+    """Raised for data that is not a well-formed SPIR-V binary"""
+
+    def __init__(self, message, offset=None):
+        if offset is not None:
+            message = '{} at word {}'.format(message, offset)
+        ValueError.__init__(self, message)
+        self.offset = offset
+
+
+def as_words(data):
+    """Returns a memoryview of 32-bit words over a bytes-like object or an
+    array('I'), without copying."""
+    view = memoryview(data)
+    if view.format == 'I' and view.itemsize == 4:
+        return view
+    if view.nbytes % 4:
+        size = view.nbytes
+        # Release the view now: the traceback would keep it alive and stop
+        # a caller from closing a memory map.
+        view.release()
+        raise InvalidBinaryError('Binary size {} is not a multiple of 4'.format(size))
+    return view.cast('B').cast('I')
+
+
+def swapped_words(data):
+    """Returns a memoryview of the 32-bit words of data with their bytes
+    swapped.  The swap is done in one pass over a copy, in C."""
+    words = array.array('I')
+    words.frombytes(as_words(data).cast('B'))
+    words.byteswap()
+    return memoryview(words)
+
+
+def is_swapped(data):
+    """Returns True if data holds a module of the opposite byte order to
+    this machine, False if it is in native order.
+
+    Raises InvalidBinaryError if the first word is no magic number.
+    """
+    words = as_words(data)
+    if len(words) and words[0] == MAGIC_NUMBER:
+        return False
+    if len(words) and words[0] == SWAPPED_MAGIC_NUMBER:
+        return True
+    raise InvalidBinaryError('Not a SPIR-V module: bad or missing magic number', 0)
+
+
+def native_words(data):
+    """Returns the words of a module as a native-order memoryview.
+
+    Modules in native order are viewed without copying; modules of the
+    other byte order are swapped in bulk (see swapped_words).
+    """
+    if is_swapped(data):
+        return swapped_words(data)
+    return as_words(data)
+
+
+def native_array(data):
+    """Returns the words of a module as a native-valued NumPy uint32 array.
+
+    No copy is made for either byte order: a byte-swapped module is viewed
+    through a non-native dtype, which NumPy converts as values are read.
+    Requires NumPy.
+    """
+    if numpy is None:
+        raise ImportError('native_array requires NumPy')
+    words = numpy.frombuffer(as_words(data), dtype=numpy.uint32)
+    if is_swapped(data):
+        words = words.view(words.dtype.newbyteorder())
+    return words
+
+
+def decode_string(words, start=0):
+    """Returns (text, end) for the literal string starting at words[start],
+    where end is the offset of the word following it.
+
+    Strings are nul-terminated UTF-8 packed four bytes per word, first byte
+    lowest.  Invalid UTF-8 is kept as surrogate escapes.
+    """
+    end = start
+    n = len(words)
+    while end < n:
+        word = words[end]
+        end += 1
+        if not (word & 0xff and word & 0xff00 and word & 0xff0000 and word & 0xff000000):
+            break
+    else:
+        raise InvalidBinaryError('Unterminated literal string', start)
+    data = array.array('I', words[start:end])
+    if sys.byteorder == 'big':
+        data.byteswap()
+    data = data.tobytes()
+    return data[:data.index(b'\0')].decode('utf-8', 'surrogateescape'), end
+
+
+def encode_string(text):
+    """Returns the words of text as a literal string: nul-terminated UTF-8,
+    padded to a whole number of words.  See decode_string."""
+    data = text.encode('utf-8', 'surrogateescape') + b'\0'
+    data += b'\0' * (-len(data) % 4)
+    words = array.array('I', data)
+    if sys.byteorder == 'big':
+        words.byteswap()
+    return words
+
+
+def read_header(words, offset=0):
+    """Returns the Header of the module starting at offset.
+
+    Raises InvalidBinaryError if the words are too few or the magic number
+    does not match.  Byte-swapped modules must be converted first, see
+    native_words.
+    """
+    if len(words) - offset < HEADER_WORDS:
+        raise InvalidBinaryError('Truncated module header', offset)
+    if words[offset] == SWAPPED_MAGIC_NUMBER:
+        raise InvalidBinaryError('Module is byte-swapped', offset)
+    if words[offset] != MAGIC_NUMBER:
+        raise InvalidBinaryError('Bad magic number 0x{:08x}'.format(words[offset]), offset)
+    return Header(*words[offset:offset + HEADER_WORDS])
+
+
+def iter_instructions(words, start=HEADER_WORDS, end=None):
+    """Yields (offset, opcode, word_count, operands) for each instruction.
+
+    operands is words[offset + 1:offset + word_count], so it is a view, not
+    a copy, when words is a memoryview (see as_words).
+
+    Arguments:
+        words: A sequence of 32-bit words, usually a memoryview.
+        start: Offset of the first instruction; by default just past the
+               module header, which is not checked here (see read_header).
+        end: Offset to stop at; defaults to len(words).
+    """
+    if end is None:
+        end = len(words)
+    offset = start
+    while offset < end:
+        word = words[offset]
+        word_count = word >> WORD_COUNT_SHIFT
+        if word_count == 0:
+            raise InvalidBinaryError('Instruction with word count 0', offset)
+        next_offset = offset + word_count
+        if next_offset > end:
+            raise InvalidBinaryError('Truncated instruction', offset)
+        yield offset, word & OPCODE_MASK, word_count, words[offset + 1:next_offset]
+        offset = next_offset
+
+
+def iter_module(data):
+    """Validates the header of a module held in memory and yields its
+    instructions as iter_instructions does.  Byte-swapped modules are
+    converted to native order first."""
+    words = native_words(data)
+    read_header(words)
+    return iter_instructions(words)
+
+
+def iter_stream(fp, chunk_words=DEFAULT_CHUNK_WORDS):
+    """Yields the instructions of one or more modules read from a binary
+    file object, in fixed-size chunks.
+
+    Tuples are (offset, opcode, word_count, operands) as for
+    iter_instructions, with offsets counted from the start of the stream.
+    Modules may be concatenated: a magic number where an instruction would
+    start begins a new module.  Each module header is validated and yielded
+    as (offset, None, 5, header words).  Each module may be in either byte
+    order; the words of byte-swapped modules are swapped a chunk at a time.
+
+    The operand views refer to the chunk they were read in, so memory use
+    stays bounded as long as the caller does not keep them; copy them
+    (e.g. with list() or tolist()) to hold on to them.
+    """
+    chunk_bytes = chunk_words * 4
+    carry = b''
+    base = 0                # Stream offset of words[0]
+    swapped = False         # Byte order of the current module
+    pending_header = True   # The stream must start with a module header
+    while True:
+        chunk = fp.read(chunk_bytes)
+        data = carry + chunk if carry else chunk
+        if not data:
+            return
+        usable = len(data) - len(data) % 4
+        view = memoryview(data)[:usable]
+        skip = 0                # Words of view before words[0]
+        words = swapped_words(view) if swapped else as_words(view)
+        n = len(words)
+        offset = 0
+        while offset < n:
+            word = words[offset]
+            if word == SWAPPED_MAGIC_NUMBER:
+                # A module of the other byte order starts here: decode the
+                # rest of the chunk the other way.
+                swapped = not swapped
+                skip += offset
+                base += offset
+                rest = view[skip * 4:]
+                words = swapped_words(rest) if swapped else as_words(rest)
+                n = len(words)
+                offset = 0
+                continue
+            if pending_header or word == MAGIC_NUMBER:
+                if n - offset < HEADER_WORDS:
+                    break
+                read_header(words, offset)
+                yield base + offset, None, HEADER_WORDS, words[offset:offset + HEADER_WORDS]
+                offset += HEADER_WORDS
+                pending_header = False
+                continue
+            word_count = word >> WORD_COUNT_SHIFT
+            if word_count == 0:
+                raise InvalidBinaryError('Instruction with word count 0', base + offset)
+            if offset + word_count > n:
+                break
+            yield (base + offset, word & OPCODE_MASK, word_count,
+                   words[offset + 1:offset + word_count])
+            offset += word_count
+
+        del words
+        if not chunk:
+            if offset < n or usable < len(data):
+                raise InvalidBinaryError('Truncated stream', base + offset)
+            return
+        carry = bytes(data[(skip + offset) * 4:])
+        base += offset
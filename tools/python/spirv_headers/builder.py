@@ -0,0 +1,283 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Builds SPIR-V modules instruction by instruction.
+
+ModuleBuilder keeps one array('I') per logical layout section, and one per
+part of the debug section, and appends each instruction's words to the
+section its opcode belongs to, so the
+instructions can be emitted in any order that is convenient: a decoration
+or a type may be added in the middle of a function.  The sections are
+joined into a module once, when it is written out.
+"""
+
+import array
+
+from .binary import HEADER_WORDS, MAGIC_NUMBER, MAX_WORD_COUNT, WORD_COUNT_SHIFT
+from .grammar import instructions, result_id_positions
+from .layout import (DEBUG, FUNCTION_DECLARATIONS, FUNCTION_DEFINITIONS, GLOBALS, SECTIONS,
+                     section_table)
+from .tables import DEFAULT_VERSION, load_spv
+
+# Grammar classes of the instructions that are global even when emitted
+# while a function is being built.
+GLOBAL_CLASSES = ('Type-Declaration', 'Constant-Creation')
+
+# The debug section is ordered too: the source instructions, then the names,
+# then OpModuleProcessed.  Each part gets its own array.
+DEBUG_PARTS = (
+    ('OpString', 'OpSourceExtension', 'OpSource', 'OpSourceContinued'),
+    ('OpName', 'OpMemberName'),
+    ('OpModuleProcessed',),
+)
+
+
+def _part(section):
+    """Returns the index in ModuleBuilder.sections of a section other than
+    the debug one"""
+    return section if section <= DEBUG else section + len(DEBUG_PARTS) - 1
+
+
+_GLOBALS, _FUNCTION_DECLARATIONS, _FUNCTION_DEFINITIONS = (
+    _part(GLOBALS), _part(FUNCTION_DECLARATIONS), _part(FUNCTION_DEFINITIONS))
+
+_global_table_cache = {}
+_part_table_cache = {}
+
+
+def global_table(version=DEFAULT_VERSION):
+    """Returns a dict mapping the opcodes that never appear in a function
+    to their section: layout.section_table, plus the types and constants."""
+    table = _global_table_cache.get(version)
+    if table is None:
+        table = dict(section_table(version))
+        for inst in instructions(version=version):
+            if inst.opclass in GLOBAL_CLASSES:
+                table[inst.opcode] = GLOBALS
+        _global_table_cache[version] = table
+    return table
+
+
+def _part_tables(version=DEFAULT_VERSION):
+    """Returns two dicts mapping opcodes to the index of their array in
+    ModuleBuilder.sections: outside functions, after section_table, and in
+    functions, after global_table."""
+    tables = _part_table_cache.get(version)
+    if tables is None:
+        ops = load_spv(version)['Op']
+        debug = {ops[name]: DEBUG + i
+                 for i, names in enumerate(DEBUG_PARTS) for name in names if name in ops}
+        tables = _part_table_cache[version] = tuple(
+            {opcode: debug.get(opcode, _part(section)) for opcode, section in table.items()}
+            for table in (section_table(version), global_table(version)))
+    return tables
+
+
+class ModuleBuilder:
+    """Collects the instructions of a module in logical layout order.
+
+    Instructions between an OpFunction and its OpFunctionEnd belong to that
+    function, except for those in global_table(); a function without an
+    OpLabel is moved to the declarations when it ends.  Outside functions,
+    instructions not listed in layout.SECTION_OPCODES go to the types,
+    constants and global variables.
+
+    The words of each section are appended to a flat array('I'), which
+    grows by a constant factor: building a module makes no Python object
+    per instruction or per word.  self.sections lists these arrays in
+    module order, with the debug section split into DEBUG_PARTS.
+
+    Arguments:
+        version: The headers to take opcodes and the grammar from.
+        module_version: The (major, minor) SPIR-V version for the header.
+                        Defaults to the version of the headers.
+        generator: The generator word for the header.
+    """
+
+    def __init__(self, version=DEFAULT_VERSION, module_version=None, generator=0):
+        spv = load_spv(version)
+        ops = spv['Op']
+        if module_version is None:
+            self.module_version = spv['Version']
+        else:
+            self.module_version = module_version[0] << 16 | module_version[1] << 8
+        self.generator = generator
+        self.sections = [array.array('I')
+                         for part in range(len(SECTIONS) + len(DEBUG_PARTS) - 1)]
+        self.next_id = 1
+        self._table, self._global_table = _part_tables(version)
+        self._result_positions = result_id_positions(version=version)
+        self._op_function = ops['OpFunction']
+        self._op_function_end = ops['OpFunctionEnd']
+        self._op_label = ops['OpLabel']
+        self._function = None   # Offset of the OpFunction being built
+        self._defined = False   # Whether that function has an OpLabel
+
+    @property
+    def bound(self):
+        """The Bound of the module: one more than the largest id allocated"""
+        return self.next_id
+
+    def new_id(self):
+        """Returns a new result id"""
+        result_id = self.next_id
+        self.next_id += 1
+        return result_id
+
+    def new_ids(self, count):
+        """Returns a range of count new result ids"""
+        start = self.next_id
+        self.next_id += count
+        return range(start, self.next_id)
+
+    def _section(self, opcode):
+        """Returns the words of the section opcode goes to"""
+        if self._function is not None:
+            part = self._global_table.get(opcode)
+            if part is not None:
+                return self.sections[part]
+            if opcode == self._op_label:
+                self._defined = True
+            elif opcode == self._op_function_end:
+                return self._end_function()
+            return self.sections[_FUNCTION_DEFINITIONS]
+        if opcode == self._op_function:
+            self._function = len(self.sections[_FUNCTION_DEFINITIONS])
+            self._defined = False
+            return self.sections[_FUNCTION_DEFINITIONS]
+        return self.sections[self._table.get(opcode, _GLOBALS)]
+
+    def _end_function(self):
+        """Moves the function being built to the declarations if it has no
+        body, and returns the section its OpFunctionEnd goes to."""
+        definitions = self.sections[_FUNCTION_DEFINITIONS]
+        start, self._function = self._function, None
+        if self._defined:
+            return definitions
+        declarations = self.sections[_FUNCTION_DECLARATIONS]
+        declarations.extend(definitions[start:])
+        del definitions[start:]
+        return declarations
+
+    def _result_position(self, opcode):
+        """Returns the index of the result id among the operands of opcode"""
+        position = self._result_positions.get(opcode)
+        if position is None:
+            raise ValueError('Opcode {} has no result id'.format(opcode))
+        return position
+
+    @staticmethod
+    def _check_word_count(word_count):
+        if word_count > MAX_WORD_COUNT:
+            raise ValueError('Instruction of {} words is longer than {}'.format(
+                word_count, MAX_WORD_COUNT))
+
+    def _end_words(self, words, start, opcode):
+        """Writes the first word of the instruction appended to words at
+        start, or removes it if it is too long."""
+        word_count = len(words) - start
+        if word_count > MAX_WORD_COUNT:
+            del words[start:]
+            self._check_word_count(word_count)
+        words[start] = word_count << WORD_COUNT_SHIFT | opcode
+
+    def emit(self, opcode, *operands):
+        """Appends an instruction.  The operands are words; see emit_words
+        for literal strings and other multi-word operands.  Raises
+        ValueError if it would be longer than MAX_WORD_COUNT words."""
+        self._check_word_count(len(operands) + 1)
+        words = self._section(opcode)
+        words.append((len(operands) + 1) << WORD_COUNT_SHIFT | opcode)
+        words.extend(operands)
+
+    def emit_words(self, opcode, operands):
+        """Appends an instruction whose operand words are given as an
+        iterable, e.g. an array('I') built with binary.encode_string.
+        Raises ValueError as emit does, leaving the module unchanged."""
+        words = self._section(opcode)
+        start = len(words)
+        words.append(0)
+        words.extend(operands)
+        self._end_words(words, start, opcode)
+
+    def define(self, opcode, *operands):
+        """Appends an instruction with a new result id and returns the id.
+        The operands are the words other than the result id, which goes
+        where the grammar puts it: first, or after the result type.  Raises
+        ValueError if opcode has no result id."""
+        position = self._result_position(opcode)
+        self._check_word_count(len(operands) + 2)
+        result_id = self.next_id
+        self.next_id += 1
+        words = self._section(opcode)
+        words.append((len(operands) + 2) << WORD_COUNT_SHIFT | opcode)
+        if position:
+            words.append(operands[0])
+            words.append(result_id)
+            words.extend(operands[1:])
+        else:
+            words.append(result_id)
+            words.extend(operands)
+        return result_id
+
+    def define_words(self, opcode, operands):
+        """Like define, with the operand words given as an iterable"""
+        position = self._result_position(opcode)
+        result_id = self.next_id
+        operands = iter(operands)
+        words = self._section(opcode)
+        start = len(words)
+        words.append(0)
+        if position:
+            words.append(next(operands))
+        words.append(result_id)
+        words.extend(operands)
+        self._end_words(words, start, opcode)
+        self.next_id += 1
+        return result_id
+
+    def header(self):
+        """Returns the header words as an array('I')"""
+        return array.array('I', [MAGIC_NUMBER, self.module_version, self.generator,
+                                 self.next_id, 0])
+
+    def word_count(self):
+        """Returns the number of words in the module"""
+        return HEADER_WORDS + sum(len(words) for words in self.sections)
+
+    def write(self, out):
+        """Writes the module to a binary file object, one section at a time"""
+        if self._function is not None:
+            raise ValueError('Function without OpFunctionEnd')
+        out.write(self.header())
+        for words in self.sections:
+            out.write(words)
+
+    def to_bytes(self):
+        """Returns the module as bytes"""
+        if self._function is not None:
+            raise ValueError('Function without OpFunctionEnd')
+        return b''.join([self.header()] + self.sections)
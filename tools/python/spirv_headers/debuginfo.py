@@ -0,0 +1,216 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Finding the debug information of SPIR-V modules.
+
+Debug information is what a module can lose without changing what it
+computes: the debug instructions (names, source text and line numbers), and
+the extended instructions of the debug sets, NonSemantic.* and the
+DebugInfo and OpenCL.DebugInfo.100 sets, together with their
+OpExtInstImports and the SPV_KHR_non_semantic_info extension that allows
+NonSemantic.* sets.  This module removes all of them.  OpString counts
+as a debug instruction: only OpLine, OpSource and the debug sets may refer
+to one.
+
+kept_ranges walks a module once and returns the runs of instructions left
+when the debug information is removed, so that they can be copied or
+hashed as slices; index_kept_ranges finds them with array operations over
+an index.InstructionIndex.  strip_debug writes a module without its debug
+information as a few large slices of the original.
+"""
+
+import array
+import io
+
+from .binary import (HEADER_WORDS, OPCODE_MASK, WORD_COUNT_SHIFT,
+                     InvalidBinaryError, as_words, decode_string, native_words,
+                     read_header)
+from .index import InstructionIndex
+from .tables import DEFAULT_VERSION, load_spv
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# The instructions that only carry debug information.  Names missing from
+# older headers are skipped.
+DEBUG_OPNAMES = ('OpName', 'OpMemberName', 'OpString', 'OpLine', 'OpNoLine',
+                 'OpSource', 'OpSourceContinued', 'OpSourceExtension',
+                 'OpModuleProcessed')
+
+# Prefix of the names of the extended instruction sets that may be removed.
+NON_SEMANTIC_PREFIX = 'NonSemantic.'
+
+# The other extended instruction sets that only carry debug information.
+DEBUG_INFO_SETS = ('DebugInfo', 'OpenCL.DebugInfo.100')
+
+# The extension that NonSemantic.* imports require.
+NON_SEMANTIC_EXTENSION = 'SPV_KHR_non_semantic_info'
+
+_debug_opcodes_cache = {}
+
+
+def debug_opcodes(version=DEFAULT_VERSION):
+    """Returns the frozenset of the opcodes in DEBUG_OPNAMES"""
+    opcodes = _debug_opcodes_cache.get(version)
+    if opcodes is None:
+        ops = load_spv(version)['Op']
+        opcodes = frozenset(ops[name] for name in DEBUG_OPNAMES if name in ops)
+        _debug_opcodes_cache[version] = opcodes
+    return opcodes
+
+
+def is_debug_set(name):
+    """Returns True if the extended instruction set called name only
+    carries debug information"""
+    return name.startswith(NON_SEMANTIC_PREFIX) or name in DEBUG_INFO_SETS
+
+
+def kept_ranges(words, version=DEFAULT_VERSION):
+    """Returns the instructions of a module other than its debug information
+    as word offset ranges, in a flat array('I'): range i is
+    [ranges[2 * i], ranges[2 * i + 1]).  Adjacent kept instructions are
+    merged into one range, and the header is not included.
+
+    Arguments:
+        words: The module as a sequence of native-valued words (see
+               binary.native_words), with a header already checked.
+        version: The headers to take opcodes from.
+    """
+    ops = load_spv(version)['Op']
+    debug = debug_opcodes(version)
+    op_ext_inst, op_ext_inst_import = ops['OpExtInst'], ops['OpExtInstImport']
+    op_extension = ops['OpExtension']
+    debug_sets = set()      # Ids of the imports of debug sets
+    ranges = array.array('I')
+    start = None            # Start of the current range of kept instructions
+    n = len(words)
+    offset = HEADER_WORDS
+    while offset < n:
+        word = words[offset]
+        opcode = word & OPCODE_MASK
+        word_count = word >> WORD_COUNT_SHIFT
+        if word_count == 0:
+            raise InvalidBinaryError('Instruction with word count 0', offset)
+        if opcode in debug:
+            drop = True
+        elif opcode == op_ext_inst:
+            drop = words[offset + 3] in debug_sets
+        elif opcode == op_ext_inst_import:
+            drop = is_debug_set(decode_string(words[offset + 2:offset + word_count])[0])
+            if drop:
+                debug_sets.add(words[offset + 1])
+        elif opcode == op_extension:
+            drop = decode_string(words[offset + 1:offset + word_count])[0] == \
+                NON_SEMANTIC_EXTENSION
+        else:
+            drop = False
+        if drop:
+            if start is not None:
+                ranges.append(start)
+                ranges.append(offset)
+                start = None
+        elif start is None:
+            start = offset
+        offset += word_count
+    if offset != n:
+        raise InvalidBinaryError('Truncated instruction', offset - word_count)
+    if start is not None:
+        ranges.append(start)
+        ranges.append(n)
+    return ranges
+
+
+def index_kept_ranges(index, version=DEFAULT_VERSION):
+    """Returns the ranges of kept_ranges with array operations over an
+    index.InstructionIndex.  Only the imports and extensions are looked at
+    one by one.  Requires NumPy."""
+    if numpy is None:
+        raise ImportError('index_kept_ranges requires NumPy')
+    ops = load_spv(version)['Op']
+    words, offsets, opcodes = index.words, index.offsets, index.opcodes
+    drop = numpy.isin(opcodes, tuple(debug_opcodes(version)))
+    debug_sets = []
+    for i in numpy.flatnonzero(opcodes == ops['OpExtInstImport']):
+        operands = index.operands(int(offsets[i])).tolist()
+        if is_debug_set(decode_string(operands, 1)[0]):
+            debug_sets.append(operands[0])
+            drop[i] = True
+    for i in numpy.flatnonzero(opcodes == ops['OpExtension']):
+        if decode_string(index.operands(int(offsets[i])).tolist())[0] == NON_SEMANTIC_EXTENSION:
+            drop[i] = True
+    if debug_sets:
+        ext_inst = numpy.flatnonzero(opcodes == ops['OpExtInst'])
+        drop[ext_inst] |= numpy.isin(words[offsets[ext_inst] + 3], debug_sets)
+    # Ranges start at kept instructions following dropped ones (or the
+    # header) and end at dropped instructions following kept ones (or the
+    # end of the module).
+    kept = numpy.concatenate(([False], ~drop, [False]))
+    changes = numpy.flatnonzero(kept[1:] != kept[:-1])
+    bounds = numpy.append(offsets, len(words)).astype(numpy.uint32)
+    return array.array('I', bounds[changes].tobytes())
+
+
+def strip_debug(data, out, version=DEFAULT_VERSION):
+    """Writes a module without its debug information to a binary file
+    object and returns the number of bytes written.
+
+    The kept instructions are written as memoryview slices of data, one
+    per run of kept instructions, so nothing is copied or re-encoded: the
+    output keeps the byte order of the input, and its header is unchanged.
+    The debug information is found with NumPy when it is available.
+
+    Arguments:
+        data: A bytes-like object holding the module, in either byte order,
+              e.g. an mmap of the file.
+        out: A binary file object.
+        version: The headers to take opcodes from.
+    """
+    if numpy is None:
+        words = native_words(data)
+        read_header(words)
+        ranges = kept_ranges(words, version)
+    else:
+        ranges = index_kept_ranges(InstructionIndex(data), version)
+    # Offsets are the same in either byte order: slice the original words.
+    words = as_words(data)
+    if len(ranges) and ranges[0] == HEADER_WORDS:
+        ranges[0] = 0
+    else:
+        ranges = array.array('I', [0, HEADER_WORDS]) + ranges
+    written = 0
+    for i in range(0, len(ranges), 2):
+        written += out.write(words[ranges[i]:ranges[i + 1]])
+    return written
+
+
+def stripped(data, version=DEFAULT_VERSION):
+    """Returns a module without its debug information, as bytes.  See
+    strip_debug."""
+    out = io.BytesIO()
+    strip_debug(data, out, version)
+    return out.getvalue()
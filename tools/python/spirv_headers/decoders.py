@@ -0,0 +1,328 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Operand decoders compiled from the JSON grammars.
+
+Rather than interpreting the operand list of an instruction each time one is
+decoded, load_decoders() turns the grammar into one straight-line function
+per opcode.  The generated source is written once to a cache directory and
+imported from there, so later runs only load its bytecode.
+
+A decoder takes the operand words of an instruction and returns a list of
+(kind, value) pairs, one per operand word group: enumerant parameters and
+the halves of composite kinds such as PairLiteralIntegerIdRef get their own
+pairs.  Values are ints, except for LiteralString operands which are str.
+LiteralContextDependentNumber operands take the remaining words, low word
+first.  The operands following the opcode of an OpSpecConstantOp are decoded
+as those of that opcode.
+
+The literals of OpSwitch are as wide as the type of its selector, which the
+instruction does not tell: decoders take the number of words of those
+literals as a second argument, 1 by default.  SwitchWidths follows the
+types of a module's ids to provide it.
+"""
+
+import hashlib
+import importlib.util
+import os
+import tempfile
+
+from .binary import InvalidBinaryError, decode_string
+from .grammar import (SELECTOR_SIZED_KINDS, instructions, operand_kinds,
+                      result_id_positions, word_kinds)
+from .tables import (CORE_GRAMMAR, DEFAULT_VERSION, default_cache_dir,
+                     header_path, load_spv)
+
+# Changed whenever the generated code changes, so stale files are not used.
+DECODER_FORMAT = 3
+
+_decoders_cache = {}
+
+
+def decode_number(words, start):
+    """Returns the integer held in words[start:], low word first"""
+    value = 0
+    for shift, word in enumerate(words[start:]):
+        value |= word << (32 * shift)
+    return value
+
+
+def _wrong_count(words, expected):
+    raise InvalidBinaryError('Expected {} operand words, got {}'.format(expected, len(words)))
+
+
+class _DecoderWriter:
+    """Writes the Python source of the decoders of one grammar"""
+
+    def __init__(self, kinds):
+        self.kinds = kinds
+        self.lines = []
+        self.enum_functions = {}   # kind -> function name, once written
+
+    def read(self, kind, indent):
+        """Returns the lines reading one operand of kind at word i"""
+        bases = word_kinds(kind, self.kinds)
+        if bases is not None:
+            lines = ["out.append(('{}', w[i{}]))".format(base, ' + {}'.format(k) if k else '')
+                     for k, base in enumerate(bases)]
+            lines.append('i += {}'.format(len(bases)))
+        elif kind == 'LiteralString':
+            lines = ['text, i = _decode_string(w, i)',
+                     "out.append(('LiteralString', text))"]
+        elif kind == 'LiteralContextDependentNumber':
+            lines = ["out.append(('{}', _decode_number(w, i)))".format(kind),
+                     'i = len(w)']
+        elif kind in SELECTOR_SIZED_KINDS:
+            literal, other = self.kinds[kind].bases
+            lines = ["out.append(('{}', _decode_number(w[i:i + literal_words], 0)))".format(literal),
+                     "out.append(('{}', w[i + literal_words]))".format(other),
+                     'i += literal_words + 1']
+        elif kind == 'LiteralSpecConstantOpInteger':
+            lines = ["out.append(('{}', w[i]))".format(kind),
+                     'out.extend(_spec_constant_op(w, i))',
+                     'i = len(w)']
+        else:
+            lines = ['i = {}(w, i, out)'.format(self.enum_function(kind))]
+        return [indent + line for line in lines]
+
+    def enum_function(self, kind):
+        """Writes the function reading an enum operand with parameters, if
+        not written yet, and returns its name."""
+        name = self.enum_functions.get(kind)
+        if name is not None:
+            return name
+        name = self.enum_functions[kind] = '_' + kind
+        operand_kind = self.kinds[kind]
+        lines = []
+        if operand_kind.category == 'BitEnum':
+            for bit, parameters in sorted(operand_kind.parameters.items()):
+                lines.append('    if v & 0x{:x}:'.format(bit))
+                for parameter in parameters:
+                    lines.extend(self.read(parameter, '        '))
+            self.lines.extend(['def {}(w, i, out):'.format(name),
+                               '    v = w[i]',
+                               "    out.append(('{}', v))".format(kind),
+                               '    i += 1'] + lines + ['    return i', '', ''])
+        else:
+            table = []
+            for value, parameters in sorted(operand_kind.parameters.items()):
+                function = '{}_{}'.format(name, value)
+                body = []
+                for parameter in parameters:
+                    body.extend(self.read(parameter, '    '))
+                self.lines.extend(['def {}(w, i, out):'.format(function)] + body +
+                                  ['    return i', '', ''])
+                table.append('    {}: {},'.format(value, function))
+            self.lines.extend(['{}_parameters = {{'.format(name)] + table + ['}', '', ''])
+            self.lines.extend(['def {}(w, i, out):'.format(name),
+                               '    v = w[i]',
+                               "    out.append(('{}', v))".format(kind),
+                               '    parameters = {}_parameters.get(v)'.format(name),
+                               '    if parameters is None:',
+                               '        return i + 1',
+                               '    return parameters(w, i + 1, out)', '', ''])
+        return name
+
+    def write_instruction(self, inst):
+        """Writes the decoder of one instruction and returns its name"""
+        name = 'op_{}'.format(inst.opcode)
+        initial = []
+        body = []
+        position = 0
+        for operand in inst.operands:
+            bases = word_kinds(operand.kind, self.kinds)
+            if not body and operand.quantifier is None and bases is not None:
+                for base in bases:
+                    initial.append("('{}', w[{}])".format(base, position))
+                    position += 1
+                continue
+            if not body:
+                body.append('    i = {}'.format(position))
+            if operand.quantifier is None:
+                body.extend(self.read(operand.kind, '    '))
+            elif operand.quantifier == '*' and bases is not None and len(bases) == 1:
+                # Repeated single words always come last: take the rest.
+                body.append("    out.extend([('{}', word) for word in w[i:]])".format(bases[0]))
+                body.append('    i = len(w)')
+            else:
+                body.append('    {} i < len(w):'.format('if' if operand.quantifier == '?' else 'while'))
+                body.extend(self.read(operand.kind, '        '))
+        lines = ['def {}(w, literal_words=1):'.format(name),
+                 '    """{}"""'.format(inst.opname)]
+        if body:
+            lines.append('    out = [{}]'.format(', '.join(initial)))
+            lines.extend(body)
+            lines.extend(['    if i != len(w):',
+                          '        _wrong_count(w, i)',
+                          '    return out'])
+        else:
+            lines.extend(['    if len(w) != {}:'.format(position),
+                          '        _wrong_count(w, {})'.format(position),
+                          '    return [{}]'.format(', '.join(initial))])
+        self.lines.extend(lines + ['', ''])
+        return name
+
+    def write(self, insts, header):
+        """Returns the source of the decoders of insts"""
+        self.lines.extend(header + ['', ''])
+        # The operands following the opcode of an OpSpecConstantOp are those
+        # of that opcode after its result type and id.
+        self.lines.extend(['def _spec_constant_op(w, i):',
+                           '    decoder = decoders.get(w[i])',
+                           '    if decoder is None:',
+                           "        return [('IdRef', word) for word in w[i + 1:]]",
+                           '    return decoder([0, 0] + list(w[i + 1:]))[2:]', '', ''])
+        table = []
+        seen = set()
+        for inst in insts:
+            if inst.opcode not in seen:
+                seen.add(inst.opcode)
+                table.append('    {}: {},'.format(inst.opcode, self.write_instruction(inst)))
+        self.lines.extend(['decoders = {'] + table + ['}'])
+        return '\n'.join(self.lines) + '\n'
+
+
+def _grammar_digest(name, version):
+    digest = hashlib.sha256(str(DECODER_FORMAT).encode())
+    for grammar_name in sorted({CORE_GRAMMAR, name}):
+        with open(header_path(grammar_name, version), 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def decoder_source(name=CORE_GRAMMAR, version=DEFAULT_VERSION):
+    """Returns the Python source of the decoders of a grammar.
+
+    Arguments:
+        name: The grammar file name, e.g. 'spirv.core.grammar.json'.
+        version: One of tables.VERSIONS.
+    """
+    header = ['# Generated by spirv_headers.decoders from {}/{}. Do not edit.'.format(version, name)]
+    writer = _DecoderWriter(operand_kinds(name, version))
+    return writer.write(instructions(name, version), header)
+
+
+def load_decoders(name=CORE_GRAMMAR, version=DEFAULT_VERSION, cache_dir=None):
+    """Returns a dict mapping the opcodes of a grammar to their decoders.
+
+    The decoders are generated on first use and saved in cache_dir
+    (default_cache_dir() by default), under a name derived from the grammar
+    contents.  If the directory cannot be written, they are compiled in
+    memory instead.
+    """
+    key = (name, version)
+    result = _decoders_cache.get(key)
+    if result is not None:
+        return result
+    if cache_dir is None:
+        cache_dir = default_cache_dir()
+    module_name = 'decoders_{}_{}_{}'.format(
+        name.replace('.json', '').replace('.', '_').replace('-', '_'),
+        version.replace('.', '_'), _grammar_digest(name, version))
+    path = os.path.join(cache_dir, module_name + '.py')
+    if not os.path.exists(path):
+        source = decoder_source(name, version)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with tempfile.NamedTemporaryFile('w', dir=cache_dir, suffix='.tmp',
+                                             delete=False) as f:
+                f.write(source)
+            os.replace(f.name, path)
+        except OSError:
+            path = None
+    namespace = {'_decode_string': decode_string,
+                 '_decode_number': decode_number,
+                 '_wrong_count': _wrong_count}
+    if path is None:
+        exec(compile(source, '<{}>'.format(module_name), 'exec'), namespace)
+        result = namespace['decoders']
+    else:
+        spec = importlib.util.spec_from_file_location('spirv_headers.' + module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        module.__dict__.update(namespace)
+        spec.loader.exec_module(module)
+        result = module.decoders
+    _decoders_cache[key] = result
+    return result
+
+
+def decode(opcode, operands, version=DEFAULT_VERSION, literal_words=1):
+    """Returns the (kind, value) pairs of the operands of a core
+    instruction.
+
+    Raises InvalidBinaryError for unknown opcodes and malformed operands.
+
+    Arguments:
+        opcode: The opcode of the instruction.
+        operands: Its operand words.
+        version: The grammar to decode with.
+        literal_words: The number of words of the literals of an OpSwitch,
+                       see SwitchWidths.
+    """
+    decoder = load_decoders(version=version).get(opcode)
+    if decoder is None:
+        raise InvalidBinaryError('Unknown opcode {}'.format(opcode))
+    try:
+        return decoder(operands, literal_words)
+    except IndexError:
+        raise InvalidBinaryError('Truncated operands of opcode {}'.format(opcode))
+
+
+class SwitchWidths:
+    """Follows the integer types of the ids of a module, to tell the width
+    of OpSwitch literals: those are as wide as the type of the selector.
+
+    Instructions are passed to add() in module order; literal_words() then
+    answers for the selector of an OpSwitch.  Only the ids of integer types
+    wider than 32 bits are remembered, so modules without any cost one
+    comparison per instruction.
+    """
+
+    __slots__ = ('_op_type_int', '_typed', '_wide_types', '_wide_ids')
+
+    def __init__(self, version=DEFAULT_VERSION):
+        self._op_type_int = load_spv(version)['Op']['OpTypeInt']
+        # Opcodes with an IdResultType, which comes just before the IdResult.
+        self._typed = frozenset(opcode for opcode, position
+                                in result_id_positions(CORE_GRAMMAR, version).items()
+                                if position == 1)
+        self._wide_types = {}   # Integer type id -> words per value
+        self._wide_ids = {}     # Id -> words per value, for ids of those types
+
+    def add(self, opcode, operands):
+        """Records the type of the result of an instruction"""
+        if opcode == self._op_type_int:
+            if operands[1] > 32:
+                self._wide_types[operands[0]] = (operands[1] + 31) // 32
+        elif self._wide_types and opcode in self._typed:
+            words = self._wide_types.get(operands[0])
+            if words is not None:
+                self._wide_ids[operands[1]] = words
+
+    def literal_words(self, selector):
+        """Returns the number of words of each literal of an OpSwitch on
+        selector"""
+        return self._wide_ids.get(selector, 1)
@@ -0,0 +1,177 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Removes duplicate types and constants from SPIR-V modules.
+
+Types and constants are hash-consed: each OpType* and OpConstant*
+instruction is keyed on its words, with its result id blanked and the ids
+it uses already replaced by those of the instructions they duplicate.  An
+instruction whose key was seen before is dropped, and its result id mapped
+to the first one's in a flat remap array indexed by id.  Since types and
+constants are declared before they are used, one walk finds every
+duplicate, including types built from duplicates; a second one writes the
+module with all uses rewritten through the array.
+
+Ids that are decorated, or declared by OpTypeForwardPointer, are kept
+apart: two structs with different member offsets must stay two types.
+Specialization constants are left alone, and names of dropped ids are
+dropped with them.
+"""
+
+import array
+import collections
+
+from .binary import (HEADER_WORDS, OPCODE_MASK, WORD_COUNT_SHIFT, InvalidBinaryError,
+                     native_words, read_header)
+from .grammar import instructions, result_id_positions
+from .ids import IdOperands
+from .tables import CORE_GRAMMAR, DEFAULT_VERSION, load_spv
+
+# The outcome of dedup: the new module, as bytes in native byte order, the
+# number of instructions dropped, and the sizes before and after in bytes.
+Deduplication = collections.namedtuple('Deduplication', [
+    'data', 'removed', 'old_size', 'new_size'])
+
+_dedup_opcodes_cache = {}
+
+
+def dedup_opcodes(version=DEFAULT_VERSION):
+    """Returns the frozenset of the opcodes dedup may merge: the OpType* and
+    OpConstant* instructions of the grammar that have a result id"""
+    opcodes = _dedup_opcodes_cache.get(version)
+    if opcodes is None:
+        results = result_id_positions(CORE_GRAMMAR, version)
+        opcodes = frozenset(
+            inst.opcode for inst in instructions(CORE_GRAMMAR, version)
+            if inst.opclass in ('Type-Declaration', 'Constant-Creation') and
+            inst.opname.startswith(('OpType', 'OpConstant')) and
+            inst.opcode in results and not inst.opname.endswith('ContinuedINTEL'))
+        _dedup_opcodes_cache[version] = opcodes
+    return opcodes
+
+
+def dedup(data, version=DEFAULT_VERSION):
+    """Returns a Deduplication of a module's types and constants.
+
+    Arguments:
+        data: A bytes-like object holding the module, in either byte order.
+        version: The headers and grammar to classify instructions with.
+    """
+    words = native_words(data)
+    bound = read_header(words).bound
+    ops = load_spv(version)['Op']
+    mergeable = dedup_opcodes(version)
+    results = result_id_positions(CORE_GRAMMAR, version)
+    annotations = {ops[name] for name in (
+        'OpDecorate', 'OpMemberDecorate', 'OpGroupDecorate', 'OpGroupMemberDecorate',
+        'OpDecorateId', 'OpDecorateString', 'OpMemberDecorateString') if name in ops}
+    continued = {opcode for name, opcode in ops.items() if name.endswith('ContinuedINTEL')}
+    op_type_forward_pointer = ops['OpTypeForwardPointer']
+    names = {ops['OpName'], ops['OpMemberName']}
+    id_operands = IdOperands(version)
+    positions_of = id_operands.positions
+
+    # Find the duplicates.
+    remap = array.array('I', range(bound))
+    distinct = {}       # Key -> id of the first instruction with that key
+    pinned = set()      # Ids that may not be merged
+    last = None         # (result id, key, merged) of the previous candidate
+    n = len(words)
+    offset = HEADER_WORDS
+    try:
+        while offset < n:
+            word = words[offset]
+            opcode = word & OPCODE_MASK
+            word_count = word >> WORD_COUNT_SHIFT
+            if word_count == 0:
+                raise InvalidBinaryError('Instruction with word count 0', offset)
+            operands = words[offset + 1:offset + word_count]
+            if opcode in mergeable:
+                result_position = results[opcode]
+                result_id = operands[result_position]
+                key = array.array('I', words[offset:offset + word_count])
+                for position in positions_of(opcode, operands):
+                    key[1 + position] = remap[key[1 + position]]
+                key[1 + result_position] = 0
+                key = key.tobytes()
+                first = distinct.get(key)
+                if result_id in pinned:
+                    last = None
+                elif first is None:
+                    distinct[key] = result_id
+                    last = (result_id, key, False)
+                else:
+                    remap[result_id] = first
+                    last = (result_id, key, True)
+            elif opcode in continued:
+                # The previous instruction goes on here: leave it alone.
+                if last is not None:
+                    result_id, key, merged = last
+                    if merged:
+                        remap[result_id] = result_id
+                    else:
+                        del distinct[key]
+                    pinned.add(result_id)
+                    last = None
+            else:
+                last = None
+                if opcode in annotations:
+                    pinned.update(operands[position]
+                                  for position in positions_of(opcode, operands))
+                elif opcode == op_type_forward_pointer:
+                    pinned.add(operands[0])
+            offset += word_count
+        if offset != n:
+            raise InvalidBinaryError('Truncated instruction', offset - word_count)
+        old_size = 4 * n
+
+        # Write the module without them, with uses rewritten.
+        out = array.array('I', words[:HEADER_WORDS])
+        removed = 0
+        offset = HEADER_WORDS
+        while offset < n:
+            word = words[offset]
+            opcode = word & OPCODE_MASK
+            word_count = word >> WORD_COUNT_SHIFT
+            operands = words[offset + 1:offset + word_count]
+            if opcode in mergeable:
+                result_id = operands[results[opcode]]
+                drop = remap[result_id] != result_id
+            elif opcode in names:
+                drop = remap[operands[0]] != operands[0]
+            else:
+                drop = False
+            if drop:
+                removed += 1
+            else:
+                start = len(out) + 1
+                out.extend(words[offset:offset + word_count])
+                for position in positions_of(opcode, operands):
+                    out[start + position] = remap[out[start + position]]
+            offset += word_count
+    except IndexError:
+        raise InvalidBinaryError('Id not below the bound {}'.format(bound), offset)
+    return Deduplication(out.tobytes(), removed, old_size, 4 * len(out))
@@ -0,0 +1,128 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Digests of SPIR-V modules that ignore their debug information.
+
+Two builds of a shader that differ only in names, line numbers, source text
+or the instructions of debug sets such as NonSemantic.* and
+OpenCL.DebugInfo.100 (see debuginfo) get the same canonical digest, which
+makes it a key for caches of compiled pipelines.  The generator and Bound
+header words are left out too, since they change with the tools and the
+debug information.  With canonical_ids, ids are renumbered in order of
+first appearance before hashing, so that modules differing only in their
+id numbering match as well.
+"""
+
+import array
+import hashlib
+import sys
+
+from .binary import (OPCODE_MASK, WORD_COUNT_SHIFT, InvalidBinaryError, native_words,
+                     read_header)
+from .debuginfo import index_kept_ranges, kept_ranges
+from .ids import IdOperands
+from .index import InstructionIndex
+from .tables import DEFAULT_VERSION
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Words of renumbered instructions collected before each hash update.
+CANONICAL_CHUNK_WORDS = 1 << 16
+
+
+def canonical_digest(data, canonical_ids=False, algorithm='sha256',
+                     version=DEFAULT_VERSION):
+    """Returns the digest of a module without its debug information, as
+    bytes.
+
+    The words hashed are those of the module in little-endian order, from
+    the version and schema header words and the kept instructions, whichever
+    the byte order of the module.  The debug information is found with
+    NumPy when it is available (see debuginfo.index_kept_ranges).
+
+    Arguments:
+        data: A bytes-like object holding the module, in either byte order.
+        canonical_ids: Renumber the ids from 1 in order of first appearance.
+        algorithm: A hashlib algorithm name.
+        version: The headers and grammar to classify instructions with.
+    """
+    words = native_words(data)
+    header = read_header(words)
+    digest = hashlib.new(algorithm)
+    digest.update(_little_endian(array.array('I', [header.version, header.schema])))
+    if numpy is None:
+        ranges = kept_ranges(words, version)
+    else:
+        ranges = index_kept_ranges(InstructionIndex(data), version)
+    if not canonical_ids:
+        # The kept ranges are hashed in place, as slices of the module.
+        for i in range(0, len(ranges), 2):
+            digest.update(_little_endian(words[ranges[i]:ranges[i + 1]]))
+        return digest.digest()
+
+    id_operands = IdOperands(version)
+    positions_of = id_operands.positions
+    remap = array.array('I', [0]) * header.bound
+    next_id = 1
+    chunk = array.array('I')
+    try:
+        for i in range(0, len(ranges), 2):
+            offset, end = ranges[i], ranges[i + 1]
+            while offset < end:
+                word = words[offset]
+                word_count = word >> WORD_COUNT_SHIFT
+                start = len(chunk)
+                chunk.extend(words[offset:offset + word_count])
+                for position in positions_of(word & OPCODE_MASK,
+                                             words[offset + 1:offset + word_count]):
+                    position += start + 1
+                    result_id = chunk[position]
+                    canonical = remap[result_id]
+                    if not canonical:
+                        canonical = remap[result_id] = next_id
+                        next_id += 1
+                    chunk[position] = canonical
+                offset += word_count
+                if len(chunk) >= CANONICAL_CHUNK_WORDS:
+                    digest.update(_little_endian(chunk))
+                    del chunk[:]
+    except IndexError:
+        raise InvalidBinaryError('Id not below the bound {}'.format(header.bound), offset)
+    digest.update(_little_endian(chunk))
+    return digest.digest()
+
+
+def _little_endian(words):
+    """Returns words, a memoryview or array('I'), in a form whose bytes are
+    in little-endian order"""
+    if sys.byteorder == 'little':
+        return words
+    swapped = array.array('I', words)
+    swapped.byteswap()
+    return swapped
@@ -0,0 +1,324 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Streaming disassembly of SPIR-V binaries to text.
+
+The text follows the usual assembly syntax:
+
+              OpCapability Shader
+         %1 = OpExtInstImport "GLSL.std.450"
+      %main = OpFunction %void None %3
+
+Operands are decoded with the compiled decoders, enumerants are named from
+the spv tables and masks are split into their flags.  Lines are written to
+the output file object in batches as the module is read, so the whole text
+is never held in memory.
+"""
+
+import re
+import struct
+
+from .binary import (HEADER_WORDS, InvalidBinaryError, decode_string,
+                     iter_instructions, iter_stream, native_words, read_header)
+from .decoders import SwitchWidths, load_decoders
+from .enums import decode_mask, names
+from .extinst import extinst_grammar_name, load_extinst
+from .grammar import operand_kinds
+from .layout import iter_section
+from .tables import CORE_GRAMMAR, DEFAULT_VERSION, load_generators, load_spv
+
+# Column at which opcodes start.
+OPCODE_COLUMN = 15
+
+# Lines written to the output at a time.
+DEFAULT_BATCH_LINES = 4096
+
+_FLOAT_FORMATS = {16: '<e', 32: '<f', 64: '<d'}
+_UNSAFE_NAME = re.compile(r'[^A-Za-z0-9_]')
+
+
+def _shortest_float(number, fmt, data):
+    """Returns the shortest text that reads back as the float packed in
+    data with struct format fmt."""
+    for precision in range(1, 17):
+        text = '{:.{}g}'.format(number, precision)
+        if struct.pack(fmt, float(text)) == data:
+            return text
+    return repr(number)
+
+
+def quote(text):
+    """Returns text as a literal string operand"""
+    return '"{}"'.format(text.replace('\\', '\\\\').replace('"', '\\"'))
+
+
+class Disassembler:
+    """Turns the instructions of a module into lines of text.
+
+    The names given by OpName are used for ids when friendly_names is set;
+    otherwise ids are printed as %<number>.  Constants are printed according
+    to the width, signedness or floating-point type of their result type.
+    """
+
+    def __init__(self, friendly_names=False, version=DEFAULT_VERSION):
+        self.friendly_names = friendly_names
+        self.version = version
+        ops = load_spv(version)['Op']
+        self._opnames = names('Op', version)
+        self._decoders = load_decoders(CORE_GRAMMAR, version)
+        self._op_name = ops['OpName']
+        self._op_ext_inst_import = ops['OpExtInstImport']
+        self._op_ext_inst = ops['OpExtInst']
+        self._op_type_int = ops['OpTypeInt']
+        self._op_type_float = ops['OpTypeFloat']
+        self._op_switch = ops['OpSwitch']
+        self._formatters = {}
+        for kind, operand_kind in operand_kinds(CORE_GRAMMAR, version).items():
+            self._formatters[kind] = self._formatter(kind, operand_kind.category)
+        self.reset()
+
+    def reset(self):
+        """Forgets the ids, names and types of the previous module"""
+        self._names = {}
+        self._used_names = set()
+        self._types = {}       # Type id -> (format, width, signed)
+        self._ext_sets = {}    # Set id -> (tables module, decoders)
+        self._widths = SwitchWidths(self.version)
+
+    def _formatter(self, kind, category):
+        if category == 'Id':
+            return self.format_id
+        if kind == 'LiteralString':
+            return quote
+        if kind == 'LiteralFloat':
+            def format_float(value):
+                data = struct.pack('<I', value)
+                return _shortest_float(struct.unpack('<f', data)[0], '<f', data)
+            return format_float
+        if kind == 'LiteralSpecConstantOpInteger':
+            return lambda value: self._opnames.get(value, 'Op{}'.format(value))[2:]
+        if category == 'ValueEnum' and kind in load_spv(self.version):
+            table = names(kind, self.version)
+            return lambda value: table.get(value, str(value))
+        if category == 'BitEnum' and kind + 'Mask' in load_spv(self.version):
+            cache = {0: 'None'}
+
+            def format_mask(value):
+                text = cache.get(value)
+                if text is None:
+                    text = cache[value] = '|'.join(decode_mask(kind, value, self.version))
+                return text
+            return format_mask
+        return str
+
+    def add_name(self, result_id, name):
+        """Gives result_id a friendly name, made unique and restricted to
+        the characters allowed in ids."""
+        if result_id in self._names:
+            return
+        name = _UNSAFE_NAME.sub('_', name) or str(result_id)
+        unique = name
+        suffix = 0
+        while unique in self._used_names or (unique.isdigit() and unique != str(result_id)):
+            unique = '{}_{}'.format(name, suffix)
+            suffix += 1
+        self._used_names.add(unique)
+        self._names[result_id] = unique
+
+    def format_id(self, result_id):
+        """Returns the text of an id operand"""
+        name = self._names.get(result_id)
+        return '%' + (name if name is not None else str(result_id))
+
+    def header_lines(self, header):
+        """Returns the comment lines describing a module header"""
+        generators = load_generators()
+        tool = header.generator >> 16
+        return ['; SPIR-V',
+                '; Version: {}.{}'.format((header.version >> 16) & 0xff,
+                                          (header.version >> 8) & 0xff),
+                '; Generator: {}; {}'.format(generators.get(tool, 'Unknown({})'.format(tool)),
+                                             header.generator & 0xffff),
+                '; Bound: {}'.format(header.bound),
+                '; Schema: {}'.format(header.schema)]
+
+    def _ext_inst_operands(self, operands):
+        """Returns the operand texts of an OpExtInst after its result id"""
+        module, decoders = self._ext_sets.get(operands[2], (None, None))
+        number = operands[3]
+        instruction = str(number)
+        if module is not None:
+            instruction = module.InstructionNames.get(number, instruction)
+        texts = [self.format_id(operands[0]), self.format_id(operands[2]), instruction]
+        decoder = decoders.get(number) if decoders else None
+        if decoder is None:
+            texts.extend(self.format_id(word) for word in operands[4:])
+            return texts
+        own_kinds = getattr(module, 'OperandKindNames', {})
+        for kind, value in decoder(operands[4:]):
+            formatter = self._formatters.get(kind)
+            if formatter is not None:
+                texts.append(formatter(value))
+            elif kind in own_kinds:
+                texts.append(own_kinds[kind].get(value, str(value)))
+            else:
+                texts.append(str(value))
+        return texts
+
+    def _number(self, type_id, value):
+        """Returns the text of a LiteralContextDependentNumber"""
+        kind = self._types.get(type_id)
+        if kind is None:
+            return str(value)
+        if kind[0] == 'float':
+            # Floats narrower than a word should leave the high bits 0;
+            # ignore them, as for ints.
+            value &= (1 << kind[1]) - 1
+            fmt = _FLOAT_FORMATS.get(kind[1])
+            if fmt is None:
+                return '0x{:x}'.format(value)
+            data = value.to_bytes(kind[1] // 8, 'little')
+            number = struct.unpack(fmt, data)[0]
+            if number != number or number in (float('inf'), float('-inf')):
+                # Keep NaN payloads and infinities exact.
+                return '0x{:x}'.format(value)
+            return _shortest_float(number, fmt, data)
+        width, signed = kind[1], kind[2]
+        # Signed types narrower than a word are sign-extended to the word.
+        value &= (1 << width) - 1
+        if signed and value >> (width - 1):
+            value -= 1 << width
+        return str(value)
+
+    def line(self, opcode, operands):
+        """Returns the text of one instruction"""
+        opname = self._opnames.get(opcode)
+        decoder = self._decoders.get(opcode)
+        if opname is None or decoder is None:
+            raise InvalidBinaryError('Unknown opcode {}'.format(opcode))
+        result = None
+        if opcode == self._op_ext_inst:
+            result = operands[1]
+            texts = self._ext_inst_operands(operands)
+        else:
+            try:
+                if opcode == self._op_switch:
+                    pairs = decoder(operands, self._widths.literal_words(operands[0]))
+                else:
+                    pairs = decoder(operands)
+            except IndexError:
+                raise InvalidBinaryError('Truncated operands of {}'.format(opname))
+            texts = []
+            formatters = self._formatters
+            for kind, value in pairs:
+                if kind == 'IdResult':
+                    result = value
+                elif kind == 'LiteralContextDependentNumber':
+                    texts.append(self._number(operands[0], value))
+                else:
+                    texts.append(formatters[kind](value))
+            if opcode == self._op_name and self.friendly_names:
+                self.add_name(operands[0], decode_string(operands, 1)[0])
+            elif opcode == self._op_ext_inst_import:
+                name = decode_string(operands, 1)[0]
+                grammar = extinst_grammar_name(name)
+                self._ext_sets[operands[0]] = (load_extinst(name),
+                                               grammar and load_decoders(grammar))
+            elif opcode == self._op_type_int:
+                self._types[operands[0]] = ('int', operands[1], operands[2])
+            elif opcode == self._op_type_float:
+                self._types[operands[0]] = ('float', operands[1], False)
+        self._widths.add(opcode, operands)
+        text = ' '.join([opname] + texts)
+        if result is None:
+            return ' ' * OPCODE_COLUMN + text
+        return '{:>{}} = {}'.format(self.format_id(result), OPCODE_COLUMN - 3, text)
+
+    def learn_names(self, instructions):
+        """Registers the OpName instructions among instructions, e.g. those
+        of the debug section read ahead of the rest of the module."""
+        for offset, opcode, word_count, operands in instructions:
+            if opcode == self._op_name:
+                self.add_name(operands[0], decode_string(operands, 1)[0])
+
+
+def disassemble(source, out, friendly_names=False, header=True,
+                version=DEFAULT_VERSION, batch_lines=DEFAULT_BATCH_LINES):
+    """Writes the text of the modules in source to out and returns the
+    number of instructions written.
+
+    Arguments:
+        source: A bytes-like object holding a module, or a binary file
+                object holding one or more concatenated modules, in either
+                byte order.
+        out: A text file object.
+        friendly_names: Print ids by their OpName.  The debug section is
+                        read ahead for the names used by entry points; with
+                        a file object this needs it to be seekable, and only
+                        applies to the first module.
+        header: Write the module header as comments.
+        version: The headers and grammar to decode with.
+        batch_lines: Lines gathered before each write to out.
+    """
+    disassembler = Disassembler(friendly_names, version)
+    if hasattr(source, 'read'):
+        if friendly_names and source.seekable():
+            start = source.tell()
+            disassembler.learn_names(iter_section(source, 'debug', version))
+            source.seek(start)
+        instructions = iter_stream(source)
+    else:
+        words = native_words(source)
+        if friendly_names:
+            disassembler.learn_names(iter_section(words, 'debug', version))
+        instructions = _with_header(words)
+    lines = []
+    count = 0
+    for offset, opcode, word_count, operands in instructions:
+        if opcode is None:
+            if count:
+                disassembler.reset()
+            if header:
+                lines.extend(disassembler.header_lines(read_header(operands)))
+            continue
+        try:
+            lines.append(disassembler.line(opcode, operands))
+        except InvalidBinaryError as e:
+            raise InvalidBinaryError(str(e), offset)
+        count += 1
+        if len(lines) >= batch_lines:
+            out.write('\n'.join(lines) + '\n')
+            lines = []
+    if lines:
+        out.write('\n'.join(lines) + '\n')
+    return count
+
+
+def _with_header(words):
+    """Yields the header and instructions of a module in memory, in the
+    form iter_stream yields them."""
+    yield 0, None, HEADER_WORDS, words[:HEADER_WORDS]
+    yield from iter_instructions(words)
@@ -0,0 +1,164 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Value to name lookups for the spv tables"""
+
+from .tables import DEFAULT_VERSION, grammar_kind, load_grammar, load_spv
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_names_cache = {}
+_bits_cache = {}
+
+
+def _preferred_names(category, version):
+    """Returns the set of spv names the grammar lists as primary spellings.
+
+    Aliases are listed after the preferred spelling in the grammar, either
+    in an 'aliases' array or, in older grammars, as separate entries that
+    share a value.  Only the first spelling seen for a value is preferred.
+    """
+    grammar = load_grammar(version=version)
+    kind = grammar_kind(category)
+    if kind is None:
+        entries = [(i['opname'], i['opcode']) for i in grammar['instructions']]
+    else:
+        entries = []
+        for operand_kind in grammar['operand_kinds']:
+            if operand_kind['kind'] == kind:
+                entries = [(e['enumerant'], e['value'])
+                           for e in operand_kind['enumerants']]
+                break
+
+    preferred = set()
+    seen = set()
+    for name, value in entries:
+        if value not in seen:
+            seen.add(value)
+            preferred.add(name)
+            # The generated headers prefix names that start with a digit.
+            preferred.add(kind + name if kind and name[0].isdigit() else name)
+    return preferred
+
+
+def names(category, version=DEFAULT_VERSION):
+    """Returns a dict mapping each value of a spv category to its name.
+
+    The index is built on first use and cached, so the returned dict can be
+    bound once and used for O(1) lookups.  When several names share a value,
+    the grammar's preferred spelling wins over its aliases.
+
+    Arguments:
+        category: A spv table name, e.g. 'Op', 'BuiltIn' or 'MemoryAccessMask'.
+        version: One of tables.VERSIONS.
+    """
+    key = (category, version)
+    index = _names_cache.get(key)
+    if index is not None:
+        return index
+
+    table = load_spv(version)[category]
+    if not isinstance(table, dict):
+        raise KeyError('{} is not an enumeration'.format(category))
+    preferred = _preferred_names(category, version)
+
+    index = {}
+    for name, value in table.items():
+        current = index.get(value)
+        if current is None or (name in preferred and current not in preferred):
+            index[value] = name
+    _names_cache[key] = index
+    return index
+
+
+def name_of(category, value, version=DEFAULT_VERSION, default=None):
+    """Returns the name of a value in a spv category, or default."""
+    return names(category, version).get(value, default)
+
+
+def all_names(version=DEFAULT_VERSION):
+    """Returns the value to name index of every enumeration in spv."""
+    spv = load_spv(version)
+    return {category: names(category, version)
+            for category, table in spv.items() if isinstance(table, dict)}
+
+
+def mask_bits(category, version=DEFAULT_VERSION):
+    """Returns the (name, bit) pairs of a mask category, ordered by bit.
+
+    Arguments:
+        category: A BitEnum kind, with or without its 'Shift' or 'Mask'
+                  suffix, e.g. 'MemoryAccess' or 'MemoryAccessMask'.
+        version: One of tables.VERSIONS.
+    """
+    key = (category, version)
+    bits = _bits_cache.get(key)
+    if bits is None:
+        shifts = names(grammar_kind(category) + 'Shift', version)
+        bits = tuple((shifts[shift], 1 << shift) for shift in sorted(shifts))
+        _bits_cache[key] = bits
+    return bits
+
+
+def decode_mask(category, word, version=DEFAULT_VERSION):
+    """Returns the names of the flags set in a mask word, ordered by bit.
+
+    A zero word decodes to an empty list.  Bits that have no name in the
+    category are reported as hexadecimal strings, e.g. '0x00000100'.
+    """
+    flags = []
+    for name, bit in mask_bits(category, version):
+        if word & bit:
+            flags.append(name)
+            word &= ~bit
+    if word:
+        flags.append('0x{:08x}'.format(word))
+    return flags
+
+
+def decode_masks(category, words, version=DEFAULT_VERSION):
+    """Decodes an array of mask words at once.  Requires NumPy.
+
+    Returns a (names, flags) pair, where names is a tuple of flag names and
+    flags is a boolean array of shape (len(words), len(names)) such that
+    flags[i, j] is set when words[i] has names[j] set.  Unnamed bits are
+    ignored.
+
+    Arguments:
+        category: A BitEnum kind, e.g. 'MemoryAccess'.
+        words: Anything numpy.asarray accepts, holding 32-bit mask words.
+        version: One of tables.VERSIONS.
+    """
+    if numpy is None:
+        raise ImportError('decode_masks requires NumPy')
+    bits = mask_bits(category, version)
+    words = numpy.asarray(words, dtype=numpy.uint32)
+    masks = numpy.array([bit for _, bit in bits], dtype=numpy.uint32)
+    flags = (words[:, numpy.newaxis] & masks) != 0
+    return tuple(name for name, _ in bits), flags
@@ -0,0 +1,105 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Tables for the extended instruction sets, from the generated modules"""
+
+from .tables import load_module
+
+# OpExtInstImport names mapped to the generated module under
+# include/spirv/unified1 holding that set's tables.
+EXTINST_MODULES = {
+    'GLSL.std.450': 'GLSL_std_450',
+    'OpenCL.std': 'OpenCL_std',
+    'DebugInfo': 'DebugInfo',
+    'OpenCL.DebugInfo.100': 'OpenCLDebugInfo100',
+    'NonSemantic.Shader.DebugInfo.100': 'NonSemanticShaderDebugInfo100',
+    'NonSemantic.DebugPrintf': 'NonSemanticDebugPrintf',
+    'NonSemantic.DebugBreak': 'NonSemanticDebugBreak',
+    'SPV_AMD_gcn_shader': 'AMD_gcn_shader',
+    'SPV_AMD_shader_ballot': 'AMD_shader_ballot',
+    'SPV_AMD_shader_explicit_vertex_parameter': 'AMD_shader_explicit_vertex_parameter',
+    'SPV_AMD_shader_trinary_minmax': 'AMD_shader_trinary_minmax',
+}
+
+# Sets whose import name ends with their revision, e.g.
+# 'NonSemantic.ClspvReflection.6'.
+EXTINST_MODULE_PREFIXES = {
+    'NonSemantic.ClspvReflection.': 'NonSemanticClspvReflection',
+    'NonSemantic.VkspReflection.': 'NonSemanticVkspReflection',
+}
+
+# Generated module names mapped to the JSON grammar they are built from,
+# under include/spirv/unified1.
+EXTINST_GRAMMARS = {
+    'GLSL_std_450': 'extinst.glsl.std.450.grammar.json',
+    'OpenCL_std': 'extinst.opencl.std.100.grammar.json',
+    'DebugInfo': 'extinst.debuginfo.grammar.json',
+    'OpenCLDebugInfo100': 'extinst.opencl.debuginfo.100.grammar.json',
+    'NonSemanticShaderDebugInfo100': 'extinst.nonsemantic.shader.debuginfo.100.grammar.json',
+    'NonSemanticDebugPrintf': 'extinst.nonsemantic.debugprintf.grammar.json',
+    'NonSemanticDebugBreak': 'extinst.nonsemantic.debugbreak.grammar.json',
+    'NonSemanticClspvReflection': 'extinst.nonsemantic.clspvreflection.grammar.json',
+    'NonSemanticVkspReflection': 'extinst.nonsemantic.vkspreflection.grammar.json',
+    'AMD_gcn_shader': 'extinst.spv-amd-gcn-shader.grammar.json',
+    'AMD_shader_ballot': 'extinst.spv-amd-shader-ballot.grammar.json',
+    'AMD_shader_explicit_vertex_parameter': 'extinst.spv-amd-shader-explicit-vertex-parameter.grammar.json',
+    'AMD_shader_trinary_minmax': 'extinst.spv-amd-shader-trinary-minmax.grammar.json',
+}
+
+_extinst_cache = {}
+
+
+def extinst_module_name(import_name):
+    """Returns the generated module name for an OpExtInstImport name, or
+    None if no tables are shipped for it."""
+    module = EXTINST_MODULES.get(import_name)
+    if module is None:
+        for prefix, name in EXTINST_MODULE_PREFIXES.items():
+            if import_name.startswith(prefix):
+                return name
+    return module
+
+
+def extinst_grammar_name(import_name):
+    """Returns the JSON grammar file name for an OpExtInstImport name, or
+    None if no grammar is shipped for it."""
+    return EXTINST_GRAMMARS.get(extinst_module_name(import_name))
+
+
+def load_extinst(import_name):
+    """Returns the generated tables module for an OpExtInstImport name.
+
+    The module has Instructions and InstructionNames (name to opcode and
+    back), InstructionOperands (opcode to (kind, quantifier, name) tuples),
+    and OperandKinds, OperandKindNames and OperandKindCategories for the
+    set's own operand kinds.  Returns None for unknown sets.
+    """
+    if import_name in _extinst_cache:
+        return _extinst_cache[import_name]
+    name = extinst_module_name(import_name)
+    module = None if name is None else load_module(name)
+    _extinst_cache[import_name] = module
+    return module
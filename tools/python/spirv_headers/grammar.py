@@ -0,0 +1,158 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Instruction and operand descriptions from the JSON grammars"""
+
+import collections
+
+from .tables import DEFAULT_VERSION, CORE_GRAMMAR, enum_value, load_grammar
+
+# One operand of an instruction.  quantifier is None, '?' or '*'.
+Operand = collections.namedtuple('Operand', ['kind', 'quantifier', 'name'])
+
+# One instruction of the core grammar or of an extended instruction set.
+Instruction = collections.namedtuple('Instruction', [
+    'opcode', 'opname', 'opclass', 'operands', 'aliases',
+    'capabilities', 'extensions', 'version'])
+
+# One operand kind.  bases lists the kinds making up a Composite kind;
+# parameters maps the enumerant values of an enum kind that take extra
+# operands to the kinds of those operands.
+OperandKind = collections.namedtuple('OperandKind', [
+    'kind', 'category', 'bases', 'parameters'])
+
+# Literal kinds whose number of words depends on their value or type.
+MULTI_WORD_LITERALS = ('LiteralString', 'LiteralContextDependentNumber',
+                       'LiteralSpecConstantOpInteger')
+
+# Kinds holding a literal as wide as the type of the OpSwitch selector.
+SELECTOR_SIZED_KINDS = ('PairLiteralIntegerIdRef',)
+
+_instructions_cache = {}
+_operand_kinds_cache = {}
+_result_id_positions_cache = {}
+
+
+def make_operand(operand):
+    """Returns the Operand for a JSON grammar operand"""
+    return Operand(operand['kind'], operand.get('quantifier'),
+                   operand.get('name'))
+
+
+def make_instruction(inst):
+    """Returns the Instruction for a JSON grammar instruction"""
+    return Instruction(
+        opcode=inst['opcode'],
+        opname=inst['opname'],
+        opclass=inst.get('class'),
+        operands=tuple(make_operand(o) for o in inst.get('operands', ())),
+        aliases=tuple(inst.get('aliases', ())),
+        capabilities=tuple(inst.get('capabilities', ())),
+        extensions=tuple(inst.get('extensions', ())),
+        version=inst.get('version'))
+
+
+def instructions(name=CORE_GRAMMAR, version=DEFAULT_VERSION):
+    """Returns the Instructions of a grammar, in grammar order.
+
+    Arguments:
+        name: The grammar file name, e.g. 'spirv.core.grammar.json'.
+        version: One of tables.VERSIONS.
+    """
+    key = (name, version)
+    result = _instructions_cache.get(key)
+    if result is None:
+        grammar = load_grammar(name, version)
+        result = tuple(make_instruction(i) for i in grammar['instructions'])
+        _instructions_cache[key] = result
+    return result
+
+
+def make_operand_kind(kind):
+    """Returns the OperandKind for a JSON grammar operand kind"""
+    parameters = {}
+    for enumerant in kind.get('enumerants', ()):
+        value = enum_value(enumerant['value'])
+        if 'parameters' in enumerant and value not in parameters:
+            parameters[value] = tuple(p['kind'] for p in enumerant['parameters'])
+    return OperandKind(kind['kind'], kind['category'],
+                       tuple(kind.get('bases', ())), parameters)
+
+
+def operand_kinds(name=CORE_GRAMMAR, version=DEFAULT_VERSION):
+    """Returns a dict of the OperandKinds of a grammar, keyed by kind.
+
+    Extended instruction set grammars only list the kinds they add, so the
+    kinds of the core grammar of the same version are included too.
+    """
+    key = (name, version)
+    result = _operand_kinds_cache.get(key)
+    if result is None:
+        result = {}
+        names = (CORE_GRAMMAR, name) if name != CORE_GRAMMAR else (name,)
+        for grammar_name in names:
+            for kind in load_grammar(grammar_name, version).get('operand_kinds', ()):
+                result[kind['kind']] = make_operand_kind(kind)
+        _operand_kinds_cache[key] = result
+    return result
+
+
+def word_kinds(kind, kinds):
+    """Returns the kinds of the words of an operand of kind, one per word,
+    if their number is always the same, otherwise None: for multi-word and
+    selector-sized literals, and for enums with parameters.
+
+    Arguments:
+        kind: The operand kind.
+        kinds: The OperandKinds of the grammar (see operand_kinds).
+    """
+    if kind in MULTI_WORD_LITERALS or kind in SELECTOR_SIZED_KINDS:
+        return None
+    operand_kind = kinds.get(kind)
+    if operand_kind is None or operand_kind.category == 'Literal':
+        return (kind,)
+    if operand_kind.category == 'Composite':
+        return operand_kind.bases
+    return None if operand_kind.parameters else (kind,)
+
+
+def result_id_positions(name=CORE_GRAMMAR, version=DEFAULT_VERSION):
+    """Returns a dict mapping each opcode with an IdResult operand to the
+    index of that operand among the operand words.
+
+    In every grammar the IdResult operand comes first or follows the
+    IdResultType, so its position does not depend on the operands.
+    """
+    key = (name, version)
+    result = _result_id_positions_cache.get(key)
+    if result is None:
+        result = {}
+        for inst in instructions(name, version):
+            kinds = [operand.kind for operand in inst.operands]
+            if 'IdResult' in kinds:
+                result.setdefault(inst.opcode, kinds.index('IdResult'))
+        _result_id_positions_cache[key] = result
+    return result
@@ -0,0 +1,427 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Tables indexed by result id, sized from the module header's Bound"""
+
+import array
+import collections
+
+from .binary import (HEADER_WORDS, OPCODE_MASK, WORD_COUNT_SHIFT,
+                     InvalidBinaryError, decode_string, encode_string,
+                     iter_instructions, native_words, read_header)
+from .decoders import SwitchWidths, load_decoders
+from .extinst import extinst_grammar_name
+from .grammar import instructions, operand_kinds, result_id_positions, word_kinds
+from .tables import CORE_GRAMMAR, DEFAULT_VERSION, load_spv
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Definition table entry of an id no instruction defines.
+NO_OFFSET = 0xffffffff
+
+# The operand kinds that refer to an id defined elsewhere.
+ID_USE_KINDS = frozenset(('IdRef', 'IdResultType', 'IdMemorySemantics', 'IdScope'))
+
+# How to find the id operands of an instruction without decoding it:
+#   fixed: the indexes of the id words among the first prefix words,
+#   prefix: the number of words whose kind does not depend on the operands,
+#   pattern: for a trailing '*' or '?' operand, one bool per word of its
+#            kind telling whether it is an id, repeated to the end; or None,
+#   decode: True if words past the prefix need the full decoder.
+IdUseLayout = collections.namedtuple('IdUseLayout', ['fixed', 'prefix', 'pattern', 'decode'])
+
+_id_use_layouts_cache = {}
+
+
+class DefinitionTable:
+    """The offset of the instruction defining each result id.
+
+    The offsets are a flat array('I') with one entry per id below the
+    module's Bound, NO_OFFSET for ids that are not defined: four bytes per
+    id, where a dict would spend about a hundred.
+    """
+
+    __slots__ = ('offsets',)
+
+    def __init__(self, offsets):
+        """Arguments:
+            offsets: An array('I') indexed by result id.
+        """
+        self.offsets = offsets
+
+    @classmethod
+    def from_module(cls, data, version=DEFAULT_VERSION):
+        """Builds the table of a module in one walk over its instructions.
+
+        Arguments:
+            data: A bytes-like object holding the module, in either byte order.
+            version: The grammar to take IdResult positions from.
+        """
+        words = native_words(data)
+        bound = read_header(words).bound
+        positions = result_id_positions(CORE_GRAMMAR, version)
+        offsets = array.array('I', [NO_OFFSET]) * bound
+        n = len(words)
+        offset = HEADER_WORDS
+        try:
+            while offset < n:
+                word = words[offset]
+                word_count = word >> WORD_COUNT_SHIFT
+                if word_count == 0:
+                    raise InvalidBinaryError('Instruction with word count 0', offset)
+                position = positions.get(word & OPCODE_MASK)
+                if position is not None:
+                    if position + 1 >= word_count:
+                        raise InvalidBinaryError('Instruction too short for its result id',
+                                                 offset)
+                    offsets[words[offset + 1 + position]] = offset
+                offset += word_count
+        except IndexError:
+            raise InvalidBinaryError('Result id not below the bound {} or truncated '
+                                     'instruction'.format(bound), offset)
+        if offset != n:
+            raise InvalidBinaryError('Truncated instruction', offset)
+        return cls(offsets)
+
+    @classmethod
+    def from_index(cls, index, version=DEFAULT_VERSION):
+        """Builds the table from an index.InstructionIndex with array
+        operations.  Requires NumPy."""
+        if numpy is None:
+            raise ImportError('DefinitionTable.from_index requires NumPy')
+        bound = index.header.bound
+        lookup = numpy.full(OPCODE_MASK + 1, -1, dtype=numpy.int64)
+        for opcode, position in result_id_positions(CORE_GRAMMAR, version).items():
+            lookup[opcode] = position
+        positions = lookup[index.opcodes]
+        defining = positions >= 0
+        starts = index.offsets[defining]
+        short = positions[defining] + 1 >= index.word_counts[defining]
+        if short.any():
+            raise InvalidBinaryError('Instruction too short for its result id',
+                                     int(starts[short.argmax()]))
+        ids = index.words[starts + 1 + positions[defining]]
+        if len(ids) and int(ids.max()) >= bound:
+            raise InvalidBinaryError('Result id {} is not below the bound {}'.format(
+                int(ids.max()), bound))
+        offsets = numpy.full(bound, NO_OFFSET, dtype=numpy.uint32)
+        offsets[ids] = starts
+        return cls(array.array('I', offsets.tobytes()))
+
+    def __len__(self):
+        """The Bound of the module: the size of the table"""
+        return len(self.offsets)
+
+    def get(self, result_id, default=None):
+        """Returns the offset of the instruction defining result_id, or
+        default"""
+        if 0 <= result_id < len(self.offsets):
+            offset = self.offsets[result_id]
+            if offset != NO_OFFSET:
+                return offset
+        return default
+
+    def __getitem__(self, result_id):
+        offset = self.get(result_id)
+        if offset is None:
+            raise KeyError(result_id)
+        return offset
+
+    def __contains__(self, result_id):
+        return self.get(result_id) is not None
+
+    def ids(self):
+        """Yields the defined result ids in increasing order"""
+        for result_id, offset in enumerate(self.offsets):
+            if offset != NO_OFFSET:
+                yield result_id
+
+
+def id_use_layouts(version=DEFAULT_VERSION):
+    """Returns a dict mapping the opcodes of the core grammar to their
+    IdUseLayout."""
+    result = _id_use_layouts_cache.get(version)
+    if result is not None:
+        return result
+    kinds = operand_kinds(CORE_GRAMMAR, version)
+    result = {}
+    for inst in instructions(CORE_GRAMMAR, version):
+        if inst.opcode in result:
+            continue
+        fixed = []
+        prefix = 0
+        pattern = None
+        decode = False
+        for i, operand in enumerate(inst.operands):
+            operand_word_kinds = word_kinds(operand.kind, kinds)
+            if operand_word_kinds is None:
+                decode = True
+                break
+            if operand.quantifier is not None:
+                if i == len(inst.operands) - 1:
+                    pattern = tuple(kind in ID_USE_KINDS for kind in operand_word_kinds)
+                else:
+                    decode = True
+                break
+            for kind in operand_word_kinds:
+                if kind in ID_USE_KINDS:
+                    fixed.append(prefix)
+                prefix += 1
+        result[inst.opcode] = IdUseLayout(tuple(fixed), prefix, pattern, decode)
+    _id_use_layouts_cache[version] = result
+    return result
+
+
+class DefUse:
+    """The users of each result id, as compressed sparse rows.
+
+    users holds the offsets of the instructions using each id, grouped by
+    id and in module order within a group; the users of id i are
+    users[starts[i]:starts[i + 1]].  An instruction using an id several
+    times is listed once.  Uses are the IdRef, IdResultType,
+    IdMemorySemantics and IdScope operands, including those of debug
+    instructions and decorations, and the operands of OpExtInst that the
+    grammar of the imported set marks as ids.
+    """
+
+    __slots__ = ('starts', 'users')
+
+    def __init__(self, starts, users):
+        """Arguments:
+            starts: An array('I') of Bound + 1 indexes into users.
+            users: An array('I') of instruction offsets.
+        """
+        self.starts = starts
+        self.users = users
+
+    @classmethod
+    def from_module(cls, data, version=DEFAULT_VERSION):
+        """Builds the chains of a module in one walk over its instructions,
+        then groups the uses by id with a counting sort.
+
+        Arguments:
+            data: A bytes-like object holding the module, in either byte order.
+            version: The grammar to take operand kinds from.
+        """
+        words = native_words(data)
+        bound = read_header(words).bound
+        layouts = id_use_layouts(version)
+        decoders = load_decoders(CORE_GRAMMAR, version)
+        ops = load_spv(version)['Op']
+        op_ext_inst_import, op_ext_inst = ops['OpExtInstImport'], ops['OpExtInst']
+        op_switch = ops['OpSwitch']
+        ext_inst_sets = {}      # Set id -> decoders of the set, or None
+        widths = SwitchWidths(version)
+        add_width = widths.add
+        used = array.array('I')
+        users = array.array('I')
+        last_user = array.array('I', [NO_OFFSET]) * bound
+
+        def use(result_id, offset):
+            if last_user[result_id] != offset:
+                last_user[result_id] = offset
+                used.append(result_id)
+                users.append(offset)
+
+        try:
+            for offset, opcode, word_count, operands in iter_instructions(words):
+                layout = layouts.get(opcode)
+                add_width(opcode, operands)
+                if opcode == op_ext_inst_import:
+                    grammar = extinst_grammar_name(decode_string(operands, 1)[0])
+                    ext_inst_sets[operands[0]] = grammar and load_decoders(grammar)
+                elif opcode == op_ext_inst:
+                    use(operands[0], offset)
+                    use(operands[2], offset)
+                    ext_decoder = (ext_inst_sets.get(operands[2]) or {}).get(operands[3])
+                    if ext_decoder is None:
+                        # Unknown sets, such as most NonSemantic ones, only
+                        # take ids.
+                        for result_id in operands[4:]:
+                            use(result_id, offset)
+                    else:
+                        for kind, value in ext_decoder(operands[4:]):
+                            if kind in ID_USE_KINDS:
+                                use(value, offset)
+                elif layout is None:
+                    raise InvalidBinaryError('Unknown opcode {}'.format(opcode), offset)
+                elif layout.decode and len(operands) > layout.prefix:
+                    if opcode == op_switch:
+                        pairs = decoders[opcode](operands, widths.literal_words(operands[0]))
+                    else:
+                        pairs = decoders[opcode](operands)
+                    for kind, value in pairs:
+                        if kind in ID_USE_KINDS:
+                            use(value, offset)
+                else:
+                    for position in layout.fixed:
+                        use(operands[position], offset)
+                    pattern = layout.pattern
+                    if pattern is not None:
+                        if len(pattern) == 1:
+                            if pattern[0]:
+                                for result_id in operands[layout.prefix:]:
+                                    use(result_id, offset)
+                        else:
+                            for i in range(layout.prefix, len(operands)):
+                                if pattern[(i - layout.prefix) % len(pattern)]:
+                                    use(operands[i], offset)
+        except IndexError:
+            raise InvalidBinaryError('Id not below the bound {} or truncated '
+                                     'instruction'.format(bound), offset)
+
+        # Counting sort of the uses by id; stable, so module order is kept.
+        starts = array.array('I', [0]) * (bound + 1)
+        for result_id in used:
+            starts[result_id + 1] += 1
+        for i in range(bound):
+            starts[i + 1] += starts[i]
+        cursor = array.array('I', starts)
+        grouped = array.array('I', [0]) * len(users)
+        for result_id, user in zip(used, users):
+            grouped[cursor[result_id]] = user
+            cursor[result_id] += 1
+        return cls(starts, grouped)
+
+    def __len__(self):
+        """The Bound of the module"""
+        return len(self.starts) - 1
+
+    def users_of(self, result_id):
+        """Returns the offsets of the instructions using result_id, as a
+        memoryview slice of users"""
+        if not 0 <= result_id < len(self.starts) - 1:
+            return memoryview(self.users)[0:0]
+        return memoryview(self.users)[self.starts[result_id]:self.starts[result_id + 1]]
+
+    def degree(self, result_id):
+        """Returns the number of instructions using result_id"""
+        if not 0 <= result_id < len(self.starts) - 1:
+            return 0
+        return self.starts[result_id + 1] - self.starts[result_id]
+
+
+class IdOperands:
+    """Finds the operand words of instructions that hold ids: the result
+    id and the uses, as DefUse counts them.
+
+    Instructions whose ids sit at fixed places are answered from
+    id_use_layouts without decoding.  The others are decoded, and the
+    positions of their ids recovered from the decoded operands.  The
+    instructions of a module must be passed in module order, so that the
+    operands of OpExtInst can be found from the imported set's grammar and
+    the literals of OpSwitch sized from the type of its selector.
+    """
+
+    def __init__(self, version=DEFAULT_VERSION):
+        self._layouts = id_use_layouts(version)
+        self._results = result_id_positions(CORE_GRAMMAR, version)
+        self._decoders = load_decoders(CORE_GRAMMAR, version)
+        ops = load_spv(version)['Op']
+        self._op_ext_inst_import = ops['OpExtInstImport']
+        self._op_ext_inst = ops['OpExtInst']
+        self._op_switch = ops['OpSwitch']
+        self._widths = SwitchWidths(version)
+        self._fixed = {}          # Opcode -> positions, when they are fixed
+        self._ext_inst_sets = {}  # Set id -> decoders of the set, or None
+
+    def positions(self, opcode, operands):
+        """Returns the indexes into operands of the words holding ids, in
+        increasing order.
+
+        Arguments:
+            opcode: The opcode of the instruction.
+            operands: Its operand words, after the opcode word.
+        """
+        self._widths.add(opcode, operands)
+        positions = self._fixed.get(opcode)
+        if positions is not None:
+            return positions
+        if opcode == self._op_switch:
+            # Selector, default, then (literal, label) pairs with literals
+            # as wide as the selector.
+            step = self._widths.literal_words(operands[0]) + 1
+            if len(operands) < 2 or (len(operands) - 2) % step:
+                raise InvalidBinaryError('Wrong operand count for OpSwitch')
+            return [0, 1] + list(range(1 + step, len(operands), step))
+        if opcode == self._op_ext_inst_import:
+            grammar = extinst_grammar_name(decode_string(operands, 1)[0])
+            self._ext_inst_sets[operands[0]] = grammar and load_decoders(grammar)
+            return (0,)
+        if opcode == self._op_ext_inst:
+            ext_decoder = (self._ext_inst_sets.get(operands[2]) or {}).get(operands[3])
+            if ext_decoder is None:
+                return [0, 1, 2] + list(range(4, len(operands)))
+            return [0, 1, 2] + [4 + i for i in _decoded_positions(ext_decoder(operands[4:]),
+                                                                  len(operands) - 4)]
+        layout = self._layouts.get(opcode)
+        if layout is None:
+            raise InvalidBinaryError('Unknown opcode {}'.format(opcode))
+        result = self._results.get(opcode)
+        if layout.decode and len(operands) > layout.prefix:
+            return _decoded_positions(self._decoders[opcode](operands), len(operands))
+        positions = sorted(layout.fixed + (() if result is None else (result,)))
+        pattern = layout.pattern
+        if pattern is None or not any(pattern):
+            positions = tuple(positions)
+            if not layout.decode:
+                self._fixed[opcode] = positions
+            return positions
+        for i in range(layout.prefix, len(operands)):
+            if pattern[(i - layout.prefix) % len(pattern)]:
+                positions.append(i)
+        return positions
+
+
+def _decoded_positions(decoded, word_count):
+    """Returns the indexes of the id words among word_count words decoded
+    as decoded, a list of (kind, value).
+
+    Literal strings take the words of their encoding and other operands one
+    word, except context dependent numbers, which share the words left
+    over: they are all as wide as their type.
+    """
+    widths = []
+    numbers = 0
+    for kind, value in decoded:
+        if kind == 'LiteralString':
+            widths.append(len(encode_string(value)))
+        else:
+            widths.append(1)
+            numbers += kind == 'LiteralContextDependentNumber'
+    extra = word_count - sum(widths)
+    positions = []
+    position = 0
+    for (kind, value), width in zip(decoded, widths):
+        if kind in ID_USE_KINDS or kind == 'IdResult':
+            positions.append(position)
+        elif kind == 'LiteralContextDependentNumber':
+            width += extra // numbers
+        position += width
+    return positions
@@ -0,0 +1,127 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Vectorized instruction indexes of SPIR-V modules, using NumPy"""
+
+import array
+
+from .binary import (HEADER_WORDS, OPCODE_MASK, WORD_COUNT_SHIFT,
+                     InvalidBinaryError, native_array, read_header)
+from .enums import name_of
+from .tables import DEFAULT_VERSION
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def instruction_offsets(word_counts, start=HEADER_WORDS):
+    """Returns an array('I') of the offsets of the instructions of a module.
+
+    This is the only sequential step of indexing: it hops from instruction
+    to instruction, touching one word count per instruction.
+
+    Arguments:
+        word_counts: A sequence holding the word count field of every word
+                     of the module (see InstructionIndex).
+        start: The offset of the first instruction.
+    """
+    offsets = array.array('I')
+    append = offsets.append
+    n = len(word_counts)
+    offset = start
+    while offset < n:
+        append(offset)
+        word_count = word_counts[offset]
+        if word_count == 0:
+            raise InvalidBinaryError('Instruction with word count 0', offset)
+        offset += word_count
+    if offset != n:
+        raise InvalidBinaryError('Truncated instruction', offsets[-1])
+    return offsets
+
+
+class InstructionIndex:
+    """The instruction boundaries of a module, as NumPy arrays.
+
+    Opcodes and word counts are extracted from all the words at once; only
+    the walk from one instruction to the next is done in Python.  Attributes:
+        words: The module as a native-valued uint32 array.
+        offsets: The word offset of each instruction.
+        opcodes: The opcode of each instruction.
+        word_counts: The word count of each instruction.
+    """
+
+    def __init__(self, data):
+        """Arguments:
+            data: A bytes-like object or array('I') holding the module, in
+                  either byte order.
+        """
+        if numpy is None:
+            raise ImportError('InstructionIndex requires NumPy')
+        self.words = native_array(data)
+        self.header = read_header(self.words[:HEADER_WORDS].tolist())
+        # Word counts are 16 bits wide; a memoryview of them indexes quickly
+        # from Python without converting the whole module to a list.
+        word_counts = (self.words >> WORD_COUNT_SHIFT).astype(numpy.uint16)
+        self.offsets = numpy.frombuffer(
+            instruction_offsets(memoryview(word_counts)), dtype=numpy.uint32)
+        self.opcodes = (self.words[self.offsets] & OPCODE_MASK).astype(numpy.uint16)
+        self.word_counts = word_counts[self.offsets]
+
+    def __len__(self):
+        """The number of instructions"""
+        return len(self.offsets)
+
+    def histogram(self):
+        """Returns an array holding the number of instructions of each
+        opcode, indexed by opcode."""
+        return numpy.bincount(self.opcodes)
+
+    def opcode_counts(self, version=DEFAULT_VERSION):
+        """Returns a dict of instruction counts keyed by opcode name, most
+        frequent first."""
+        histogram = self.histogram()
+        used = numpy.flatnonzero(histogram)
+        used = used[numpy.argsort(-histogram[used], kind='stable')]
+        return {name_of('Op', int(opcode), version, 'Op{}'.format(opcode)): int(histogram[opcode])
+                for opcode in used}
+
+    def mask(self, *opcodes):
+        """Returns a bool array selecting the instructions with one of the
+        given opcodes."""
+        return numpy.isin(self.opcodes, opcodes)
+
+    def select(self, *opcodes):
+        """Returns the offsets of the instructions with one of the given
+        opcodes, in module order."""
+        return self.offsets[self.mask(*opcodes)]
+
+    def operands(self, offset):
+        """Returns the operand words of the instruction at offset, as a view
+        of words."""
+        return self.words[offset + 1:offset + (int(self.words[offset]) >> WORD_COUNT_SHIFT)]
@@ -0,0 +1,241 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""The logical layout sections of SPIR-V modules.
+
+A module lists its instructions in a fixed order of sections (see "Logical
+Layout of a Module" in the specification).  SectionTracker follows that
+order one instruction at a time and records where each section starts.
+Since the order is fixed, the early sections can be found without reading
+the rest of the module: find_sections and iter_section stop at the first
+instruction past the section asked for.
+"""
+
+import array
+
+from .binary import (HEADER_WORDS, iter_instructions, iter_module, iter_stream,
+                     native_words)
+from .tables import DEFAULT_VERSION, load_spv
+
+SECTIONS = (
+    'capabilities',
+    'extensions',
+    'ext_inst_imports',
+    'memory_model',
+    'entry_points',
+    'execution_modes',
+    'debug',
+    'annotations',
+    'globals',
+    'function_declarations',
+    'function_definitions',
+)
+(CAPABILITIES, EXTENSIONS, EXT_INST_IMPORTS, MEMORY_MODEL, ENTRY_POINTS,
+ EXECUTION_MODES, DEBUG, ANNOTATIONS, GLOBALS, FUNCTION_DECLARATIONS,
+ FUNCTION_DEFINITIONS) = range(len(SECTIONS))
+
+# The instructions that may only appear in the sections before the types,
+# constants and global variables.  Names missing from older headers are
+# skipped.
+SECTION_OPCODES = {
+    CAPABILITIES: ('OpCapability',),
+    EXTENSIONS: ('OpExtension',),
+    EXT_INST_IMPORTS: ('OpExtInstImport',),
+    MEMORY_MODEL: ('OpMemoryModel',),
+    ENTRY_POINTS: ('OpEntryPoint',),
+    EXECUTION_MODES: ('OpExecutionMode', 'OpExecutionModeId'),
+    DEBUG: ('OpString', 'OpSourceExtension', 'OpSource', 'OpSourceContinued',
+            'OpName', 'OpMemberName', 'OpModuleProcessed'),
+    ANNOTATIONS: ('OpDecorate', 'OpMemberDecorate', 'OpDecorationGroup',
+                  'OpGroupDecorate', 'OpGroupMemberDecorate', 'OpDecorateId',
+                  'OpDecorateString', 'OpDecorateStringGOOGLE',
+                  'OpMemberDecorateString', 'OpMemberDecorateStringGOOGLE'),
+}
+
+# Words read at a time from file objects: small enough that asking for the
+# capabilities of a module reads only its first few hundred bytes.
+EARLY_CHUNK_WORDS = 64
+
+_section_table_cache = {}
+
+
+def section_table(version=DEFAULT_VERSION):
+    """Returns a dict mapping the opcodes listed in SECTION_OPCODES to their
+    section.  Other opcodes belong to GLOBALS or to functions."""
+    table = _section_table_cache.get(version)
+    if table is None:
+        ops = load_spv(version)['Op']
+        table = {ops[name]: section
+                 for section, names in SECTION_OPCODES.items()
+                 for name in names if name in ops}
+        _section_table_cache[version] = table
+    return table
+
+
+class SectionTracker:
+    """Follows the sections of a module one instruction at a time.
+
+    A function is a declaration until its first OpLabel; the definitions
+    start at the first function that has one.  Sections never go backwards,
+    so an instruction out of place is counted in the current section.
+    """
+
+    __slots__ = ('section', 'starts', '_table', '_op_function', '_op_label',
+                 '_function')
+
+    def __init__(self, version=DEFAULT_VERSION):
+        ops = load_spv(version)['Op']
+        self.section = CAPABILITIES
+        self.starts = [None] * len(SECTIONS)
+        self._table = section_table(version)
+        self._op_function = ops['OpFunction']
+        self._op_label = ops['OpLabel']
+        self._function = None   # Offset of an OpFunction without OpLabel yet
+
+    def add(self, offset, opcode):
+        """Records the instruction at offset and returns the index of the
+        section it is in."""
+        section = self.section
+        if opcode == self._op_function:
+            self._function = offset
+            if section < FUNCTION_DECLARATIONS:
+                section = FUNCTION_DECLARATIONS
+        elif opcode == self._op_label:
+            if self._function is not None and section < FUNCTION_DEFINITIONS:
+                section = FUNCTION_DEFINITIONS
+                self.starts[section] = self._function
+            self._function = None
+        elif section < GLOBALS:
+            section = max(section, self._table.get(opcode, GLOBALS))
+        if self.starts[section] is None:
+            self.starts[section] = offset
+        self.section = section
+        return section
+
+    def offsets(self, end):
+        """Returns an array('I') of len(SECTIONS) + 1 word offsets: section
+        i spans [offsets[i], offsets[i + 1]).  Empty sections start where
+        the next one does.
+
+        Arguments:
+            end: The offset just past the module.
+        """
+        offsets = array.array('I', [end]) * (len(SECTIONS) + 1)
+        for section in reversed(range(len(SECTIONS))):
+            start = self.starts[section]
+            offsets[section] = offsets[section + 1] if start is None else start
+        return offsets
+
+
+def section_offsets(data, version=DEFAULT_VERSION):
+    """Returns the section offsets of a module, see SectionTracker.offsets"""
+    words = native_words(data)
+    tracker = SectionTracker(version)
+    add = tracker.add
+    for offset, opcode, word_count, operands in iter_instructions(words):
+        add(offset, opcode)
+    return tracker.offsets(len(words))
+
+
+def _iter_source(source, chunk_words):
+    """Yields the instructions of the first module in source, a bytes-like
+    object or a binary file object."""
+    if not hasattr(source, 'read'):
+        yield from iter_module(source)
+        return
+    started = False
+    for instruction in iter_stream(source, chunk_words):
+        if instruction[1] is None:
+            if started:
+                return  # The next module of a concatenated stream.
+            started = True
+            continue
+        yield instruction
+
+
+def find_sections(source, last=None, version=DEFAULT_VERSION,
+                  chunk_words=EARLY_CHUNK_WORDS):
+    """Returns a dict mapping section names to (start, end) word offsets, in
+    one pass over the module.
+
+    Arguments:
+        source: A bytes-like object or a binary file object holding a module.
+        last: The name of the last section wanted.  Reading stops at the
+              first instruction past it, and later sections are left out.
+              None reads the whole module.
+        version: The headers to take opcodes from.
+        chunk_words: Words read at a time from a file object.  Pass an
+                     unbuffered file to keep the OS from reading ahead.
+    """
+    last_index = len(SECTIONS) - 1 if last is None else SECTIONS.index(last)
+    tracker = SectionTracker(version)
+    add = tracker.add
+    end = None
+    for offset, opcode, word_count, operands in _iter_source(source, chunk_words):
+        section = add(offset, opcode)
+        if section > last_index:
+            # A function definition starts at its OpFunction, not at the
+            # OpLabel that revealed it.
+            end = tracker.starts[section]
+            break
+        end = offset + word_count
+    if end is None:
+        end = HEADER_WORDS
+    offsets = tracker.offsets(end)
+    return {SECTIONS[i]: (offsets[i], offsets[i + 1]) for i in range(last_index + 1)}
+
+
+def iter_section(source, name, version=DEFAULT_VERSION, chunk_words=EARLY_CHUNK_WORDS):
+    """Yields the (offset, opcode, word_count, operands) instructions of one
+    section, reading the module no further than the first instruction past
+    it.  See find_sections for the arguments.
+    """
+    target = SECTIONS.index(name)
+    tracker = SectionTracker(version)
+    add = tracker.add
+    ops = load_spv(version)['Op']
+    op_function, op_function_end = ops['OpFunction'], ops['OpFunctionEnd']
+    # A function is only known to be a declaration at its OpFunctionEnd, and
+    # a definition at its OpLabel: hold back its first instructions.
+    pending = []
+    for instruction in _iter_source(source, chunk_words):
+        section = add(instruction[0], instruction[1])
+        if section == FUNCTION_DECLARATIONS and target >= FUNCTION_DECLARATIONS:
+            if instruction[1] == op_function:
+                pending = []
+            pending.append(instruction)
+            if instruction[1] == op_function_end and target == FUNCTION_DECLARATIONS:
+                yield from pending
+                pending = []
+            continue
+        if section < target:
+            continue
+        if section > target:
+            return
+        if pending:
+            yield from pending
+            pending = []
+        yield instruction
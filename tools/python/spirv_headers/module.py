@@ -0,0 +1,138 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Zero-copy views of SPIR-V modules held in memory or mapped from disk"""
+
+import mmap
+
+from .binary import (HEADER_WORDS, OPCODE_MASK, SWAPPED_MAGIC_NUMBER,
+                     WORD_COUNT_SHIFT, InvalidBinaryError, as_words,
+                     iter_instructions, read_header, swapped_words)
+
+
+class Module:
+    """A SPIR-V module seen as a memoryview of 32-bit words.
+
+    Instructions are addressed by word offset and their operands are
+    returned as slices of the view, so nothing is copied.  A module opened
+    with Module.open is memory-mapped: only the pages holding words that
+    are actually read get loaded.
+
+    Modules of the other byte order are detected from the magic number and
+    swapped to native order in one bulk copy; byteswapped is then True.
+    """
+
+    def __init__(self, data):
+        """Arguments:
+            data: A bytes-like object or array('I') holding the module.
+        """
+        self._mmap = None
+        words = None
+        try:
+            words = as_words(data)
+            self.byteswapped = len(words) > 0 and words[0] == SWAPPED_MAGIC_NUMBER
+            if self.byteswapped:
+                words.release()
+                words = swapped_words(data)
+            self.words = words
+            self.header = read_header(words)
+        except Exception:
+            # Let Module.open unmap the file.
+            if words is not None:
+                words.release()
+            raise
+
+    @classmethod
+    def open(cls, path):
+        """Memory-maps the module at path, read-only"""
+        with open(path, 'rb') as f:
+            try:
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # mmap refuses empty files.
+                raise InvalidBinaryError('Empty module: {}'.format(path))
+        try:
+            module = cls(mapping)
+        except Exception:
+            mapping.close()
+            raise
+        module._mmap = mapping
+        return module
+
+    def close(self):
+        """Releases the view and unmaps the file, if any.
+
+        Operand views obtained from this module must be released first,
+        otherwise unmapping raises BufferError.
+        """
+        self.words.release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def version(self):
+        """The (major, minor) SPIR-V version of the module"""
+        return (self.header.version >> 16) & 0xff, (self.header.version >> 8) & 0xff
+
+    @property
+    def generator(self):
+        """The generator magic number"""
+        return self.header.generator
+
+    @property
+    def bound(self):
+        """One more than the largest result id of the module"""
+        return self.header.bound
+
+    @property
+    def schema(self):
+        """The instruction schema word, reserved and normally 0"""
+        return self.header.schema
+
+    def __len__(self):
+        """The size of the module in words"""
+        return len(self.words)
+
+    def instructions(self, start=HEADER_WORDS, end=None):
+        """Yields (offset, opcode, word_count, operands) for the instructions
+        between start and end, see binary.iter_instructions."""
+        return iter_instructions(self.words, start, end)
+
+    def instruction(self, offset):
+        """Returns (opcode, word_count, operands) for the instruction at
+        offset, which must be the offset of an instruction."""
+        word = self.words[offset]
+        word_count = word >> WORD_COUNT_SHIFT
+        if word_count == 0 or offset + word_count > len(self.words):
+            raise InvalidBinaryError('Bad instruction', offset)
+        return word & OPCODE_MASK, word_count, self.words[offset + 1:offset + word_count]
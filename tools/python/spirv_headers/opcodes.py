@@ -0,0 +1,127 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Opcode to instruction metadata, backed by a flat list"""
+
+from .grammar import Instruction, instructions
+from .tables import DEFAULT_VERSION, load_spv
+
+# The dense part of a table stops at the first gap between consecutive
+# opcodes that is at least this wide.  Core opcodes and the vendor ranges
+# above 4000 fit in one list of a few thousand slots; an opcode allocated far
+# beyond them goes to the sparse dict instead of stretching the list.
+DEFAULT_MAX_GAP = 4096
+
+_table_cache = {}
+
+
+class OpcodeTable:
+    """Maps opcodes to Instructions.
+
+    Opcodes below len(dense) are looked up by indexing the dense list, which
+    holds None for unassigned opcodes.  Any other opcode is looked up in the
+    sparse dict.  Hot loops can bind both and inline the lookup:
+
+        dense, sparse = table.dense, table.sparse
+        limit = len(dense)
+        info = dense[op] if op < limit else sparse.get(op)
+
+    When sparse is empty, which is the case for the shipped grammars, dense[op]
+    alone is enough for opcodes known to be in range.
+    """
+
+    __slots__ = ('dense', 'sparse')
+
+    def __init__(self, entries, max_gap=DEFAULT_MAX_GAP):
+        """Arguments:
+            entries: A dict mapping opcodes to Instructions.
+            max_gap: Opcode gaps at least this wide end the dense list.
+        """
+        opcodes = sorted(entries)
+        end = 0
+        for opcode in opcodes:
+            if opcode - end >= max_gap:
+                break
+            end = opcode + 1
+
+        self.dense = [None] * end
+        self.sparse = {}
+        for opcode, info in entries.items():
+            if opcode < end:
+                self.dense[opcode] = info
+            else:
+                self.sparse[opcode] = info
+
+    def get(self, opcode, default=None):
+        """Returns the Instruction for an opcode, or default"""
+        if 0 <= opcode < len(self.dense):
+            info = self.dense[opcode]
+        else:
+            info = self.sparse.get(opcode)
+        return default if info is None else info
+
+    def __getitem__(self, opcode):
+        info = self.get(opcode)
+        if info is None:
+            raise KeyError(opcode)
+        return info
+
+    def __contains__(self, opcode):
+        return self.get(opcode) is not None
+
+    def __iter__(self):
+        """Yields the Instructions in opcode order"""
+        for info in self.dense:
+            if info is not None:
+                yield info
+        for opcode in sorted(self.sparse):
+            yield self.sparse[opcode]
+
+    def __len__(self):
+        return len(self.dense) - self.dense.count(None) + len(self.sparse)
+
+
+def opcode_table(version=DEFAULT_VERSION, max_gap=DEFAULT_MAX_GAP):
+    """Returns the OpcodeTable for the core instruction set.
+
+    The table is built from spirv.core.grammar.json.  Opcodes that only
+    appear in spv['Op'] get an Instruction with no operand information.
+    Tables built with the default max_gap are cached.
+    """
+    if max_gap == DEFAULT_MAX_GAP and version in _table_cache:
+        return _table_cache[version]
+
+    entries = {}
+    for inst in instructions(version=version):
+        entries.setdefault(inst.opcode, inst)
+    for name, opcode in load_spv(version)['Op'].items():
+        if opcode not in entries:
+            entries[opcode] = Instruction(opcode, name, None, (), (), (), (), None)
+
+    table = OpcodeTable(entries, max_gap)
+    if max_gap == DEFAULT_MAX_GAP:
+        _table_cache[version] = table
+    return table
@@ -0,0 +1,197 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""One registry of every spv token across the shipped header versions"""
+
+import array
+import collections
+
+from .tables import VERSIONS, grammar_kind, load_grammar, load_module
+
+# A token of a spv category.
+#   first_version, last_version: SPIR-V versions bounding the core versions
+#       the token is valid in, encoded like spv['Version'].  first_version is
+#       None for tokens only available through extensions, last_version is
+#       None when the token is still valid.
+#   headers: frozenset of the include/spirv directories whose spirv.py has
+#       the token, e.g. {'1.2', 'unified1'}.
+Token = collections.namedtuple('Token', [
+    'category', 'name', 'value', 'first_version', 'last_version', 'headers'])
+
+# Version bound stored for "no core version" and "no last version"
+_NEVER = 0xffffffff
+
+_registry = None
+
+
+def encode_version(version):
+    """Returns a SPIR-V version encoded like spv['Version'].
+
+    Arguments:
+        version: A 'major.minor' string, or an already encoded int.
+    """
+    if isinstance(version, int):
+        return version
+    major, minor = version.split('.')
+    return (int(major) << 16) | (int(minor) << 8)
+
+
+def _grammar_versions():
+    """Returns a dict mapping (kind, name) to (first, last) encoded versions
+    for every instruction and enumerant in the unified1 grammar, aliases
+    included.  kind is None for instructions."""
+    def bounds(entry):
+        first = entry.get('version', '1.0')
+        last = entry.get('lastVersion')
+        return (None if first == 'None' else encode_version(first),
+                None if last is None else encode_version(last))
+
+    grammar = load_grammar()
+    result = {}
+    for inst in grammar['instructions']:
+        for name in (inst['opname'],) + tuple(inst.get('aliases', ())):
+            result[(None, name)] = bounds(inst)
+    for operand_kind in grammar['operand_kinds']:
+        kind = operand_kind['kind']
+        for e in operand_kind.get('enumerants', ()):
+            for name in (e['enumerant'],) + tuple(e.get('aliases', ())):
+                result[(kind, name)] = bounds(e)
+                if name[0].isdigit():
+                    # The generated headers prefix such names, e.g. Dim1D.
+                    result[(kind, kind + name)] = result[(kind, name)]
+    return result
+
+
+class EnumRegistry:
+    """Every token of the shipped spirv.py modules, stored once.
+
+    The core versions a token is valid in come from the 'version' and
+    'lastVersion' fields of the unified1 grammar.  The frozen headers under
+    include/spirv/1.0, 1.1 and 1.2 are snapshots that also carry extension
+    tokens of their time, so the registry separately records which of them
+    had each token; tokens() rebuilds any of their tables from that.
+
+    Each category keeps a single dict from names to a token index; values,
+    version bounds and header membership live in flat arrays indexed by it.
+    constants holds the scalar tokens, such as Version, of the newest header.
+    """
+
+    def __init__(self):
+        versions = _grammar_versions()
+        self.constants = {}
+        self._index = {}
+        self._value = array.array('I')
+        self._first = array.array('I')
+        self._last = array.array('I')
+        self._headers = array.array('B')
+
+        for bit, header in enumerate(VERSIONS):
+            # Load the modules directly so their dicts are not kept alive.
+            for category, table in load_module('spirv', header).spv.items():
+                if not isinstance(table, dict):
+                    # VERSIONS goes from oldest to newest: the last one wins.
+                    self.constants[category] = table
+                    continue
+                kind = grammar_kind(category)
+                index = self._index.setdefault(category, {})
+                for name, value in table.items():
+                    i = index.get(name)
+                    if i is None:
+                        if name == 'MaskNone':
+                            first, last = encode_version('1.0'), None
+                        else:
+                            first, last = versions.get((kind, name), (None, None))
+                        i = index[name] = len(self._value)
+                        self._value.append(value)
+                        self._first.append(_NEVER if first is None else first)
+                        self._last.append(_NEVER if last is None else last)
+                        self._headers.append(0)
+                    self._headers[i] |= 1 << bit
+
+    def categories(self):
+        """Returns the names of all enumeration categories"""
+        return list(self._index)
+
+    def token(self, category, name):
+        """Returns the Token for a name, raising KeyError if unknown"""
+        i = self._index[category][name]
+        first, last, bits = self._first[i], self._last[i], self._headers[i]
+        return Token(category, name, self._value[i],
+                     None if first == _NEVER else first,
+                     None if last == _NEVER else last,
+                     frozenset(h for b, h in enumerate(VERSIONS) if bits & (1 << b)))
+
+    def value(self, category, name):
+        """Returns the value of a token"""
+        return self._value[self._index[category][name]]
+
+    def is_valid(self, category, name, version):
+        """Returns True if a token is part of the given core SPIR-V version.
+
+        Tokens that are only available through extensions are never valid
+        by version alone.
+
+        Arguments:
+            category: A spv table name, e.g. 'Capability'.
+            name: A token name, e.g. 'StorageBuffer16BitAccess'.
+            version: A 'major.minor' string or a version encoded like
+                     spv['Version'].
+        """
+        i = self._index[category].get(name)
+        if i is None:
+            return False
+        return self._first[i] <= encode_version(version) <= self._last[i]
+
+    def tokens(self, category, version=None, header=None):
+        """Returns a dict mapping names to values for a category, ordered
+        like the generated headers.
+
+        Arguments:
+            category: A spv table name.
+            version: If given, only tokens valid in this core version.
+            header: If given, only tokens of the spirv.py under this
+                    include/spirv directory, e.g. '1.1'.  The result then
+                    equals that header's table.
+        """
+        value, first, last = self._value, self._first, self._last
+        selected = self._index[category].items()
+        if header is not None:
+            bit = 1 << VERSIONS.index(header)
+            selected = [(n, i) for n, i in selected if self._headers[i] & bit]
+        if version is not None:
+            version = encode_version(version)
+            selected = [(n, i) for n, i in selected if first[i] <= version <= last[i]]
+        items = sorted(((n, value[i]) for n, i in selected),
+                       key=lambda item: (item[1], item[0]))
+        return dict(items)
+
+
+def enum_registry():
+    """Returns the shared EnumRegistry, building it on first use"""
+    global _registry
+    if _registry is None:
+        _registry = EnumRegistry()
+    return _registry
@@ -0,0 +1,254 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Persistent instruction indexes stored next to, or cached for, modules.
+
+A sidecar holds the word offset of every instruction, the offsets of the
+logical layout sections and of every OpFunction, and the offset of the
+instruction defining each result id.  It is named after the SHA-256 of the
+module it describes and the grammar version it was built with, records the
+SHA-256 of that grammar, and is read through mmap, so a query jumps straight
+to the instruction it needs without walking the module again.
+
+The file is a fixed header followed by four arrays of native 32-bit words:
+    offsets     one per instruction
+    sections    len(layout.SECTIONS) + 1, see layout.SectionTracker
+    functions   one per OpFunction
+    definitions one per id below the module's Bound, NO_OFFSET if undefined
+"""
+
+import array
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+
+from .binary import InvalidBinaryError, iter_instructions, native_words, read_header
+from .grammar import result_id_positions
+from .ids import NO_OFFSET
+from .layout import SECTIONS, SectionTracker
+from .tables import CORE_GRAMMAR, DEFAULT_VERSION, default_cache_dir, header_path, load_spv
+
+SIDECAR_MAGIC = b'SPVINDEX'
+SIDECAR_FORMAT = 2
+SIDECAR_SUFFIX = '.spvidx'
+
+# Written in native order; a file from a machine of the other byte order
+# does not match and is rebuilt.
+_BYTE_ORDER_MARK = 0x01020304
+_HEADER = struct.Struct('=8sII32s32sQIIII')
+
+_grammar_digests = {}
+
+
+class SidecarIndex:
+    """A read-only, memory-mapped sidecar.  Attributes:
+        digest: The SHA-256 of the module, as bytes.
+        grammar_digest: The SHA-256 of the core grammar it was built with.
+        size: The size of the module in bytes.
+        bound: The Bound of the module header.
+        offsets, sections, functions, definitions: memoryviews of 32-bit
+            words, see the module documentation.
+    """
+
+    def __init__(self, data):
+        """Arguments:
+            data: A bytes-like object holding a sidecar file.
+        """
+        self._mmap = None
+        view = memoryview(data)
+        words = None
+        try:
+            if view.nbytes < _HEADER.size:
+                raise InvalidBinaryError('Truncated sidecar')
+            (magic, version, mark, self.digest, self.grammar_digest, self.size, count,
+             section_count, function_count, self.bound) = _HEADER.unpack_from(view)
+            if magic != SIDECAR_MAGIC or version != SIDECAR_FORMAT or mark != _BYTE_ORDER_MARK:
+                raise InvalidBinaryError('Not a sidecar of format {}'.format(SIDECAR_FORMAT))
+            if section_count != len(SECTIONS) + 1:
+                raise InvalidBinaryError('Sidecar has {} sections'.format(section_count))
+            total = count + section_count + function_count + self.bound
+            if view.nbytes != _HEADER.size + 4 * total:
+                raise InvalidBinaryError('Truncated sidecar')
+            words = view[_HEADER.size:].cast('I')
+            self._words = words
+            self.offsets = words[:count]
+            self.sections = words[count:count + section_count]
+            start = count + section_count
+            self.functions = words[start:start + function_count]
+            self.definitions = words[start + function_count:]
+        except Exception:
+            # Release the views, so that SidecarIndex.open can unmap the file.
+            if words is not None:
+                words.release()
+            view.release()
+            raise
+        view.release()
+
+    @classmethod
+    def open(cls, path):
+        """Memory-maps the sidecar at path, read-only"""
+        with open(path, 'rb') as f:
+            try:
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise InvalidBinaryError('Empty sidecar: {}'.format(path))
+        try:
+            index = cls(mapping)
+        except Exception:
+            mapping.close()
+            raise
+        index._mmap = mapping
+        return index
+
+    def close(self):
+        """Releases the views and unmaps the file, if any"""
+        for view in (self.offsets, self.sections, self.functions,
+                     self.definitions, self._words):
+            view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        """The number of instructions"""
+        return len(self.offsets)
+
+    def section(self, name):
+        """Returns the (start, end) word offsets of a section named in
+        layout.SECTIONS"""
+        i = SECTIONS.index(name)
+        return self.sections[i], self.sections[i + 1]
+
+    def definition(self, result_id):
+        """Returns the offset of the instruction defining result_id, or None"""
+        if not 0 <= result_id < self.bound:
+            return None
+        offset = self.definitions[result_id]
+        return None if offset == NO_OFFSET else offset
+
+
+def module_digest(data):
+    """Returns the SHA-256 of a module as bytes"""
+    return hashlib.sha256(data).digest()
+
+
+def grammar_digest(version=DEFAULT_VERSION):
+    """Returns the SHA-256 of the core grammar of version as bytes"""
+    digest = _grammar_digests.get(version)
+    if digest is None:
+        with open(header_path(CORE_GRAMMAR, version), 'rb') as f:
+            digest = _grammar_digests[version] = hashlib.sha256(f.read()).digest()
+    return digest
+
+
+def build_sidecar(data, version=DEFAULT_VERSION, digest=None):
+    """Walks a module once and returns its sidecar as bytes.
+
+    Arguments:
+        data: A bytes-like object holding the module, in either byte order.
+        version: The headers and grammar to classify instructions with.
+        digest: The SHA-256 of data, if already known.
+    """
+    if digest is None:
+        digest = module_digest(data)
+    words = native_words(data)
+    bound = read_header(words).bound
+    positions = result_id_positions(CORE_GRAMMAR, version)
+    op_function = load_spv(version)['Op']['OpFunction']
+    tracker = SectionTracker(version)
+    add = tracker.add
+    offsets = array.array('I')
+    functions = array.array('I')
+    definitions = array.array('I', [NO_OFFSET]) * bound
+    for offset, opcode, word_count, operands in iter_instructions(words):
+        offsets.append(offset)
+        add(offset, opcode)
+        if opcode == op_function:
+            functions.append(offset)
+        position = positions.get(opcode)
+        if position is not None:
+            if position + 1 >= word_count:
+                raise InvalidBinaryError('Instruction too short for its result id', offset)
+            result_id = words[offset + 1 + position]
+            if result_id >= bound:
+                raise InvalidBinaryError('Result id {} is not below the bound {}'.format(
+                    result_id, bound), offset)
+            definitions[result_id] = offset
+    sections = tracker.offsets(len(words))
+    header = _HEADER.pack(SIDECAR_MAGIC, SIDECAR_FORMAT, _BYTE_ORDER_MARK, digest,
+                          grammar_digest(version), len(memoryview(data).cast('B')), len(offsets), len(sections),
+                          len(functions), bound)
+    return b''.join((header, offsets.tobytes(), sections.tobytes(),
+                     functions.tobytes(), definitions.tobytes()))
+
+
+def sidecar_path(digest, cache_dir=None, version=DEFAULT_VERSION):
+    """Returns the path of the sidecar of the module with the given digest,
+    built with the grammar of version"""
+    name = '{}-{}{}'.format(digest.hex(), version, SIDECAR_SUFFIX)
+    return os.path.join(cache_dir or default_cache_dir(), name)
+
+
+def load_sidecar(path, version=DEFAULT_VERSION, cache_dir=None):
+    """Returns the SidecarIndex of the module file at path, building and
+    saving it in cache_dir first if there is none yet.
+
+    The module is hashed to find its sidecar, which reads it once but is
+    much cheaper than walking its instructions.
+    """
+    with open(path, 'rb') as f:
+        try:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise InvalidBinaryError('Empty module: {}'.format(path))
+    with mapping:
+        digest = module_digest(mapping)
+    index_path = sidecar_path(digest, cache_dir, version)
+    try:
+        index = SidecarIndex.open(index_path)
+        if index.digest == digest and index.grammar_digest == grammar_digest(version):
+            return index
+        index.close()
+    except (OSError, InvalidBinaryError):
+        pass
+    # Built from a copy rather than the mapping, so that the views of a
+    # malformed module held by the error do not stop it being unmapped.
+    with open(path, 'rb') as f:
+        data = build_sidecar(f.read(), version, digest)
+    os.makedirs(os.path.dirname(index_path), exist_ok=True)
+    with tempfile.NamedTemporaryFile('wb', dir=os.path.dirname(index_path),
+                                     suffix='.tmp', delete=False) as f:
+        f.write(data)
+    os.replace(f.name, index_path)
+    return SidecarIndex.open(index_path)
@@ -0,0 +1,149 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Loads the generated spirv.py tables and the JSON grammars"""
+
+import importlib.util
+import json
+import os.path
+import xml.etree.ElementTree
+
+INCLUDE_DIR = os.path.normpath(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    os.pardir, os.pardir, os.pardir, 'include', 'spirv'))
+
+VERSIONS = ('1.0', '1.1', '1.2', 'unified1')
+DEFAULT_VERSION = 'unified1'
+
+CORE_GRAMMAR = 'spirv.core.grammar.json'
+
+# The XML registry of generator magic numbers, under include/spirv.
+REGISTRY = 'spir-v.xml'
+
+_spv_cache = {}
+_grammar_cache = {}
+_generators = None
+
+
+def header_path(name, version=DEFAULT_VERSION):
+    """Returns the path of a file shipped under include/spirv/<version>.
+
+    Arguments:
+        name: The file name, e.g. 'spirv.py'.
+        version: One of VERSIONS.
+    """
+    if version not in VERSIONS:
+        raise ValueError('Unknown SPIR-V header version: {}'.format(version))
+    return os.path.join(INCLUDE_DIR, version, name)
+
+
+def default_cache_dir():
+    """Returns the directory for files generated at run time, such as
+    compiled decoders: $XDG_CACHE_HOME/spirv_headers, or
+    ~/.cache/spirv_headers."""
+    root = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(root, 'spirv_headers')
+
+
+def load_module(name, version=DEFAULT_VERSION):
+    """Imports a Python module shipped under include/spirv/<version>.
+
+    The module is imported under a private name so that different versions
+    of the same file can be loaded side by side.
+    """
+    path = header_path(name + '.py', version)
+    module_name = 'spirv_headers._{}_{}'.format(
+        name.replace('.', '_'), version.replace('.', '_'))
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_spv(version=DEFAULT_VERSION):
+    """Returns the spv dictionary from include/spirv/<version>/spirv.py.
+
+    The dictionary is loaded once per version and shared afterwards.
+    """
+    spv = _spv_cache.get(version)
+    if spv is None:
+        spv = _spv_cache[version] = load_module('spirv', version).spv
+    return spv
+
+
+def load_grammar(name=CORE_GRAMMAR, version=DEFAULT_VERSION):
+    """Returns a parsed JSON grammar from include/spirv/<version>.
+
+    Arguments:
+        name: The grammar file name, e.g. 'spirv.core.grammar.json' or
+              'extinst.glsl.std.450.grammar.json'.
+        version: One of VERSIONS.
+    """
+    key = (name, version)
+    grammar = _grammar_cache.get(key)
+    if grammar is None:
+        with open(header_path(name, version)) as json_file:
+            grammar = _grammar_cache[key] = json.load(json_file)
+    return grammar
+
+
+def load_generators():
+    """Returns a dict mapping the generator ids registered in spir-v.xml
+    (the high 16 bits of the header's generator word) to a description such
+    as 'Khronos Glslang Reference Front End'."""
+    global _generators
+    if _generators is None:
+        root = xml.etree.ElementTree.parse(os.path.join(INCLUDE_DIR, REGISTRY)).getroot()
+        _generators = {}
+        for ids in root.iter('ids'):
+            if ids.get('type') == 'vendor':
+                for entry in ids.iter('id'):
+                    name = entry.get('vendor')
+                    if entry.get('tool'):
+                        name += ' ' + entry.get('tool')
+                    _generators[enum_value(entry.get('value'))] = name
+    return _generators
+
+
+def grammar_kind(category):
+    """Returns the grammar operand kind behind a spv category.
+
+    The generated headers split each BitEnum kind into a 'Shift' and a
+    'Mask' table, and call the instruction table 'Op'.
+    """
+    if category == 'Op':
+        return None
+    for suffix in ('Shift', 'Mask'):
+        if category.endswith(suffix):
+            return category[:-len(suffix)]
+    return category
+
+
+def enum_value(value):
+    """Returns the integer value of a grammar enumerant or opcode field."""
+    if isinstance(value, str):
+        return int(value, 0)
+    return value
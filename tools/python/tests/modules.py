@@ -0,0 +1,163 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Small hand-written modules for the tests"""
+
+import array
+
+from spirv_headers.binary import MAGIC_NUMBER, WORD_COUNT_SHIFT, encode_string
+from spirv_headers.tables import load_spv
+
+VERSION_1_6 = 0x00010600
+
+
+def assemble_words(instructions, bound, version=VERSION_1_6):
+    """Returns the words of a module as an array('I').
+
+    Arguments:
+        instructions: (opname, operand, ...) tuples.  Operands are ints, or
+                      strs encoded as literal strings.
+        bound: The id bound of the header.
+        version: The SPIR-V version word of the header.
+    """
+    ops = load_spv()['Op']
+    body = array.array('I')
+    for opname, *operands in instructions:
+        words = array.array('I')
+        for operand in operands:
+            if isinstance(operand, str):
+                words.extend(encode_string(operand))
+            else:
+                words.append(operand)
+        body.append(((len(words) + 1) << WORD_COUNT_SHIFT) | ops[opname])
+        body.extend(words)
+    return array.array('I', [MAGIC_NUMBER, version, 0, bound, 0]) + body
+
+
+def assemble_bytes(instructions, bound, version=VERSION_1_6):
+    """Returns the bytes of a module, see assemble_words"""
+    return assemble_words(instructions, bound, version).tobytes()
+
+
+def swap_bytes(data):
+    """Returns data with the bytes of each word reversed"""
+    words = array.array('I', data)
+    words.byteswap()
+    return words.tobytes()
+
+
+# A compute shader that switches on a 32-bit value and declares a few types
+# and constants, some of them twice.
+SHADER = [
+    ('OpCapability', 1),
+    ('OpMemoryModel', 0, 1),
+    ('OpEntryPoint', 5, 1, 'main'),
+    ('OpExecutionMode', 1, 17, 1, 1, 1),
+    ('OpName', 1, 'main'),
+    ('OpName', 5, 'x'),
+    ('OpTypeVoid', 2),
+    ('OpTypeFunction', 3, 2),
+    ('OpTypeInt', 4, 32, 1),
+    ('OpTypeInt', 6, 32, 1),
+    ('OpConstant', 4, 7, 3),
+    ('OpConstant', 6, 8, 3),
+    ('OpFunction', 2, 1, 0, 3),
+    ('OpLabel', 9),
+    ('OpIAdd', 4, 5, 7, 7),
+    ('OpIAdd', 6, 10, 8, 8),
+    ('OpSelectionMerge', 11, 0),
+    ('OpSwitch', 5, 11, 1, 12, 2, 11),
+    ('OpLabel', 12),
+    ('OpBranch', 11),
+    ('OpLabel', 11),
+    ('OpReturn',),
+    ('OpFunctionEnd',),
+]
+SHADER_BOUND = 13
+
+# Switches on a 64-bit value with the literals 1234567890123 and 5.
+SWITCH_64 = [
+    ('OpCapability', 1),
+    ('OpCapability', 11),
+    ('OpMemoryModel', 0, 1),
+    ('OpTypeVoid', 1),
+    ('OpTypeFunction', 2, 1),
+    ('OpTypeInt', 3, 64, 0),
+    ('OpConstant', 3, 4, 7, 0),
+    ('OpFunction', 1, 5, 0, 2),
+    ('OpLabel', 6),
+    ('OpSelectionMerge', 7, 0),
+    ('OpSwitch', 4, 7, 1234567890123 & 0xffffffff, 1234567890123 >> 32, 8, 5, 0, 7),
+    ('OpLabel', 8),
+    ('OpBranch', 7),
+    ('OpLabel', 7),
+    ('OpReturn',),
+    ('OpFunctionEnd',),
+]
+SWITCH_64_BOUND = 9
+
+# An OpenCL C kernel compiled with -g, describing its source with the
+# OpenCL.DebugInfo.100 set, and the same kernel without the debug
+# information.  The ids are those a compiler would give with -g.
+OPENCL_DEBUG = [
+    ('OpCapability', 4),
+    ('OpCapability', 6),
+    ('OpExtInstImport', 1, 'OpenCL.std'),
+    ('OpExtInstImport', 2, 'OpenCL.DebugInfo.100'),
+    ('OpMemoryModel', 2, 2),
+    ('OpEntryPoint', 6, 12, 'k'),
+    ('OpString', 3, 'k.cl'),
+    ('OpString', 4, 'kernel void k() {}'),
+    ('OpString', 5, 'k'),
+    ('OpSource', 3, 200000),
+    ('OpName', 12, 'k'),
+    ('OpTypeVoid', 6),
+    ('OpTypeFunction', 7, 6),
+    ('OpExtInst', 6, 8, 2, 35, 3, 4),                         # DebugSource
+    ('OpExtInst', 6, 9, 2, 1, 65536, 4, 8, 3),                # DebugCompilationUnit
+    ('OpExtInst', 6, 10, 2, 0),                               # DebugInfoNone
+    ('OpExtInst', 6, 11, 2, 20, 5, 10, 8, 1, 1, 9, 5, 8, 1, 12, 10),  # DebugFunction
+    ('OpFunction', 6, 12, 0, 7),
+    ('OpLabel', 13),
+    ('OpExtInst', 6, 14, 2, 23, 11),                          # DebugScope
+    ('OpLine', 3, 1, 1),
+    ('OpReturn',),
+    ('OpFunctionEnd',),
+]
+OPENCL_DEBUG_BOUND = 15
+OPENCL = [
+    ('OpCapability', 4),
+    ('OpCapability', 6),
+    ('OpExtInstImport', 1, 'OpenCL.std'),
+    ('OpMemoryModel', 2, 2),
+    ('OpEntryPoint', 6, 12, 'k'),
+    ('OpTypeVoid', 6),
+    ('OpTypeFunction', 7, 6),
+    ('OpFunction', 6, 12, 0, 7),
+    ('OpLabel', 13),
+    ('OpReturn',),
+    ('OpFunctionEnd',),
+]
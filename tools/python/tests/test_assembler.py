@@ -0,0 +1,157 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Tests of the text assembler"""
+
+import io
+
+import pytest
+
+from spirv_headers.assembler import AssemblyError, assemble
+from spirv_headers.binary import iter_module, native_words, read_header
+from spirv_headers.disassembler import disassemble
+from spirv_headers.tables import load_spv
+
+from modules import (SHADER, SHADER_BOUND, SWITCH_64, SWITCH_64_BOUND, assemble_bytes,
+                     assemble_words)
+
+PREAMBLE = '''\
+               OpCapability Shader
+               OpCapability Int16
+               OpCapability Int64
+               OpMemoryModel Logical GLSL450
+'''
+
+
+def text_of(data, **kwargs):
+    out = io.StringIO()
+    disassemble(data, out, **kwargs)
+    return out.getvalue()
+
+
+def test_round_trip():
+    data = assemble_bytes(SHADER, SHADER_BOUND)
+    assert assemble(text_of(data)) == data
+
+
+def test_round_trip_with_friendly_names():
+    # Named ids get new numbers, so only the text is kept.
+    text = text_of(assemble_bytes(SHADER, SHADER_BOUND), friendly_names=True)
+    again = text_of(assemble(text), friendly_names=True)
+    assert again.splitlines()[4:] == text.splitlines()[4:]
+
+
+def test_round_trip_of_64_bit_switch():
+    data = assemble_bytes(SWITCH_64, SWITCH_64_BOUND)
+    text = text_of(data)
+    assert '1234567890123' in text
+    assert assemble(text) == data
+
+
+def test_constants():
+    words = assemble_words([
+        ('OpCapability', 1),
+        ('OpCapability', 22),
+        ('OpCapability', 11),
+        ('OpMemoryModel', 0, 1),
+        ('OpTypeInt', 1, 16, 1),
+        ('OpConstant', 1, 2, 0xfffffffe),
+        ('OpTypeInt', 3, 16, 0),
+        ('OpConstant', 3, 4, 0xfffe),
+        ('OpTypeInt', 5, 64, 1),
+        ('OpConstant', 5, 6, 0xfffffffb, 0xffffffff),
+        ('OpTypeFloat', 7, 32),
+        ('OpConstant', 7, 8, 0x3fc00000),
+    ], 9)
+    assert assemble(PREAMBLE + '''\
+          %1 = OpTypeInt 16 1
+          %2 = OpConstant %1 -2
+          %3 = OpTypeInt 16 0
+          %4 = OpConstant %3 65534
+          %5 = OpTypeInt 64 1
+          %6 = OpConstant %5 -5
+          %7 = OpTypeFloat 32
+          %8 = OpConstant %7 1.5
+''', module_version=(1, 6)) == words.tobytes()
+
+
+@pytest.mark.parametrize('line', [
+    'OpExecutionMode %1 LocalSize 4294967296 1 1',
+    'OpExecutionMode %1 LocalSize -2147483649 1 1',
+    'OpSwitch %2 %3 1234567890123 %4',
+    '%1 = OpConstant %int 4294967296',
+    '%1 = OpConstant %short 65536',
+    '%1 = OpConstant %short -32769',
+    '%1 = OpConstant %long 18446744073709551616',
+])
+def test_literal_out_of_range(line):
+    text = PREAMBLE + '''\
+        %int = OpTypeInt 32 0
+      %short = OpTypeInt 16 1
+       %long = OpTypeInt 64 0
+          %2 = OpConstant %int 0
+''' + line + '\n'
+    with pytest.raises(AssemblyError, match=r'does not fit in \d+ bits at line 9'):
+        assemble(text)
+
+
+@pytest.mark.parametrize('line, message', [
+    ('%4 = OpConstant %float abc', 'Expected a float, got abc'),
+    ('%4 = OpConstant %half 1e10', r'1e10 does not fit in a 16-bit float'),
+    ('%4 = OpConstant %float 1e300', r'1e300 does not fit in a 32-bit float'),
+])
+def test_bad_float(line, message):
+    text = PREAMBLE + '''\
+      %float = OpTypeFloat 32
+       %half = OpTypeFloat 16
+''' + line + '\n'
+    with pytest.raises(AssemblyError, match=message + ' at line 7'):
+        assemble(text)
+
+
+def test_bound_counts_only_id_operands():
+    data = assemble(PREAMBLE + '''\
+               ; Not an id: %99999999
+               OpName %2 "x %88888888"
+               OpName %named "%77777777" ; %66666666
+          %2 = OpTypeInt 32 0
+      %named = OpTypeFloat 32
+''')
+    assert read_header(native_words(data)).bound == 4
+    ops = load_spv()['Op']
+    assert [operands[0] for _, opcode, _, operands in iter_module(data)
+            if opcode in (ops['OpName'], ops['OpTypeInt'], ops['OpTypeFloat'])] == [2, 3, 2, 3]
+
+
+@pytest.mark.parametrize('text, message', [
+    ('OpNoSuchThing', 'OpNoSuchThing'),
+    ('OpCapability NoSuchCapability', 'NoSuchCapability'),
+    ('%1 = OpTypeInt 32', 'line 1'),
+    ('OpCapability Shader Shader', 'Unexpected operand'),
+])
+def test_errors(text, message):
+    with pytest.raises(AssemblyError, match=message):
+        assemble(text)
@@ -0,0 +1,110 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Tests of running a task over many modules"""
+
+import pytest
+
+from spirv_headers import batch
+from spirv_headers.tables import load_spv
+
+from modules import OPENCL, SHADER, SHADER_BOUND, SWITCH_64, SWITCH_64_BOUND, assemble_bytes
+
+
+def write(path, size):
+    """Writes size bytes to path and returns it as a str"""
+    path.write_bytes(bytes(size))
+    return str(path)
+
+
+@pytest.fixture
+def files(tmp_path):
+    """Valid modules interleaved with a truncated and a missing file"""
+    paths = []
+    for name, data in [('shader.spv', assemble_bytes(SHADER, SHADER_BOUND)),
+                       ('truncated.spv', b'\x03\x02\x23\x07'),
+                       ('switch.spv', assemble_bytes(SWITCH_64, SWITCH_64_BOUND)),
+                       ('opencl.spv', assemble_bytes(OPENCL, 14))]:
+        (tmp_path / name).write_bytes(data)
+        paths.append(str(tmp_path / name))
+    paths.insert(2, str(tmp_path / 'missing.spv'))
+    return paths
+
+
+@pytest.mark.parametrize('processes', [1, 2])
+def test_results_in_input_order(files, processes):
+    results = list(batch.run(batch.count_opcodes, files, processes, chunks_per_process=2))
+    assert [result.path for result in results] == files
+    assert results[0].value[load_spv()['Op']['OpLabel']] == 3
+
+
+def test_errors_are_captured_per_file(files):
+    results = {result.path: result for result in batch.run(batch.count_opcodes, files, 2)}
+    assert results[files[1]].value is None
+    assert results[files[1]].error.startswith('InvalidBinaryError: ')
+    assert results[files[2]].value is None
+    assert results[files[2]].error.startswith('FileNotFoundError: ')
+    for path in files[0], files[3], files[4]:
+        assert results[path].error is None
+        assert results[path].value
+
+
+def test_one_process_matches_pool(files):
+    serial = list(batch.run(batch.count_opcodes, files, processes=1))
+    pooled = list(batch.run(batch.count_opcodes, files, processes=3, chunks_per_process=1))
+    assert serial == pooled
+
+
+def test_task_is_reset(files):
+    list(batch.run(batch.count_opcodes, files, processes=1))
+    assert batch._task is None
+
+
+def test_balanced_chunks_even(tmp_path):
+    paths = [write(tmp_path / str(i), 100) for i in range(4)]
+    assert batch.balanced_chunks(paths, 2) == [paths[:2], paths[2:]]
+    assert batch.balanced_chunks(paths, 4) == [[path] for path in paths]
+
+
+def test_balanced_chunks_large_file(tmp_path):
+    paths = [write(tmp_path / '0', 400)] + [write(tmp_path / str(i), 100) for i in range(1, 5)]
+    assert batch.balanced_chunks(paths, 2) == [paths[:1], paths[1:]]
+
+
+def test_balanced_chunks_keep_order(tmp_path):
+    paths = [write(tmp_path / str(i), size) for i, size in enumerate([10, 300, 20, 30, 40])]
+    chunks = batch.balanced_chunks(paths, 3)
+    assert len(chunks) <= 3
+    assert [path for chunk in chunks for path in chunk] == paths
+
+
+def test_balanced_chunks_edge_cases(tmp_path):
+    paths = [write(tmp_path / str(i), 0) for i in range(3)]
+    assert batch.balanced_chunks([], 4) == []
+    assert batch.balanced_chunks(paths, 0) == [paths]
+    assert batch.balanced_chunks(paths, 10) == [paths]
+    missing = str(tmp_path / 'missing')
+    assert batch.balanced_chunks(paths + [missing], 1) == [paths + [missing]]
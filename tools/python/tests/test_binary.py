@@ -0,0 +1,100 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Tests of the binary instruction iterators"""
+
+import io
+
+import pytest
+
+from spirv_headers.binary import (InvalidBinaryError, decode_string, encode_string,
+                                  iter_module, iter_stream)
+from spirv_headers.tables import load_spv
+
+from modules import SHADER, SHADER_BOUND, assemble_bytes
+
+OPS = load_spv()['Op']
+
+
+def opnames(instructions):
+    names = {value: name for name, value in OPS.items()}
+    return [names[opcode] for offset, opcode, word_count, operands in instructions
+            if opcode is not None]
+
+
+def test_iter_module():
+    data = assemble_bytes(SHADER, SHADER_BOUND)
+    assert opnames(iter_module(data)) == [inst[0] for inst in SHADER]
+    offset, opcode, word_count, operands = next(iter_module(data))
+    assert (offset, opcode, word_count, list(operands)) == (5, OPS['OpCapability'], 2, [1])
+
+
+def test_strings_round_trip():
+    for text in ('', 'main', 'abc', 'abcd', 'ŝtring'):
+        words = encode_string(text)
+        assert decode_string(words) == (text, len(words))
+
+
+@pytest.mark.parametrize('chunk_words', [1, 3, 7, 1 << 16])
+def test_iter_stream_concatenated_modules(chunk_words):
+    data = assemble_bytes(SHADER, SHADER_BOUND)
+    instructions = list(iter_stream(io.BytesIO(data * 2), chunk_words))
+    headers = [offset for offset, opcode, _, _ in instructions if opcode is None]
+    assert headers == [0, len(data) // 4]
+    assert opnames(instructions) == [inst[0] for inst in SHADER] * 2
+
+
+def test_bad_magic():
+    data = b'\0\0\0\0' + assemble_bytes(SHADER, SHADER_BOUND)[4:]
+    with pytest.raises(InvalidBinaryError, match='magic number'):
+        list(iter_module(data))
+    with pytest.raises(InvalidBinaryError, match='magic number'):
+        list(iter_stream(io.BytesIO(data)))
+
+
+def test_odd_size():
+    data = assemble_bytes(SHADER, SHADER_BOUND) + b'\0\0'
+    with pytest.raises(InvalidBinaryError, match='multiple of 4'):
+        list(iter_module(data))
+    with pytest.raises(InvalidBinaryError, match='Truncated stream'):
+        list(iter_stream(io.BytesIO(data)))
+
+
+def test_truncated_instruction():
+    data = assemble_bytes(SHADER, SHADER_BOUND)[:-4] + assemble_bytes(
+        [('OpSource', 2, 450)], 1)[20:24]
+    with pytest.raises(InvalidBinaryError, match='Truncated instruction'):
+        list(iter_module(data))
+    with pytest.raises(InvalidBinaryError, match='Truncated stream'):
+        list(iter_stream(io.BytesIO(data)))
+
+
+def test_word_count_zero():
+    data = assemble_bytes(SHADER, SHADER_BOUND) + b'\0\0\0\0'
+    with pytest.raises(InvalidBinaryError, match='word count 0'):
+        list(iter_module(data))
+    with pytest.raises(InvalidBinaryError, match='word count 0'):
+        list(iter_stream(io.BytesIO(data)))
@@ -0,0 +1,155 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Tests of the module builder"""
+
+import io
+
+import pytest
+
+from spirv_headers.binary import MAX_WORD_COUNT, encode_string, iter_module
+from spirv_headers.builder import ModuleBuilder
+from spirv_headers.tables import load_spv
+
+from modules import SHADER, SHADER_BOUND, assemble_bytes
+
+OPS = load_spv()['Op']
+
+
+def emit(builder, opname, *operands):
+    words = []
+    for operand in operands:
+        if isinstance(operand, str):
+            words.extend(encode_string(operand))
+        else:
+            words.append(operand)
+    builder.emit_words(OPS[opname], words)
+
+
+def test_instructions_go_to_their_section():
+    builder = ModuleBuilder(module_version=(1, 6))
+    builder.new_ids(SHADER_BOUND - 1)
+    late = ('OpName', 'OpConstant')
+    for inst in SHADER:
+        if inst[0] not in late:
+            emit(builder, *inst)
+            if inst[0] == 'OpLabel' and inst[1] == 9:
+                # Constants emitted in a function go to the globals.
+                for constant in SHADER:
+                    if constant[0] == 'OpConstant':
+                        emit(builder, *constant)
+    for inst in SHADER:
+        if inst[0] == 'OpName':
+            emit(builder, *inst)
+    data = assemble_bytes(SHADER, SHADER_BOUND)
+    assert builder.bound == SHADER_BOUND
+    assert builder.word_count() == len(data) // 4
+    assert builder.to_bytes() == data
+    out = io.BytesIO()
+    builder.write(out)
+    assert out.getvalue() == data
+
+
+def test_define():
+    builder = ModuleBuilder()
+    void = builder.define(OPS['OpTypeVoid'])
+    function_type = builder.define(OPS['OpTypeFunction'], void)
+    function = builder.define(OPS['OpFunction'], void, 0, function_type)
+    builder.emit(OPS['OpFunctionEnd'])
+    assert (void, function_type, function) == (1, 2, 3)
+    instructions = [(opcode, list(operands))
+                    for _, opcode, _, operands in iter_module(builder.to_bytes())]
+    assert instructions[2] == (OPS['OpFunction'], [void, function, 0, function_type])
+
+
+def test_declarations_precede_definitions():
+    builder = ModuleBuilder()
+    void, function_type, defined, declared, label = builder.new_ids(5)
+    builder.emit(OPS['OpTypeVoid'], void)
+    builder.emit(OPS['OpTypeFunction'], function_type, void)
+    builder.emit(OPS['OpFunction'], void, defined, 0, function_type)
+    builder.emit(OPS['OpLabel'], label)
+    builder.emit(OPS['OpReturn'])
+    builder.emit(OPS['OpFunctionEnd'])
+    builder.emit(OPS['OpFunction'], void, declared, 0, function_type)
+    builder.emit(OPS['OpFunctionEnd'])
+    functions = [operands[1] for _, opcode, _, operands in iter_module(builder.to_bytes())
+                 if opcode == OPS['OpFunction']]
+    assert functions == [declared, defined]
+
+
+def test_unfinished_function():
+    builder = ModuleBuilder()
+    builder.define(OPS['OpFunction'], 1, 0, 2)
+    with pytest.raises(ValueError):
+        builder.to_bytes()
+
+
+def test_debug_parts_stay_in_order():
+    builder = ModuleBuilder()
+    void = builder.new_id()
+    emit(builder, 'OpCapability', 1)
+    emit(builder, 'OpMemoryModel', 0, 1)
+    emit(builder, 'OpModuleProcessed', 'opt')
+    emit(builder, 'OpName', void, 'void')
+    file_name = builder.define_words(OPS['OpString'], encode_string('a.comp'))
+    emit(builder, 'OpSource', 2, 450, file_name)
+    emit(builder, 'OpTypeVoid', void)
+    emit(builder, 'OpMemberName', void, 0, 'x')
+    emit(builder, 'OpSourceExtension', 'GL_EXT_x')
+    opcodes = [opcode for _, opcode, _, _ in iter_module(builder.to_bytes())]
+    assert opcodes == [OPS[name] for name in (
+        'OpCapability', 'OpMemoryModel', 'OpString', 'OpSource', 'OpSourceExtension',
+        'OpName', 'OpMemberName', 'OpModuleProcessed', 'OpTypeVoid')]
+    assert builder.word_count() == len(builder.to_bytes()) // 4
+
+
+def test_define_without_result_id():
+    builder = ModuleBuilder()
+    with pytest.raises(ValueError, match='has no result id'):
+        builder.define(OPS['OpCapability'], 1)
+    with pytest.raises(ValueError, match='has no result id'):
+        builder.define_words(OPS['OpReturn'], [])
+    assert builder.next_id == 1
+    assert builder.word_count() == 5
+
+
+def test_instruction_too_long():
+    builder = ModuleBuilder()
+    name = builder.new_id()
+    # One word more than fits, with the first word of the instruction.
+    operands = [name] + [0x41414141] * (MAX_WORD_COUNT - 1)
+    with pytest.raises(ValueError, match='of 65536 words is longer than 65535'):
+        builder.emit(OPS['OpName'], *operands)
+    with pytest.raises(ValueError, match='of 65536 words is longer than 65535'):
+        builder.emit_words(OPS['OpName'], operands)
+    with pytest.raises(ValueError, match='of 65536 words is longer than 65535'):
+        builder.define(OPS['OpString'], *operands[1:])
+    with pytest.raises(ValueError, match='of 65536 words is longer than 65535'):
+        builder.define_words(OPS['OpString'], operands[1:])
+    assert builder.word_count() == 5 and builder.next_id == 2
+    builder.emit_words(OPS['OpName'], operands[:-2] + [0])
+    assert builder.word_count() == 5 + MAX_WORD_COUNT
@@ -0,0 +1,78 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Tests of byte-swapped modules"""
+
+import io
+
+import pytest
+
+from spirv_headers.binary import (InvalidBinaryError, is_swapped, iter_module,
+                                  iter_stream, native_array, native_words)
+from spirv_headers.module import Module
+
+from modules import SHADER, SHADER_BOUND, assemble_bytes, swap_bytes
+
+DATA = assemble_bytes(SHADER, SHADER_BOUND)
+SWAPPED = swap_bytes(DATA)
+
+
+def instructions(iterator):
+    return [(offset, opcode, word_count, list(operands))
+            for offset, opcode, word_count, operands in iterator]
+
+
+def test_is_swapped():
+    assert not is_swapped(DATA)
+    assert is_swapped(SWAPPED)
+    with pytest.raises(InvalidBinaryError):
+        is_swapped(b'\0\0\0\0')
+    with pytest.raises(InvalidBinaryError):
+        is_swapped(b'')
+
+
+def test_native_words():
+    assert native_words(SWAPPED).tolist() == native_words(DATA).tolist()
+    assert instructions(iter_module(SWAPPED)) == instructions(iter_module(DATA))
+
+
+def test_native_array():
+    pytest.importorskip('numpy')
+    assert native_array(SWAPPED).tolist() == native_array(DATA).tolist()
+
+
+def test_module():
+    module = Module(SWAPPED)
+    assert module.byteswapped
+    assert module.bound == SHADER_BOUND
+    assert instructions(module.instructions()) == instructions(Module(DATA).instructions())
+
+
+@pytest.mark.parametrize('chunk_words', [2, 5, 1 << 16])
+def test_stream_of_mixed_byte_orders(chunk_words):
+    stream = io.BytesIO(DATA + SWAPPED + DATA)
+    expected = instructions(iter_stream(io.BytesIO(DATA * 3)))
+    assert instructions(iter_stream(stream, chunk_words)) == expected
@@ -0,0 +1,101 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Tests of the debug information stripper"""
+
+import io
+
+import pytest
+
+from spirv_headers import debuginfo
+from spirv_headers.binary import iter_module, native_words
+from spirv_headers.index import InstructionIndex
+from spirv_headers.tables import load_spv
+
+from modules import (OPENCL, OPENCL_DEBUG, OPENCL_DEBUG_BOUND, SHADER, SHADER_BOUND,
+                     assemble_bytes, swap_bytes)
+
+OPS = load_spv()['Op']
+
+# SHADER with a NonSemantic.DebugPrintf call and the extension it needs.
+NON_SEMANTIC = (SHADER[:1] + [('OpExtension', 'SPV_KHR_non_semantic_info'),
+                              ('OpExtInstImport', 13, 'NonSemantic.DebugPrintf')] +
+                SHADER[1:14] + [('OpExtInst', 2, 14, 13, 1, 7)] + SHADER[14:])
+
+
+def without(instructions, *opnames):
+    return [inst for inst in instructions if inst[0] not in opnames]
+
+
+@pytest.fixture(params=['walk', 'index'])
+def ranges_of(request):
+    """kept_ranges, and index_kept_ranges when NumPy is installed"""
+    if request.param == 'walk':
+        return lambda data: debuginfo.kept_ranges(native_words(data))
+    pytest.importorskip('numpy')
+    return lambda data: debuginfo.index_kept_ranges(InstructionIndex(data))
+
+
+def test_is_debug_set():
+    assert debuginfo.is_debug_set('NonSemantic.Shader.DebugInfo.100')
+    assert debuginfo.is_debug_set('OpenCL.DebugInfo.100')
+    assert debuginfo.is_debug_set('DebugInfo')
+    assert not debuginfo.is_debug_set('GLSL.std.450')
+    assert not debuginfo.is_debug_set('OpenCL.std')
+
+
+def test_kept_ranges(ranges_of):
+    data = assemble_bytes(SHADER, SHADER_BOUND)
+    offsets = [offset for offset, _, _, _ in iter_module(data)]
+    names = [inst[0] for inst in SHADER]
+    first_name = names.index('OpName')
+    assert ranges_of(data).tolist() == [5, offsets[first_name],
+                                        offsets[first_name + 2], len(data) // 4]
+
+
+@pytest.mark.parametrize('debug, plain, bound', [
+    (SHADER, without(SHADER, 'OpName'), SHADER_BOUND),
+    (NON_SEMANTIC, without(SHADER, 'OpName'), SHADER_BOUND + 2),
+    (OPENCL_DEBUG, OPENCL, OPENCL_DEBUG_BOUND),
+], ids=['names', 'NonSemantic', 'OpenCL.DebugInfo.100'])
+def test_stripped(ranges_of, debug, plain, bound):
+    data = assemble_bytes(debug, bound)
+    expected = assemble_bytes(plain, bound)
+    ranges = ranges_of(data)
+    words = native_words(data)
+    assert b''.join(words[ranges[i]:ranges[i + 1]].tobytes()
+                    for i in range(0, len(ranges), 2)) == expected[20:]
+    assert debuginfo.stripped(data) == expected
+    assert debuginfo.stripped(swap_bytes(data)) == swap_bytes(expected)
+    out = io.BytesIO()
+    assert debuginfo.strip_debug(data, out) == len(expected)
+    assert out.getvalue() == expected
+
+
+def test_no_debug_information(ranges_of):
+    data = assemble_bytes(OPENCL, OPENCL_DEBUG_BOUND)
+    assert ranges_of(data).tolist() == [5, len(data) // 4]
+    assert debuginfo.stripped(data) == data
@@ -0,0 +1,96 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Tests of the compiled operand decoders"""
+
+import pytest
+
+from spirv_headers.binary import InvalidBinaryError, iter_module
+from spirv_headers.decoders import SwitchWidths, decode
+from spirv_headers.ids import DefUse, IdOperands
+from spirv_headers.tables import load_spv
+
+from modules import SWITCH_64, SWITCH_64_BOUND, assemble_bytes
+
+OPS = load_spv()['Op']
+
+
+def test_decode():
+    assert decode(OPS['OpTypeInt'], [3, 64, 0]) == [
+        ('IdResult', 3), ('LiteralInteger', 64), ('LiteralInteger', 0)]
+    assert decode(OPS['OpName'], [1, 0x6e69616d, 0]) == [
+        ('IdRef', 1), ('LiteralString', 'main')]
+    assert decode(OPS['OpLoad'], [1, 2, 3, 2, 4]) == [
+        ('IdResultType', 1), ('IdResult', 2), ('IdRef', 3),
+        ('MemoryAccess', 2), ('LiteralInteger', 4)]
+
+
+def test_decode_errors():
+    with pytest.raises(InvalidBinaryError, match='Unknown opcode'):
+        decode(0xfff0, [])
+    with pytest.raises(InvalidBinaryError):
+        decode(OPS['OpLoad'], [1])
+
+
+def test_switch_literal_width():
+    operands = [4, 7, 1234567890123 & 0xffffffff, 1234567890123 >> 32, 8, 5, 0, 7]
+    assert decode(OPS['OpSwitch'], operands, literal_words=2) == [
+        ('IdRef', 4), ('IdRef', 7),
+        ('LiteralInteger', 1234567890123), ('IdRef', 8),
+        ('LiteralInteger', 5), ('IdRef', 7)]
+    assert decode(OPS['OpSwitch'], [4, 7, 1, 8]) == [
+        ('IdRef', 4), ('IdRef', 7), ('LiteralInteger', 1), ('IdRef', 8)]
+
+
+def test_switch_widths():
+    widths = SwitchWidths()
+    for offset, opcode, word_count, operands in iter_module(
+            assemble_bytes(SWITCH_64, SWITCH_64_BOUND)):
+        widths.add(opcode, operands)
+    assert widths.literal_words(4) == 2
+    assert widths.literal_words(6) == 1
+
+
+def test_def_use_of_64_bit_switch():
+    data = assemble_bytes(SWITCH_64, SWITCH_64_BOUND)
+    def_use = DefUse.from_module(data)
+    offsets = [offset for offset, _, _, _ in iter_module(data)]
+    switch = offsets[[inst[0] for inst in SWITCH_64].index('OpSwitch')]
+    assert list(def_use.users_of(4)) == [switch]
+    assert list(def_use.users_of(8)) == [switch]
+    assert switch in def_use.users_of(7)
+
+
+def test_id_operands_of_64_bit_switch():
+    id_operands = IdOperands()
+    positions = None
+    for offset, opcode, word_count, operands in iter_module(
+            assemble_bytes(SWITCH_64, SWITCH_64_BOUND)):
+        if opcode == OPS['OpSwitch']:
+            positions = id_operands.positions(opcode, operands)
+        else:
+            id_operands.positions(opcode, operands)
+    assert positions == [0, 1, 4, 7]
@@ -0,0 +1,76 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Tests of the type and constant deduplication pass"""
+
+from spirv_headers.dedup import dedup
+from spirv_headers.ids import DefUse
+
+from modules import (SHADER, SHADER_BOUND, SWITCH_64, SWITCH_64_BOUND, assemble_bytes,
+                     swap_bytes)
+
+
+def replaced(instructions, remap, dropped):
+    """Returns instructions without the dropped ones, with the ids in remap
+    replaced in every other operand"""
+    return [(inst[0],) + tuple(remap.get(operand, operand) for operand in inst[1:])
+            for inst in instructions if inst not in dropped]
+
+
+SHADER_DEDUPED = replaced(SHADER, {6: 4, 8: 7}, [('OpTypeInt', 6, 32, 1),
+                                                 ('OpConstant', 6, 8, 3)])
+
+
+def test_dedup():
+    data = assemble_bytes(SHADER, SHADER_BOUND)
+    result = dedup(data)
+    expected = assemble_bytes(SHADER_DEDUPED, SHADER_BOUND)
+    assert result.data == expected
+    assert result.removed == 2
+    assert (result.old_size, result.new_size) == (len(data), len(expected))
+    assert dedup(swap_bytes(data)).data == expected
+
+
+def test_dedup_is_idempotent():
+    data = dedup(assemble_bytes(SHADER, SHADER_BOUND)).data
+    result = dedup(data)
+    assert result.removed == 0 and result.data == data
+
+
+def test_decorated_types_are_kept():
+    decorated = (SHADER[:6] + [('OpDecorate', 6, 0)] + SHADER[6:])
+    result = dedup(assemble_bytes(decorated, SHADER_BOUND))
+    # Only the constants of the two types could merge, and they use
+    # different types.
+    assert result.removed == 0
+
+
+def test_64_bit_switch():
+    duplicate = SWITCH_64[:6] + [('OpTypeInt', 9, 64, 0)] + SWITCH_64[6:]
+    result = dedup(assemble_bytes(duplicate, SWITCH_64_BOUND + 1))
+    assert result.removed == 1
+    assert result.data == assemble_bytes(SWITCH_64, SWITCH_64_BOUND + 1)
+    DefUse.from_module(result.data)
@@ -0,0 +1,101 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Tests of the debug-insensitive module digests"""
+
+import pytest
+
+from spirv_headers import digest
+from spirv_headers.binary import InvalidBinaryError
+from spirv_headers.debuginfo import stripped
+
+from modules import (OPENCL, OPENCL_DEBUG, OPENCL_DEBUG_BOUND, SHADER, SHADER_BOUND,
+                     SWITCH_64, SWITCH_64_BOUND, assemble_bytes, swap_bytes)
+
+# OPENCL as built without -g: the ids are numbered from 1 with no gaps.
+OPENCL_COMPACT = [
+    ('OpCapability', 4),
+    ('OpCapability', 6),
+    ('OpExtInstImport', 1, 'OpenCL.std'),
+    ('OpMemoryModel', 2, 2),
+    ('OpEntryPoint', 6, 4, 'k'),
+    ('OpTypeVoid', 2),
+    ('OpTypeFunction', 3, 2),
+    ('OpFunction', 2, 4, 0, 3),
+    ('OpLabel', 5),
+    ('OpReturn',),
+    ('OpFunctionEnd',),
+]
+
+
+@pytest.fixture(params=['walk', 'index'])
+def with_numpy(request, monkeypatch):
+    """Runs a test with and without NumPy"""
+    if request.param == 'walk':
+        monkeypatch.setattr(digest, 'numpy', None)
+    else:
+        pytest.importorskip('numpy')
+
+
+@pytest.mark.parametrize('canonical_ids', [False, True])
+def test_stripped_module_has_the_same_digest(with_numpy, canonical_ids):
+    data = assemble_bytes(SHADER, SHADER_BOUND)
+    expected = digest.canonical_digest(data, canonical_ids)
+    assert digest.canonical_digest(stripped(data), canonical_ids) == expected
+    assert digest.canonical_digest(swap_bytes(data), canonical_ids) == expected
+
+
+@pytest.mark.parametrize('canonical_ids', [False, True])
+def test_opencl_debug_info_is_ignored(with_numpy, canonical_ids):
+    expected = digest.canonical_digest(assemble_bytes(OPENCL, 14), canonical_ids)
+    assert digest.canonical_digest(assemble_bytes(OPENCL_DEBUG, OPENCL_DEBUG_BOUND),
+                                   canonical_ids) == expected
+
+
+def test_canonical_ids(with_numpy):
+    debug = assemble_bytes(OPENCL_DEBUG, OPENCL_DEBUG_BOUND)
+    compact = assemble_bytes(OPENCL_COMPACT, 6)
+    assert digest.canonical_digest(debug) != digest.canonical_digest(compact)
+    assert digest.canonical_digest(debug, canonical_ids=True) == \
+        digest.canonical_digest(compact, canonical_ids=True)
+
+
+def test_code_changes_change_the_digest(with_numpy):
+    data = assemble_bytes(SHADER, SHADER_BOUND)
+    other = assemble_bytes([inst if inst[0] != 'OpConstant' else inst[:3] + (4,)
+                            for inst in SHADER], SHADER_BOUND)
+    assert digest.canonical_digest(data) != digest.canonical_digest(other)
+    assert digest.canonical_digest(data, algorithm='md5') != digest.canonical_digest(data)
+
+
+def test_64_bit_switch(with_numpy):
+    data = assemble_bytes(SWITCH_64, SWITCH_64_BOUND)
+    assert len(digest.canonical_digest(data, canonical_ids=True)) == 32
+
+
+def test_id_at_bound(with_numpy):
+    with pytest.raises(InvalidBinaryError):
+        digest.canonical_digest(assemble_bytes(SHADER, SHADER_BOUND - 1), canonical_ids=True)
@@ -0,0 +1,147 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Tests of the streaming disassembler"""
+
+import io
+
+import pytest
+
+from spirv_headers.binary import InvalidBinaryError
+from spirv_headers.disassembler import disassemble
+
+from modules import (SHADER, SHADER_BOUND, SWITCH_64, SWITCH_64_BOUND, assemble_bytes,
+                     swap_bytes)
+
+SHADER_TEXT = '''\
+; SPIR-V
+; Version: 1.6
+; Generator: Khronos; 0
+; Bound: 13
+; Schema: 0
+               OpCapability Shader
+               OpMemoryModel Logical GLSL450
+               OpEntryPoint GLCompute %main "main"
+               OpExecutionMode %main LocalSize 1 1 1
+               OpName %main "main"
+               OpName %x "x"
+          %2 = OpTypeVoid
+          %3 = OpTypeFunction %2
+          %4 = OpTypeInt 32 1
+          %6 = OpTypeInt 32 1
+          %7 = OpConstant %4 3
+          %8 = OpConstant %6 3
+       %main = OpFunction %2 None %3
+          %9 = OpLabel
+          %x = OpIAdd %4 %7 %7
+         %10 = OpIAdd %6 %8 %8
+               OpSelectionMerge %11 None
+               OpSwitch %x %11 1 %12 2 %11
+         %12 = OpLabel
+               OpBranch %11
+         %11 = OpLabel
+               OpReturn
+               OpFunctionEnd
+'''
+
+
+def text_of(source, **kwargs):
+    out = io.StringIO()
+    disassemble(source, out, **kwargs)
+    return out.getvalue()
+
+
+def body(text):
+    return [line for line in text.splitlines() if not line.startswith(';')]
+
+
+def test_disassemble():
+    data = assemble_bytes(SHADER, SHADER_BOUND)
+    assert text_of(data, friendly_names=True) == SHADER_TEXT
+    assert text_of(swap_bytes(data), friendly_names=True) == SHADER_TEXT
+    assert text_of(io.BytesIO(data), friendly_names=True) == SHADER_TEXT
+    assert '%1 = OpFunction %2 None %3' in text_of(data)
+
+
+def test_small_batches_and_concatenated_modules():
+    data = assemble_bytes(SHADER, SHADER_BOUND)
+    out = io.StringIO()
+    assert disassemble(io.BytesIO(data * 2), out, batch_lines=3) == 2 * len(SHADER)
+    assert body(out.getvalue()) == body(text_of(data)) * 2
+
+
+def test_constants():
+    data = assemble_bytes([
+        ('OpCapability', 1),
+        ('OpCapability', 22),
+        ('OpCapability', 11),
+        ('OpMemoryModel', 0, 1),
+        ('OpTypeInt', 1, 16, 1),
+        ('OpConstant', 1, 2, 0xfffffffe),
+        ('OpTypeInt', 3, 64, 1),
+        ('OpConstant', 3, 4, 0xfffffffb, 0xffffffff),
+        ('OpTypeFloat', 5, 32),
+        ('OpConstant', 5, 6, 0x3fc00000),
+        ('OpTypeInt', 7, 32, 0),
+        ('OpConstant', 7, 8, 0xffffffff),
+    ], 9)
+    assert body(text_of(data))[4:] == [
+        '          %1 = OpTypeInt 16 1',
+        '          %2 = OpConstant %1 -2',
+        '          %3 = OpTypeInt 64 1',
+        '          %4 = OpConstant %3 -5',
+        '          %5 = OpTypeFloat 32',
+        '          %6 = OpConstant %5 1.5',
+        '          %7 = OpTypeInt 32 0',
+        '          %8 = OpConstant %7 4294967295',
+    ]
+
+
+def test_16_bit_float_with_high_bits():
+    data = assemble_bytes([
+        ('OpCapability', 1),
+        ('OpCapability', 9),
+        ('OpMemoryModel', 0, 1),
+        ('OpTypeFloat', 1, 16),
+        ('OpConstant', 1, 2, 0x13c00),
+        ('OpConstant', 1, 3, 0xffff7e01),
+    ], 4)
+    assert body(text_of(data))[3:] == [
+        '          %1 = OpTypeFloat 16',
+        '          %2 = OpConstant %1 1',
+        '          %3 = OpConstant %1 0x7e01',
+    ]
+
+
+def test_64_bit_switch():
+    text = text_of(assemble_bytes(SWITCH_64, SWITCH_64_BOUND))
+    assert 'OpSwitch %4 %7 1234567890123 %8 5 %7' in text
+
+
+def test_truncated_operands():
+    data = assemble_bytes(SHADER[:6] + [('OpTypeInt', 4)], SHADER_BOUND)
+    with pytest.raises(InvalidBinaryError):
+        text_of(data)
@@ -0,0 +1,73 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Tests of the value to name lookups"""
+
+import pytest
+
+from spirv_headers import enums
+
+
+def test_name_of():
+    assert enums.name_of('Op', 61) == 'OpLoad'
+    assert enums.name_of('BuiltIn', 0) == 'Position'
+    assert enums.name_of('Op', 0xffff) is None
+    assert enums.name_of('Op', 0xffff, default='?') == '?'
+
+
+def test_preferred_spelling_wins_over_aliases():
+    assert enums.name_of('Op', 5632) == 'OpDecorateString'
+
+
+def test_names_is_cached():
+    assert enums.names('Decoration') is enums.names('Decoration')
+
+
+def test_names_rejects_non_enumerations():
+    with pytest.raises(KeyError):
+        enums.names('MagicNumber')
+
+
+def test_all_names():
+    index = enums.all_names()
+    assert index['Op'][17] == 'OpCapability'
+    assert 'MagicNumber' not in index
+
+
+def test_decode_mask():
+    assert enums.decode_mask('MemoryAccess', 0) == []
+    assert enums.decode_mask('MemoryAccessMask', 3) == ['Volatile', 'Aligned']
+    assert enums.decode_mask('FunctionControl', 0x80000001) == ['Inline', '0x80000000']
+
+
+def test_decode_masks():
+    numpy = pytest.importorskip('numpy')
+    names, flags = enums.decode_masks('MemoryAccess', [0, 1, 6])
+    assert names[:3] == ('Volatile', 'Aligned', 'Nontemporal')
+    assert flags.shape == (3, len(names))
+    assert numpy.array_equal(flags[:, :3], [[False, False, False],
+                                            [True, False, False],
+                                            [False, True, True]])
@@ -0,0 +1,86 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Tests of the generated extended instruction set modules"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from spirv_headers.extinst import (EXTINST_GRAMMARS, EXTINST_MODULE_PREFIXES, EXTINST_MODULES,
+                                   extinst_grammar_name, extinst_module_name, load_extinst)
+from spirv_headers.tables import enum_value, header_path, load_grammar
+
+GENERATOR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir,
+                         'buildHeaders', 'bin', 'generate_language_headers.py')
+
+IMPORT_NAMES = sorted(EXTINST_MODULES) + [prefix + '6' for prefix in EXTINST_MODULE_PREFIXES]
+
+
+@pytest.mark.parametrize('import_name', IMPORT_NAMES)
+def test_module_matches_grammar(import_name):
+    module = load_extinst(import_name)
+    grammar = load_grammar(extinst_grammar_name(import_name))
+    instructions = grammar['instructions']
+    assert module.Instructions == {inst['opname']: inst['opcode'] for inst in instructions}
+    assert module.InstructionNames == {inst['opcode']: inst['opname'] for inst in instructions}
+    for inst in instructions:
+        assert module.InstructionOperands[inst['opcode']] == tuple(
+            (operand['kind'], operand.get('quantifier'), operand.get('name'))
+            for operand in inst.get('operands', ()))
+    kinds = grammar.get('operand_kinds', ())
+    assert module.OperandKindCategories == {kind['kind']: kind['category'] for kind in kinds}
+    for kind in kinds:
+        enumerants = {e['enumerant']: enum_value(e['value'])
+                      for e in kind.get('enumerants', ())}
+        assert module.OperandKinds[kind['kind']] == enumerants
+        for name, value in enumerants.items():
+            assert module.OperandKindNames[kind['kind']][value] in enumerants
+
+
+def test_every_grammar_has_a_module():
+    names = set(EXTINST_MODULES.values()) | set(EXTINST_MODULE_PREFIXES.values())
+    assert names == set(EXTINST_GRAMMARS)
+
+
+def test_unknown_sets():
+    assert extinst_module_name('NonSemantic.Unknown') is None
+    assert extinst_grammar_name('NonSemantic.Unknown') is None
+    assert load_extinst('NonSemantic.Unknown') is None
+    assert load_extinst('GLSL.std.450') is load_extinst('GLSL.std.450')
+
+
+@pytest.mark.parametrize('name', sorted(EXTINST_GRAMMARS))
+def test_modules_are_up_to_date(tmp_path, name):
+    subprocess.check_call([sys.executable, GENERATOR,
+                           '--extinst-name=' + name,
+                           '--extinst-grammar=' + header_path(EXTINST_GRAMMARS[name]),
+                           '--extinst-output-base=' + str(tmp_path / name),
+                           '--extinst-language=python'])
+    with open(header_path(name + '.py')) as f:
+        assert (tmp_path / (name + '.py')).read_text() == f.read()
@@ -0,0 +1,126 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Tests of the modules generated from spirv.py"""
+
+import importlib.util
+import keyword
+import os
+import pickle
+
+import pytest
+
+from spirv_headers.tables import header_path, load_module, load_spv
+
+GENERATOR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir,
+                         'buildHeaders', 'bin', 'generate_python_tables.py')
+
+
+def load_generator():
+    spec = importlib.util.spec_from_file_location('generate_python_tables', GENERATOR)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.parametrize('kind, name', [('lazy', 'spirv_lazy'), ('namespace', 'spirv_ns')])
+def test_generated_modules_are_up_to_date(kind, name):
+    generator = load_generator()
+    module, comments = generator.load_spirv_py(header_path('spirv.py'))
+    with open(header_path(name + '.py'), newline='\n') as f:
+        assert generator.GENERATORS[kind](module.spv, comments).generate() == f.read()
+
+
+def lazy_spv():
+    """Returns the spv of a fresh import of spirv_lazy.py, with nothing
+    built yet"""
+    return load_module('spirv_lazy').spv
+
+
+def test_lazy_spv_compares_equal():
+    spv = load_spv()
+    assert lazy_spv() == spv
+    assert not lazy_spv() != spv
+    assert spv == lazy_spv()
+    assert not spv != lazy_spv()
+    other = dict(spv, Version=0)
+    assert lazy_spv() != other
+    assert not lazy_spv() == other
+
+
+def test_lazy_spv_reads_like_spv():
+    spv = load_spv()
+    lazy = lazy_spv()
+    assert len(lazy) == len(spv)
+    assert list(lazy) == list(spv)
+    assert 'Op' in lazy and 'NoSuchCategory' not in lazy
+    assert lazy.get('Op') == spv['Op']
+    assert lazy.get('NoSuchCategory', 1) == 1
+    assert lazy['MagicNumber'] == spv['MagicNumber']
+    assert list(lazy.items()) == list(spv.items())
+    assert lazy.copy() == spv and type(lazy.copy()) is dict
+    with pytest.raises(KeyError):
+        lazy['NoSuchCategory']
+
+
+def test_lazy_spv_pickles_as_dict():
+    copy = pickle.loads(pickle.dumps(lazy_spv()))
+    assert type(copy) is dict
+    assert copy == load_spv()
+
+
+def test_lazy_spv_changes_build_the_tables_first():
+    spv = load_spv()
+    lazy = lazy_spv()
+    assert lazy.pop('Op') == spv['Op']
+    assert 'Op' not in lazy and len(lazy) == len(spv) - 1
+    assert lazy.pop('Op', None) is None
+    assert lazy.get('Op') is None
+
+    lazy = lazy_spv()
+    assert lazy.setdefault('Decoration', {}) == spv['Decoration']
+    assert lazy.setdefault('Extra', 1) == 1
+    assert len(lazy) == len(spv) + 1 and list(lazy)[-1] == 'Extra'
+
+    lazy = lazy_spv()
+    del lazy['Capability']
+    lazy['Extra'] = {}
+    assert set(lazy) == set(spv) - {'Capability'} | {'Extra'}
+    assert lazy['BuiltIn'] == spv['BuiltIn']
+
+
+def test_namespace_matches_spv():
+    ns = load_module('spirv_ns')
+    for category, value in load_spv().items():
+        if not isinstance(value, dict):
+            assert getattr(ns, category) == value
+            continue
+        namespace = getattr(ns, category)
+        for name, token in value.items():
+            assert getattr(namespace, name + '_' if keyword.iskeyword(name) else name) == token
+        assert {name for name in vars(namespace) if not name.startswith('__')} == \
+            {name + '_' if keyword.iskeyword(name) else name for name in value}
+    assert ns.SamplerAddressingMode.None_ == 0
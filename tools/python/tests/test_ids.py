@@ -0,0 +1,113 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Tests of the result id tables"""
+
+import pytest
+
+from spirv_headers.binary import InvalidBinaryError, iter_module
+from spirv_headers.ids import DefinitionTable, DefUse, IdOperands
+from spirv_headers.index import InstructionIndex
+
+from modules import SHADER, SHADER_BOUND, assemble_bytes, swap_bytes
+
+DATA = assemble_bytes(SHADER, SHADER_BOUND)
+OFFSETS = [offset for offset, _, _, _ in iter_module(DATA)]
+OPNAMES = [inst[0] for inst in SHADER]
+
+MALFORMED = [
+    assemble_bytes(SHADER, SHADER_BOUND - 1),
+    DATA[:-8] + DATA[-12:-8],
+]
+MALFORMED_IDS = ['id at bound', 'truncated instruction']
+
+
+def offset_of(opname, nth=0):
+    return [offset for offset, name in zip(OFFSETS, OPNAMES) if name == opname][nth]
+
+
+def test_definition_table():
+    table = DefinitionTable.from_module(DATA)
+    assert len(table) == SHADER_BOUND
+    assert table[1] == offset_of('OpFunction')
+    assert table[5] == offset_of('OpIAdd')
+    assert table.get(0) is None and table.get(-1) is None
+    assert SHADER_BOUND not in table
+    assert list(table.ids()) == list(range(1, SHADER_BOUND))
+    assert DefinitionTable.from_module(swap_bytes(DATA)).offsets == table.offsets
+
+
+def test_definition_table_from_index():
+    pytest.importorskip('numpy')
+    index = InstructionIndex(DATA)
+    assert DefinitionTable.from_index(index).offsets == DefinitionTable.from_module(DATA).offsets
+
+
+@pytest.mark.parametrize('data', MALFORMED, ids=MALFORMED_IDS)
+def test_definition_table_malformed(data):
+    with pytest.raises(InvalidBinaryError):
+        DefinitionTable.from_module(data)
+
+
+def test_definition_table_short_instruction():
+    # The word after OpTypeVoid is below the bound, so reading it as the
+    # result id would go unnoticed.
+    data = assemble_bytes([('OpCapability', 1), ('OpTypeVoid',), ('OpTypeFunction', 3, 2)],
+                          0x40000)
+    with pytest.raises(InvalidBinaryError, match='too short for its result id at word 7'):
+        DefinitionTable.from_module(data)
+    pytest.importorskip('numpy')
+    with pytest.raises(InvalidBinaryError, match='too short for its result id at word 7'):
+        DefinitionTable.from_index(InstructionIndex(data))
+
+
+def test_def_use():
+    def_use = DefUse.from_module(DATA)
+    assert len(def_use) == SHADER_BOUND
+    assert list(def_use.users_of(1)) == [offset_of('OpEntryPoint'), offset_of('OpExecutionMode'),
+                                         offset_of('OpName')]
+    # An instruction using an id twice is listed once.
+    assert list(def_use.users_of(7)) == [offset_of('OpIAdd')]
+    assert list(def_use.users_of(11)) == [offset_of('OpSelectionMerge'), offset_of('OpSwitch'),
+                                          offset_of('OpBranch')]
+    assert def_use.degree(4) == 2
+    assert def_use.degree(-1) == 0 and len(def_use.users_of(SHADER_BOUND)) == 0
+    assert DefUse.from_module(swap_bytes(DATA)).users == def_use.users
+
+
+@pytest.mark.parametrize('data', MALFORMED, ids=MALFORMED_IDS)
+def test_def_use_malformed(data):
+    with pytest.raises(InvalidBinaryError):
+        DefUse.from_module(data)
+
+
+def test_id_operands():
+    id_operands = IdOperands()
+    positions = [list(id_operands.positions(opcode, operands))
+                 for offset, opcode, word_count, operands in iter_module(DATA)]
+    assert positions[OPNAMES.index('OpEntryPoint')] == [1]
+    assert positions[OPNAMES.index('OpIAdd')] == [0, 1, 2, 3]
+    assert positions[OPNAMES.index('OpSwitch')] == [0, 1, 3, 5]
@@ -0,0 +1,170 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Tests of the logical layout sections"""
+
+import io
+
+import pytest
+
+from spirv_headers.binary import iter_module
+from spirv_headers.layout import SECTIONS, find_sections, iter_section, section_offsets
+from spirv_headers.tables import load_spv
+
+from modules import (OPENCL_DEBUG, OPENCL_DEBUG_BOUND, SHADER, SHADER_BOUND,
+                     assemble_bytes)
+
+# Imports one function and calls it from another, defined one.
+DECLARATIONS = [
+    ('OpCapability', 1),
+    ('OpCapability', 5),
+    ('OpMemoryModel', 0, 1),
+    ('OpName', 3, 'f'),
+    ('OpDecorate', 3, 41, 'f', 1),
+    ('OpTypeVoid', 1),
+    ('OpTypeFunction', 2, 1),
+    ('OpFunction', 1, 3, 0, 2),
+    ('OpFunctionEnd',),
+    ('OpFunction', 1, 4, 0, 2),
+    ('OpLabel', 5),
+    ('OpFunctionCall', 1, 6, 3),
+    ('OpReturn',),
+    ('OpFunctionEnd',),
+]
+DECLARATIONS_BOUND = 7
+
+# The sections of each module as [start, end) indexes of its instructions.
+SECTION_INDEXES = {
+    'shader': (SHADER, SHADER_BOUND, {
+        'capabilities': (0, 1), 'extensions': (1, 1), 'ext_inst_imports': (1, 1),
+        'memory_model': (1, 2), 'entry_points': (2, 3), 'execution_modes': (3, 4),
+        'debug': (4, 6), 'annotations': (6, 6), 'globals': (6, 12),
+        'function_declarations': (12, 12), 'function_definitions': (12, 23),
+    }),
+    'opencl_debug': (OPENCL_DEBUG, OPENCL_DEBUG_BOUND, {
+        'capabilities': (0, 2), 'extensions': (2, 2), 'ext_inst_imports': (2, 4),
+        'memory_model': (4, 5), 'entry_points': (5, 6), 'execution_modes': (6, 6),
+        'debug': (6, 11), 'annotations': (11, 11), 'globals': (11, 17),
+        'function_declarations': (17, 17), 'function_definitions': (17, 23),
+    }),
+    'declarations': (DECLARATIONS, DECLARATIONS_BOUND, {
+        'capabilities': (0, 2), 'extensions': (2, 2), 'ext_inst_imports': (2, 2),
+        'memory_model': (2, 3), 'entry_points': (3, 3), 'execution_modes': (3, 3),
+        'debug': (3, 4), 'annotations': (4, 5), 'globals': (5, 7),
+        'function_declarations': (7, 9), 'function_definitions': (9, 14),
+    }),
+}
+
+
+class CountingReader(io.BytesIO):
+    """A binary file object that counts the bytes read from it"""
+
+    def __init__(self, data):
+        super().__init__(data)
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+def expected_sections(name):
+    """Returns the module bytes and the (start, end) word offsets of its
+    sections"""
+    instructions, bound, indexes = SECTION_INDEXES[name]
+    data = assemble_bytes(instructions, bound)
+    starts = [offset for offset, _, _, _ in iter_module(data)] + [len(data) // 4]
+    assert len(starts) == len(instructions) + 1
+    return data, {section: (starts[start], starts[end])
+                  for section, (start, end) in indexes.items()}
+
+
+@pytest.mark.parametrize('name', sorted(SECTION_INDEXES))
+def test_find_sections(name):
+    data, expected = expected_sections(name)
+    assert find_sections(data) == expected
+    assert find_sections(io.BytesIO(data), chunk_words=3) == expected
+    offsets = section_offsets(data)
+    assert {section: (offsets[i], offsets[i + 1])
+            for i, section in enumerate(SECTIONS)} == expected
+
+
+@pytest.mark.parametrize('name', sorted(SECTION_INDEXES))
+@pytest.mark.parametrize('last', SECTIONS)
+def test_find_sections_up_to(name, last):
+    data, expected = expected_sections(name)
+    wanted = {section: expected[section] for section in SECTIONS[:SECTIONS.index(last) + 1]}
+    assert find_sections(data, last) == wanted
+    assert find_sections(io.BytesIO(data), last, chunk_words=5) == wanted
+
+
+@pytest.mark.parametrize('name', sorted(SECTION_INDEXES))
+@pytest.mark.parametrize('section', SECTIONS)
+def test_iter_section(name, section):
+    data, expected = expected_sections(name)
+    start, end = expected[section]
+    offsets = [offset for offset, _, _, _ in iter_module(data) if start <= offset < end]
+    assert [offset for offset, _, _, _ in iter_section(data, section)] == offsets
+    stream = io.BytesIO(data)
+    assert [offset for offset, _, _, _ in iter_section(stream, section, chunk_words=4)] == offsets
+
+
+def test_declarations_stay_separate():
+    data = assemble_bytes(DECLARATIONS, DECLARATIONS_BOUND)
+    ops = load_spv()['Op']
+    declarations = list(iter_section(data, 'function_declarations'))
+    assert [opcode for _, opcode, _, _ in declarations] == [ops['OpFunction'], ops['OpFunctionEnd']]
+    assert declarations[0][3][1] == 3
+    definitions = list(iter_section(data, 'function_definitions'))
+    assert [opcode for _, opcode, _, _ in definitions] == [
+        ops['OpFunction'], ops['OpLabel'], ops['OpFunctionCall'], ops['OpReturn'],
+        ops['OpFunctionEnd']]
+    assert definitions[0][3][1] == 4
+
+
+# SHADER with a thousand more constants, so that its globals and function
+# are far from its start.
+LARGE = SHADER[:12] + [('OpConstant', 4, SHADER_BOUND + i, i) for i in range(1000)] + SHADER[12:]
+LARGE_BOUND = SHADER_BOUND + 1000
+
+
+def test_find_sections_reads_a_prefix():
+    data = assemble_bytes(LARGE, LARGE_BOUND)
+    reader = CountingReader(data)
+    sections = find_sections(reader, 'capabilities', chunk_words=16)
+    assert sections == {'capabilities': (5, 7)}
+    assert reader.bytes_read == 64
+
+
+def test_iter_section_reads_a_prefix():
+    data = assemble_bytes(LARGE, LARGE_BOUND)
+    globals_start = find_sections(data)['globals'][0]
+    reader = CountingReader(data)
+    names = list(iter_section(reader, 'debug', chunk_words=16))
+    assert len(names) == 2
+    assert reader.bytes_read <= 4 * globals_start + 64
+    assert reader.bytes_read < len(data) // 10
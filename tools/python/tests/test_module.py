@@ -0,0 +1,74 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Tests of the memory-mapped module view"""
+
+import pytest
+
+from spirv_headers.binary import InvalidBinaryError
+from spirv_headers.module import Module
+from spirv_headers.tables import load_spv
+
+from modules import SHADER, SHADER_BOUND, assemble_bytes
+
+OPS = load_spv()['Op']
+
+
+def write(tmp_path, data):
+    path = tmp_path / 'module.spv'
+    path.write_bytes(data)
+    return str(path)
+
+
+def test_open(tmp_path):
+    path = write(tmp_path, assemble_bytes(SHADER, SHADER_BOUND))
+    with Module.open(path) as module:
+        assert module.version == (1, 6)
+        assert module.bound == SHADER_BOUND
+        assert not module.byteswapped
+        offsets = [offset for offset, _, _, _ in module.instructions()]
+        assert len(offsets) == len(SHADER)
+        opcode, word_count, operands = module.instruction(offsets[-1])
+        assert (opcode, word_count, len(operands)) == (OPS['OpFunctionEnd'], 1, 0)
+        del operands
+
+
+@pytest.mark.parametrize('data', [
+    b'',
+    b'\0\0\0\0' * 5,
+    assemble_bytes(SHADER, SHADER_BOUND)[:12],
+    assemble_bytes(SHADER, SHADER_BOUND) + b'\0\0',
+    assemble_bytes(SHADER, SHADER_BOUND)[:-1],
+], ids=['empty', 'bad magic', 'truncated header', 'size + 2', 'size - 1'])
+def test_open_invalid(tmp_path, data):
+    with pytest.raises(InvalidBinaryError):
+        Module.open(write(tmp_path, data))
+
+
+def test_instruction_checks_its_offset():
+    module = Module(assemble_bytes(SHADER, SHADER_BOUND))
+    with pytest.raises(InvalidBinaryError):
+        module.instruction(3)     # The Bound word of the header
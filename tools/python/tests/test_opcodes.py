@@ -0,0 +1,66 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Tests of the opcode tables"""
+
+import pytest
+
+from spirv_headers.grammar import instructions
+from spirv_headers.opcodes import OpcodeTable, opcode_table
+from spirv_headers.tables import VERSIONS, load_spv
+
+
+@pytest.mark.parametrize('version', VERSIONS)
+def test_every_opcode_round_trips(version):
+    table = opcode_table(version)
+    ops = load_spv(version)['Op']
+    for name, opcode in ops.items():
+        info = table[opcode]
+        assert info.opcode == opcode
+        assert ops.get(info.opname, opcode) == opcode
+    assert len(table) == len(set(ops.values()))
+    assert [info.opcode for info in table] == sorted(set(ops.values()))
+
+
+def test_unknown_opcodes():
+    table = opcode_table()
+    for opcode in (-1, 0xfffe, 1 << 20):
+        assert table.get(opcode) is None
+        assert table.get(opcode, 'none') == 'none'
+        assert opcode not in table
+        with pytest.raises(KeyError):
+            table[opcode]
+
+
+def test_sparse_opcodes():
+    entries = {inst.opcode: inst for inst in instructions()}
+    table = OpcodeTable(entries, max_gap=64)
+    assert table.sparse and len(table.dense) < max(entries)
+    assert len(table) == len(entries)
+    assert [info.opcode for info in table] == sorted(entries)
+    for opcode, inst in entries.items():
+        assert table[opcode] is inst
+    assert table.get(len(table.dense)) is None
@@ -0,0 +1,88 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Tests of the multi-version enum registry"""
+
+import pytest
+
+from spirv_headers.registry import EnumRegistry, encode_version, enum_registry
+from spirv_headers.tables import DEFAULT_VERSION, VERSIONS, load_spv
+
+
+@pytest.fixture(scope='module')
+def registry():
+    return enum_registry()
+
+
+def test_encode_version():
+    assert encode_version('1.3') == 0x10300
+    assert encode_version(0x10600) == 0x10600
+
+
+def test_constants_come_from_the_newest_header(registry):
+    spv = load_spv(DEFAULT_VERSION)
+    assert registry.constants == {name: value for name, value in spv.items()
+                                  if not isinstance(value, dict)}
+    assert registry.constants['Version'] != load_spv('1.0')['Version']
+
+
+@pytest.mark.parametrize('header', VERSIONS)
+def test_tokens_of_each_header(registry, header):
+    for category, table in load_spv(header).items():
+        if isinstance(table, dict):
+            assert list(registry.tokens(category, header=header).items()) == \
+                list(table.items())
+
+
+def test_is_valid(registry):
+    assert not registry.is_valid('StorageClass', 'StorageBuffer', '1.2')
+    assert registry.is_valid('StorageClass', 'StorageBuffer', '1.3')
+    assert registry.is_valid('StorageClass', 'StorageBuffer', 0x10600)
+    # Removed from the core after 1.3.
+    assert registry.is_valid('Decoration', 'BufferBlock', '1.0')
+    assert registry.is_valid('Decoration', 'BufferBlock', '1.3')
+    assert not registry.is_valid('Decoration', 'BufferBlock', '1.4')
+    # Only available through an extension.
+    assert not registry.is_valid('Op', 'OpSubgroupBallotKHR', '1.6')
+    assert not registry.is_valid('Op', 'OpNoSuchThing', '1.0')
+    with pytest.raises(KeyError):
+        registry.is_valid('NoSuchCategory', 'Foo', '1.0')
+
+
+def test_tokens_by_version(registry):
+    tokens = registry.tokens('StorageClass', version='1.2')
+    assert 'Uniform' in tokens and 'StorageBuffer' not in tokens
+    assert 'StorageBuffer' in registry.tokens('StorageClass', version='1.3')
+
+
+def test_token(registry):
+    token = registry.token('Decoration', 'BufferBlock')
+    assert token.value == load_spv()['Decoration']['BufferBlock']
+    assert (token.first_version, token.last_version) == (0x10000, 0x10300)
+    assert token.headers == frozenset(VERSIONS)
+    assert registry.value('Op', 'OpLoad') == 61
+    assert enum_registry() is registry
+    assert isinstance(registry, EnumRegistry)
@@ -0,0 +1,130 @@
+# Copyright (c) 2026 The Khronos Group Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and/or associated documentation files (the
+# "Materials"), to deal in the Materials without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Materials, and to
+# permit persons to whom the Materials are furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Materials.
+#
+# MODIFICATIONS TO THIS FILE MAY MEAN IT NO LONGER ACCURATELY REFLECTS
+# KHRONOS STANDARDS. THE UNMODIFIED, NORMATIVE VERSIONS OF KHRONOS
+# SPECIFICATIONS AND HEADER INFORMATION ARE LOCATED AT
+#    https://www.khronos.org/registry/
+#
+# THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+"""Tests of the persistent sidecar indexes"""
+
+import pytest
+
+from spirv_headers.binary import InvalidBinaryError, iter_module
+from spirv_headers import sidecar
+from spirv_headers.sidecar import (SidecarIndex, build_sidecar, grammar_digest, load_sidecar,
+                                   module_digest, sidecar_path)
+
+from modules import SHADER, SHADER_BOUND, assemble_bytes
+
+DATA = assemble_bytes(SHADER, SHADER_BOUND)
+
+
+def write_module(tmp_path, data=DATA):
+    path = tmp_path / 'module.spv'
+    path.write_bytes(data)
+    return str(path)
+
+
+def test_build_and_load(tmp_path):
+    path = write_module(tmp_path)
+    cache_dir = str(tmp_path / 'cache')
+    with load_sidecar(path, cache_dir=cache_dir) as index:
+        assert index.digest == module_digest(DATA)
+        assert index.size == len(DATA)
+        assert index.bound == SHADER_BOUND
+        assert list(index.offsets) == [offset for offset, _, _, _ in iter_module(DATA)]
+        assert len(index.functions) == 1
+        assert index.definition(5) == index.offsets[[i[0] for i in SHADER].index('OpIAdd')]
+        assert index.definition(0) is None
+        assert index.definition(-1) is None
+        assert index.definition(SHADER_BOUND) is None
+        start, end = index.section('function_definitions')
+        assert start == index.functions[0] and end == len(DATA) // 4
+    # The second load uses the saved file.
+    with load_sidecar(path, cache_dir=cache_dir) as index:
+        assert index.bound == SHADER_BOUND
+
+
+@pytest.mark.parametrize('damage', [
+    lambda data: b'NOTINDEX' + data[8:],
+    lambda data: data[:-2],
+    lambda data: data[:-4],
+    lambda data: data[:10],
+], ids=['wrong magic', 'size - 2', 'size - 4', 'truncated header'])
+def test_corrupt_sidecar_is_rebuilt(tmp_path, damage):
+    path = write_module(tmp_path)
+    cache_dir = str(tmp_path / 'cache')
+    index_path = tmp_path / 'cache' / (module_digest(DATA).hex() + '-unified1.spvidx')
+    assert str(index_path) == sidecar_path(module_digest(DATA), cache_dir)
+    good = build_sidecar(DATA)
+    (tmp_path / 'cache').mkdir()
+    index_path.write_bytes(damage(good))
+    with pytest.raises(InvalidBinaryError):
+        SidecarIndex.open(str(index_path))
+    load_sidecar(path, cache_dir=cache_dir).close()
+    assert index_path.read_bytes() == good
+
+
+def test_stale_sidecar_is_rebuilt(tmp_path):
+    path = write_module(tmp_path)
+    cache_dir = str(tmp_path / 'cache')
+    other = assemble_bytes(SHADER[:-3] + SHADER[-2:], SHADER_BOUND)
+    (tmp_path / 'cache').mkdir()
+    with open(sidecar_path(module_digest(DATA), cache_dir), 'wb') as f:
+        f.write(build_sidecar(other))
+    with load_sidecar(path, cache_dir=cache_dir) as index:
+        assert index.digest == module_digest(DATA)
+
+
+def test_sidecar_of_other_grammar_is_rebuilt(tmp_path, monkeypatch):
+    path = write_module(tmp_path)
+    cache_dir = str(tmp_path / 'cache')
+    with load_sidecar(path, cache_dir=cache_dir) as index:
+        assert index.grammar_digest == grammar_digest()
+    monkeypatch.setitem(sidecar._grammar_digests, 'unified1', bytes(32))
+    with load_sidecar(path, cache_dir=cache_dir) as index:
+        assert index.grammar_digest == bytes(32)
+
+
+def test_versions_have_separate_sidecars(tmp_path):
+    path = write_module(tmp_path)
+    cache_dir = str(tmp_path / 'cache')
+    load_sidecar(path, cache_dir=cache_dir).close()
+    with load_sidecar(path, '1.0', cache_dir) as index:
+        assert index.grammar_digest == grammar_digest('1.0') != grammar_digest()
+    digest = module_digest(DATA)
+    assert sidecar_path(digest, cache_dir) != sidecar_path(digest, cache_dir, '1.0')
+    with SidecarIndex.open(sidecar_path(digest, cache_dir)) as index:
+        assert index.grammar_digest == grammar_digest()
+
+
+@pytest.mark.parametrize('data', [
+    assemble_bytes(SHADER, SHADER_BOUND - 1),
+    DATA[:-8] + DATA[-12:-8],
+    b'\0\0\0\0' + DATA[4:],
+    assemble_bytes([('OpCapability', 1), ('OpTypeVoid',)], SHADER_BOUND),
+    assemble_bytes([('OpCapability', 1), ('OpConstant', 4)], SHADER_BOUND),
+], ids=['id at bound', 'truncated instruction', 'bad magic', 'no result id',
+        'no result id after the type'])
+def test_malformed_module(tmp_path, data):
+    with pytest.raises(InvalidBinaryError):
+        load_sidecar(write_module(tmp_path, data), cache_dir=str(tmp_path / 'cache'))